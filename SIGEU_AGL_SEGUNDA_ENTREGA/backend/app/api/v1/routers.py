@@ -0,0 +1,85 @@
+# app/api/v1/routers.py
+"""
+Registro de los routers de la API en la app.
+
+Con `arranque_perezoso` los routers de uso ocasional no se importan al arrancar
+(ni sus esquemas, servicios y modelos): en su lugar queda una ruta que cubre el
+prefijo y, en la primera petición, importa el módulo, pone sus rutas en ese
+mismo lugar de la tabla y vuelve a despachar. /docs y /openapi.json los cargan
+todos antes de armar el esquema.
+"""
+import importlib
+from typing import Any, Optional, Tuple
+
+from fastapi import FastAPI
+from starlette._utils import get_route_path
+from starlette.routing import BaseRoute, Match, NoMatchFound
+from starlette.types import Receive, Scope, Send
+
+# (módulo, prefijo si puede diferirse), en el orden en que se registran
+ROUTERS: Tuple[Tuple[str, Optional[str]], ...] = (
+    ("app.api.v1.routes.eventos", None),
+    ("app.api.v1.routes.instalaciones", None),
+    ("app.api.v1.routes.reportes", "/api/v1/reportes"),
+    ("app.api.v1.routes.busqueda", "/api/v1/busqueda"),
+    ("app.api.v1.routes.kpis", "/api/v1/kpis"),
+    ("app.api.v1.routes.evaluaciones", "/api/v1/evaluaciones"),
+    ("app.api.v1.routes.notificaciones", "/api/v1/notificaciones"),
+    ("app.api.v1.routes.metricas", None),
+    ("app.api.v1.routes.salud", None),
+)
+
+
+class RouterPerezoso(BaseRoute):
+    def __init__(self, app: FastAPI, modulo: str, prefijo: str) -> None:
+        self.app = app
+        self.modulo = modulo
+        self.prefijo = prefijo
+
+    def matches(self, scope: Scope) -> Tuple[Match, Scope]:
+        if scope["type"] == "http":
+            ruta = get_route_path(scope)
+            if ruta == self.prefijo or ruta.startswith(self.prefijo + "/"):
+                return Match.FULL, {}
+        return Match.NONE, {}
+
+    def url_path_for(self, name: str, /, **path_params: Any):
+        raise NoMatchFound(name, path_params)
+
+    def cargar(self) -> None:
+        rutas = self.app.router.routes
+        if self not in rutas:
+            return  # otra petición ya lo cargó
+        n = len(rutas)
+        self.app.include_router(importlib.import_module(self.modulo).router)
+        nuevas = rutas[n:]
+        del rutas[n:]
+        i = rutas.index(self)
+        rutas[i:i + 1] = nuevas
+        self.app.openapi_schema = None
+
+    async def handle(self, scope: Scope, receive: Receive, send: Send) -> None:
+        self.cargar()
+        await self.app.router(scope, receive, send)
+
+
+def incluir_routers(app: FastAPI, perezoso: bool = False) -> None:
+    for modulo, prefijo in ROUTERS:
+        if perezoso and prefijo:
+            app.router.routes.append(RouterPerezoso(app, modulo, prefijo))
+        else:
+            app.include_router(importlib.import_module(modulo).router)
+
+    if perezoso:
+        generar = app.openapi
+
+        def openapi() -> dict:
+            cargar_todos(app)
+            return generar()
+
+        app.openapi = openapi
+
+
+def cargar_todos(app: FastAPI) -> None:
+    for ruta in [r for r in app.router.routes if isinstance(r, RouterPerezoso)]:
+        ruta.cargar()
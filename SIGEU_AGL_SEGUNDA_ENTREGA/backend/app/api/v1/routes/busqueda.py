@@ -0,0 +1,24 @@
+# app/api/v1/routes/busqueda.py
+from typing import Annotated
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db import get_read_session
+from app.schemas.evento import BusquedaEventos, ResultadoBusqueda
+from app.services import busqueda as svc
+
+router = APIRouter(prefix="/api/v1/busqueda", tags=["busqueda"])
+
+
+@router.get("/eventos", response_model=ResultadoBusqueda, summary="Buscar Eventos por Texto")
+async def buscar_eventos(
+    params: Annotated[BusquedaEventos, Query()],
+    session: AsyncSession = Depends(get_read_session),
+):
+    """
+    Busca en nombre y descripción sin distinguir tildes ni mayúsculas. Deben
+    aparecer todos los términos; el último vale como prefijo (`robo` encuentra
+    "Robótica"). Resultados por relevancia (el nombre pesa más), paginados con
+    `cursor` = `next_cursor` de la página anterior.
+    """
+    return await svc.buscar(session, params)
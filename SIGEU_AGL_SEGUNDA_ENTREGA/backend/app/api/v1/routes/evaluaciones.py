@@ -0,0 +1,24 @@
+# app/api/v1/routes/evaluaciones.py
+from fastapi import APIRouter, Depends
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db import get_write_session
+from app.schemas.evaluacion import LoteVeredictos, ResultadoVeredictos
+from app.services import evaluacion as svc
+
+router = APIRouter(prefix="/api/v1/evaluaciones", tags=["evaluaciones"])
+
+
+@router.post("/batch", response_model=ResultadoVeredictos, summary="Registrar Veredictos por Lote")
+async def registrar_veredictos(
+    lote: LoteVeredictos,
+    session: AsyncSession = Depends(get_write_session),
+):
+    """
+    Registra muchas evaluaciones en una transacción. Cada veredicto actualiza
+    `evento.estado` (si hay varios para el mismo evento gana el último) y genera
+    una notificación al organizador, como hacía `trg_eval_after_insert`, pero
+    con sentencias por lote en lugar de dos por fila. Los veredictos sobre
+    eventos inexistentes vuelven en `errores` con código 404.
+    """
+    return await svc.aplicar_lote(session, lote)
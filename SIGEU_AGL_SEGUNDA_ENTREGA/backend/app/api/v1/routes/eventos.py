@@ -1,10 +1,16 @@
 # app/api/v1/routes/eventos.py
-from fastapi import APIRouter, Depends, status, Response
+from typing import Annotated, Literal, Optional
+from fastapi import APIRouter, Depends, Header, Query, Request, status, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.db import get_session
-from app.schemas.evento import EventoCrear, EventoActualizar, EventoOut
+from app.db import get_read_session, get_write_session
+from app.schemas.evento import (
+    DetallesPorId, EventoCrear, EventoActualizar, EventoDetalle, EventoOut, EventoPagina, EventosPorId,
+    LoteIds, LoteIdsQuery, PaginaEventos, ResultadoCarga,
+)
 from app.services import evento as svc
+from app.services import carga as svc_carga
+from app.services.cache import cache_eventos, etag_coincide, etag_version
 
 router = APIRouter(prefix="/api/v1", tags=["default"])
 
@@ -20,13 +26,51 @@ router = APIRouter(prefix="/api/v1", tags=["default"])
 )
 async def crear_evento(
     payload: EventoCrear,
-    session: AsyncSession = Depends(get_session),
+    response: Response,
+    session: AsyncSession = Depends(get_write_session),
 ):
     """
     Crea un evento. Acepta campos en camelCase (por ejemplo: `fechaInicio`), gracias
-    a los alias del schema. Devuelve el `EventoOut` recién creado.
+    a los alias del schema. Devuelve el `EventoOut` recién creado y su `ETag`.
     """
-    return await svc.crear(session, payload)
+    obj = await svc.crear(session, payload)
+    response.headers["ETag"] = etag_version(obj.version)
+    return obj
+
+
+# ---------------------------------
+# POST /api/v1/bulk  -> Carga masiva
+# ---------------------------------
+@router.post(
+    "/bulk",
+    response_model=ResultadoCarga,
+    summary="Carga Masiva de Eventos",
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {
+                "application/x-ndjson": {"schema": {"type": "string"}},
+                "text/csv": {"schema": {"type": "string"}},
+            },
+        }
+    },
+)
+async def cargar_eventos(
+    request: Request,
+    formato: Optional[Literal["ndjson", "csv"]] = Query(
+        None, description="por defecto se deduce del Content-Type"
+    ),
+    session: AsyncSession = Depends(get_write_session),
+):
+    """
+    Crea muchos eventos en una sola transacción. El cuerpo se lee en streaming:
+    NDJSON (un `EventoCrear` por línea) o CSV con encabezado. Las filas inválidas,
+    con solapamiento o rechazadas por la BD (FK/CHECK) se devuelven en `errores`
+    y no impiden insertar las demás.
+    """
+    formato = formato or svc_carga.formato_de(request.headers.get("content-type"))
+    lector = svc_carga.registros_csv if formato == "csv" else svc_carga.registros_ndjson
+    return await svc_carga.cargar(session, lector(request.stream()))
 
 
 # ---------------------------
@@ -34,16 +78,80 @@ async def crear_evento(
 # ---------------------------
 @router.get(
     "/",
-    response_model=list[EventoOut],
+    response_model=EventoPagina,
     summary="Listar Eventos",
 )
 async def listar_eventos(
-    session: AsyncSession = Depends(get_session),
+    pagina: Annotated[PaginaEventos, Query()],
+    session: AsyncSession = Depends(get_read_session),
+):
+    """
+    Lista los eventos por páginas de `limit` registros, ordenados por `idEvento`
+    (`orden=id`) o por `fechaInicio` (`orden=fecha`), ambos descendentes.
+    Filtros opcionales: `q`, `categoria`, `estado`, `fecha_ini`, `fecha_fin`.
+    Para la siguiente página se envía el `next_cursor` recibido como `cursor`;
+    llega `null` cuando no hay más resultados.
+    """
+    return Response(content=await svc.listar(session, pagina), media_type="application/json")
+
+
+# ----------------------------------------------
+# GET/POST /api/v1/batch -> Varios eventos por id
+# (antes de /{id_evento}: "batch" no es un id)
+# ----------------------------------------------
+@router.get(
+    "/batch",
+    response_model=EventosPorId,
+    summary="Obtener Varios Eventos",
+)
+async def obtener_eventos_lote(
+    lote: Annotated[LoteIdsQuery, Query()],
+    session: AsyncSession = Depends(get_read_session),
+):
+    """
+    Devuelve los eventos de `ids` (separados por coma, hasta 200) en el orden
+    pedido, en una sola consulta. Los que están en la cache de
+    `GET /api/v1/{id_evento}` no van a la BD. Los ids inexistentes se listan en
+    `faltantes`.
+    """
+    return Response(content=await svc.obtener_lote(session, lote.ids), media_type="application/json")
+
+
+@router.post(
+    "/batch",
+    response_model=EventosPorId,
+    summary="Obtener Varios Eventos (lista larga)",
+)
+async def obtener_eventos_lote_post(
+    lote: LoteIds,
+    session: AsyncSession = Depends(get_read_session),
 ):
     """
-    Lista los eventos ordenados por `idEvento` descendente.
+    Igual que `GET /api/v1/batch` con los ids en el cuerpo (`{"ids": [...]}`,
+    hasta 2000). No modifica nada.
     """
-    return await svc.listar(session)
+    return Response(content=await svc.obtener_lote(session, lote.ids), media_type="application/json")
+
+
+# ------------------------------------------------------
+# GET /api/v1/detalle -> Varios eventos con sus relaciones
+# (antes de /{id_evento}, igual que /batch)
+# ------------------------------------------------------
+@router.get(
+    "/detalle",
+    response_model=DetallesPorId,
+    summary="Obtener Detalle de Varios Eventos",
+)
+async def obtener_detalles_eventos(
+    lote: Annotated[LoteIdsQuery, Query()],
+    session: AsyncSession = Depends(get_read_session),
+):
+    """
+    Como `GET /api/v1/{id_evento}/detalle` para `ids` (separados por coma, hasta
+    200), en el orden pedido. Se resuelve con las mismas 5 consultas sin importar
+    cuántos ids se pidan. Los ids inexistentes se listan en `faltantes`.
+    """
+    return Response(content=await svc.obtener_detalles(session, lote.ids), media_type="application/json")
 
 
 # ----------------------------------
@@ -56,12 +164,53 @@ async def listar_eventos(
 )
 async def obtener_evento(
     id_evento: int,
-    session: AsyncSession = Depends(get_session),
+    if_none_match: Optional[str] = Header(None),
+    session: AsyncSession = Depends(get_read_session),
+):
+    """
+    Obtiene un evento por su identificador. La respuesta sale de la cache de
+    eventos cuando está disponible e incluye `ETag`; si el cliente envía
+    `If-None-Match` con ese valor se responde 304 sin cuerpo.
+    """
+    entrada = await svc.obtener_serializado(session, id_evento)
+    headers = {"ETag": entrada.etag}
+    if etag_coincide(if_none_match, entrada.etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(content=entrada.cuerpo, media_type="application/json", headers=headers)
+
+
+# --------------------------------------------------------
+# GET /api/v1/{id_evento}/detalle -> Evento con relaciones
+# --------------------------------------------------------
+@router.get(
+    "/{id_evento}/detalle",
+    response_model=EventoDetalle,
+    summary="Obtener Detalle de Evento",
+)
+async def obtener_detalle_evento(
+    id_evento: int,
+    session: AsyncSession = Depends(get_read_session),
 ):
     """
-    Obtiene un evento por su identificador.
+    El evento con su organizador, su instalación principal, las instalaciones
+    adicionales, las organizaciones externas, los participantes (usuarioEvento)
+    y sus evaluaciones, en una sola respuesta.
     """
-    return await svc.obtener(session, id_evento)
+    return Response(content=await svc.obtener_detalle(session, id_evento), media_type="application/json")
+
+
+# ---------------------------------------------------
+# GET /api/v1/cache/estadisticas -> Contadores de cache
+# ---------------------------------------------------
+@router.get(
+    "/cache/estadisticas",
+    summary="Estadísticas de la Cache de Eventos",
+)
+async def estadisticas_cache():
+    """
+    Aciertos, fallos y desalojos de la cache de `GET /api/v1/{id_evento}`.
+    """
+    return cache_eventos.estadisticas()
 
 
 # -------------------------------------
@@ -75,13 +224,21 @@ async def obtener_evento(
 async def actualizar_evento(
     id_evento: int,
     payload: EventoActualizar,
-    session: AsyncSession = Depends(get_session),
+    response: Response,
+    if_match: Optional[str] = Header(None),
+    session: AsyncSession = Depends(get_write_session),
 ):
     """
     Actualiza campos del evento. Acepta parches parciales; solo se
     aplican los campos enviados.
+
+    Con `If-Match` (el `ETag` de `GET /api/v1/{id_evento}`) el cambio se aplica
+    solo si el evento sigue en esa versión; si otro cliente lo modificó antes
+    se responde 412 con el `ETag` vigente. La respuesta trae el `ETag` nuevo.
     """
-    return await svc.actualizar(session, id_evento, payload)
+    obj = await svc.actualizar(session, id_evento, payload, if_match)
+    response.headers["ETag"] = etag_version(obj.version)
+    return obj
 
 
 # ------------------------------------
@@ -94,7 +251,7 @@ async def actualizar_evento(
 )
 async def eliminar_evento(
     id_evento: int,
-    session: AsyncSession = Depends(get_session),
+    session: AsyncSession = Depends(get_write_session),
 ):
     """
     Elimina un evento. Devuelve 204 si la operación fue exitosa.
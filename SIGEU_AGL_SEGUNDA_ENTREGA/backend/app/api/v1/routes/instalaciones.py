@@ -0,0 +1,97 @@
+# app/api/v1/routes/instalaciones.py
+from datetime import datetime
+from typing import Annotated, Optional
+from fastapi import APIRouter, Depends, Query, Response
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db import get_session
+from app.schemas.instalacion import (
+    ConflictoOut, FiltrosDisponibles, FiltrosHuecos, FiltrosOcupacion, HuecoOut, InstalacionOut, OcupacionMes,
+)
+from app.services import instalacion as svc
+
+router = APIRouter(prefix="/api/v1/instalaciones", tags=["instalaciones"])
+
+# Todo sale de la agenda en memoria: get_session (primaria, sin conexión hasta usarla),
+# no get_read_session, que toma una conexión de la réplica en cada petición.
+
+
+# ------------------------------------------------------------
+# GET /api/v1/instalaciones/{id_instalacion}/conflictos
+# ------------------------------------------------------------
+@router.get(
+    "/{id_instalacion}/conflictos",
+    response_model=list[ConflictoOut],
+    summary="Conflictos de una Instalación",
+)
+async def conflictos_instalacion(
+    id_instalacion: int,
+    desde: Optional[datetime] = Query(None, description="solo choques que terminan después de esta fecha"),
+    hasta: Optional[datetime] = Query(None, description="solo choques que empiezan antes de esta fecha"),
+    session: AsyncSession = Depends(get_session),
+):
+    """
+    Pares de eventos vigentes (no rechazados) que se solapan en la instalación,
+    incluyendo la instalación por defecto y las adicionales (`eventoInstalacion`).
+    Se calcula sobre la agenda en memoria, sin el self-join de la Consulta 08.
+    404 si la instalación no existe.
+    """
+    return await svc.conflictos(session, id_instalacion, desde, hasta)
+
+
+# ------------------------------------------------------------
+# GET /api/v1/instalaciones/disponibles
+# ------------------------------------------------------------
+@router.get(
+    "/disponibles",
+    response_model=list[InstalacionOut],
+    summary="Instalaciones libres en un horario",
+)
+async def instalaciones_disponibles(
+    filtros: Annotated[FiltrosDisponibles, Query()],
+    session: AsyncSession = Depends(get_session),
+):
+    """
+    Instalaciones sin eventos vigentes que se solapen con [desde, hasta)
+    (por defecto o adicionales), filtradas por capacidad mínima y tipo,
+    de menor a mayor capacidad. Se responde desde la agenda en memoria.
+    """
+    return await svc.disponibles(session, filtros)
+
+
+# ------------------------------------------------------------
+# GET /api/v1/instalaciones/ocupacion?mes=YYYY-MM
+# ------------------------------------------------------------
+@router.get(
+    "/ocupacion",
+    response_model=OcupacionMes,
+    summary="Calendario de ocupación del mes",
+)
+async def ocupacion_instalaciones(
+    filtros: Annotated[FiltrosOcupacion, Query()],
+    session: AsyncSession = Depends(get_session),
+):
+    """
+    Por cada instalación, los días del mes con eventos vigentes (por defecto o
+    adicionales): minutos reservados, número de eventos y el mapa de bits de
+    franjas de `minutosFranja` minutos ocupadas. Se lee del calendario en
+    memoria que se actualiza con cada escritura de eventos, sin agregar en la BD.
+    """
+    return Response(content=await svc.ocupacion(session, filtros), media_type="application/json")
+
+
+# ------------------------------------------------------------
+# GET /api/v1/instalaciones/{id_instalacion}/huecos
+# ------------------------------------------------------------
+@router.get(
+    "/{id_instalacion}/huecos",
+    response_model=list[HuecoOut],
+    summary="Huecos libres de una Instalación",
+)
+async def huecos_instalacion(
+    id_instalacion: int,
+    filtros: Annotated[FiltrosHuecos, Query()],
+    session: AsyncSession = Depends(get_session),
+):
+    """Ventanas sin reservas dentro de [desde, hasta), en orden cronológico."""
+    return await svc.huecos(session, id_instalacion, filtros)
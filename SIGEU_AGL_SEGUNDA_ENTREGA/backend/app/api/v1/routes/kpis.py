@@ -0,0 +1,85 @@
+# app/api/v1/routes/kpis.py
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db import get_session, get_write_session
+from app.schemas.kpi import (
+    AprobacionGlobal, AprobacionOrganizador, AprobacionCategoria, BacklogAntiguedad,
+    HorasInstalacion, SerieMensual, ResultadoReconstruccion,
+)
+from app.services.kpi import kpis, reconstruir
+
+router = APIRouter(prefix="/api/v1/kpis", tags=["kpis"])
+
+
+# Todos los GET leen agregados en memoria; la BD solo se consulta en la primera carga.
+# get_session (primaria, sin conexión hasta usarla): la carga se hace desde la primaria igual.
+
+@router.get("/aprobacion", response_model=AprobacionGlobal, summary="Tasa de Aprobación Global")
+async def aprobacion_global(session: AsyncSession = Depends(get_session)):
+    """Consulta 03: aprobados, evaluados, tasa y pendientes."""
+    await kpis.asegurar_cargado(session)
+    return kpis.aprobacion_global()
+
+
+@router.get(
+    "/aprobacion/organizadores",
+    response_model=list[AprobacionOrganizador],
+    summary="Tasa de Aprobación por Organizador",
+)
+async def aprobacion_por_organizador(session: AsyncSession = Depends(get_session)):
+    """Consulta 05: evaluaciones aprobadas/total por organizador."""
+    await kpis.asegurar_cargado(session)
+    return kpis.aprobacion_por_organizador()
+
+
+@router.get(
+    "/aprobacion/categorias",
+    response_model=list[AprobacionCategoria],
+    summary="Tasa de Aprobación por Categoría",
+)
+async def aprobacion_por_categoria(session: AsyncSession = Depends(get_session)):
+    """Consulta 06: evaluaciones aprobadas/total por categoría."""
+    await kpis.asegurar_cargado(session)
+    return kpis.aprobacion_por_categoria()
+
+
+@router.get("/backlog", response_model=BacklogAntiguedad, summary="Backlog por Antigüedad")
+async def backlog(session: AsyncSession = Depends(get_session)):
+    """Consulta 07: pendientes agrupados por días desde su registro."""
+    await kpis.asegurar_cargado(session)
+    return kpis.backlog()
+
+
+@router.get(
+    "/instalaciones/horas-30d",
+    response_model=list[HorasInstalacion],
+    summary="Horas Reservadas por Instalación (30 días)",
+)
+async def horas_instalacion_30d(session: AsyncSession = Depends(get_session)):
+    """Consulta 02 / `fn_horas_instalacion_30d` para todas las instalaciones."""
+    await kpis.asegurar_cargado(session)
+    return kpis.horas_instalacion_30d()
+
+
+@router.get("/mensual", response_model=list[SerieMensual], summary="Eventos por Mes y Categoría")
+async def serie_mensual(
+    meses: int = Query(12, ge=1, le=120),
+    session: AsyncSession = Depends(get_session),
+):
+    """Consulta 12: serie mensual por categoría de los últimos `meses` meses."""
+    await kpis.asegurar_cargado(session)
+    return kpis.serie_mensual(meses)
+
+
+@router.post(
+    "/reconstruir",
+    response_model=ResultadoReconstruccion,
+    summary="Reconstruir Indicadores",
+)
+async def reconstruir_kpis(session: AsyncSession = Depends(get_write_session)):
+    """
+    Recalcula todos los agregados desde la BD y los reemplaza. Sirve como
+    verificación: `consistente=false` indica qué indicadores se habían desviado.
+    """
+    return await reconstruir(session)
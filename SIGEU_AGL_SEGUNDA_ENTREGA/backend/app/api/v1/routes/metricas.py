@@ -0,0 +1,18 @@
+# app/api/v1/routes/metricas.py
+from typing import Any, Dict, List
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+
+from app.core import metricas
+
+router = APIRouter(tags=["metricas"])
+
+
+@router.get("/metrics", response_class=PlainTextResponse, summary="Métricas (formato Prometheus)")
+async def exponer_metricas():
+    return PlainTextResponse(metricas.exponer(), media_type="text/plain; version=0.0.4; charset=utf-8")
+
+
+@router.get("/metrics/sql-lentas", summary="Últimas sentencias SQL por encima del umbral")
+async def sentencias_lentas() -> List[Dict[str, Any]]:
+    return list(metricas.muestras_lentas)
@@ -0,0 +1,16 @@
+# app/api/v1/routes/notificaciones.py
+from typing import Any, Dict
+from fastapi import APIRouter
+
+from app.services.notificaciones import despachador
+
+router = APIRouter(prefix="/api/v1/notificaciones", tags=["notificaciones"])
+
+
+@router.get("/despacho", summary="Estado del Despacho de Notificaciones")
+async def estado_despacho() -> Dict[str, Any]:
+    """
+    Notificaciones en curso, retraso de la más vieja, enviadas por segundo
+    desde el arranque y las últimas descartadas tras agotar los reintentos. `activo` es falso en los workers que no despachan.
+    """
+    return despachador.estado()
@@ -0,0 +1,113 @@
+# app/api/v1/routes/reportes.py
+from typing import Annotated
+from fastapi import APIRouter, Query, Request, Response
+from fastapi.responses import StreamingResponse
+
+from app.db.replica import lee_de_primaria
+from app.schemas.evento import FiltrosEvento
+from app.schemas.kpi import (
+    AprobacionCategoria, AprobacionGlobal, AprobacionOrganizador, BacklogPorTramos, FiltrosBacklog,
+    FiltrosOrganizadores, FiltrosReporte, TiempoDecision,
+)
+from app.services import reporte as svc
+
+router = APIRouter(prefix="/api/v1/reportes", tags=["reportes"])
+
+
+# ------------------------------------------
+# GET /api/v1/reportes/eventos.csv  -> CSV
+# ------------------------------------------
+@router.get(
+    "/eventos.csv",
+    response_class=StreamingResponse,
+    summary="Exportar Reporte de Eventos (CSV)",
+)
+async def exportar_eventos_csv(filtros: Annotated[FiltrosEvento, Query()], request: Request):
+    """
+    Exporta la vista `vi_eventos_base` en CSV (con encabezado). Se envía por
+    bloques mientras se lee de la BD; acepta los mismos filtros del listado.
+    """
+    return StreamingResponse(
+        svc.exportar_eventos_csv(filtros.model_dump(), lee_de_primaria(request)),
+        media_type="text/csv; charset=utf-8",
+        headers={"Content-Disposition": 'attachment; filename="eventos.csv"'},
+    )
+
+
+# ----------------------------------------------
+# GET /api/v1/reportes/eventos.ndjson  -> NDJSON
+# ----------------------------------------------
+@router.get(
+    "/eventos.ndjson",
+    response_class=StreamingResponse,
+    summary="Exportar Reporte de Eventos (NDJSON)",
+)
+async def exportar_eventos_ndjson(filtros: Annotated[FiltrosEvento, Query()], request: Request):
+    """
+    Exporta la vista `vi_eventos_base` como un objeto JSON por línea, por
+    bloques y con los mismos filtros del listado.
+    """
+    return StreamingResponse(
+        svc.exportar_eventos_ndjson(filtros.model_dump(), lee_de_primaria(request)),
+        media_type="application/x-ndjson",
+        headers={"Content-Disposition": 'attachment; filename="eventos.ndjson"'},
+    )
+
+
+# ----------------------------------------------------------------------
+# Consultas 03-07 con filtros, calculadas en la BD. Filtros comunes:
+# `desde`/`hasta` (fechaRegistro), `categoria` e `id_organizador`. Cada
+# combinación se guarda REPORTES_CACHE_TTL_S segundos y las peticiones
+# iguales que llegan mientras se calcula esperan esa misma consulta.
+# (Sin filtros, /api/v1/kpis responde lo mismo desde memoria.)
+# ----------------------------------------------------------------------
+@router.get("/aprobacion", response_model=AprobacionGlobal, summary="Tasa de Aprobación Global")
+async def reporte_aprobacion(filtros: Annotated[FiltrosReporte, Query()]):
+    """Consulta 03: aprobados, evaluados, tasa y pendientes de los eventos filtrados."""
+    return Response(content=await svc.aprobacion(filtros), media_type="application/json")
+
+
+@router.get(
+    "/aprobacion/organizadores",
+    response_model=list[AprobacionOrganizador],
+    summary="Tasa de Aprobación por Organizador",
+)
+async def reporte_aprobacion_organizadores(filtros: Annotated[FiltrosOrganizadores, Query()]):
+    """Consulta 05: evaluaciones aprobadas/total por organizador, los `limit` de mayor tasa."""
+    return Response(content=await svc.aprobacion_por_organizador(filtros), media_type="application/json")
+
+
+@router.get(
+    "/aprobacion/categorias",
+    response_model=list[AprobacionCategoria],
+    summary="Tasa de Aprobación por Categoría",
+)
+async def reporte_aprobacion_categorias(filtros: Annotated[FiltrosReporte, Query()]):
+    """Consulta 06: evaluaciones aprobadas/total por categoría."""
+    return Response(content=await svc.aprobacion_por_categoria(filtros), media_type="application/json")
+
+
+@router.get(
+    "/tiempo-decision",
+    response_model=list[TiempoDecision],
+    summary="Tiempo a Decisión por Veredicto",
+)
+async def reporte_tiempo_decision(filtros: Annotated[FiltrosReporte, Query()]):
+    """Consulta 04: horas promedio entre el registro del evento y cada evaluación, por veredicto."""
+    return Response(content=await svc.tiempo_a_decision(filtros), media_type="application/json")
+
+
+@router.get("/backlog", response_model=BacklogPorTramos, summary="Backlog por Antigüedad")
+async def reporte_backlog(filtros: Annotated[FiltrosBacklog, Query()]):
+    """
+    Consulta 07: eventos pendientes (registrado, enRevision) por días desde su
+    registro. `cortes` fija el último día de cada tramo (por defecto 2,7,14:
+    0-2, 3-7, 8-14 y más de 14).
+    """
+    return Response(content=await svc.backlog(filtros), media_type="application/json")
+
+
+@router.get("/cache/estadisticas", summary="Estadísticas de la Cache de Reportes")
+async def estadisticas_cache_reportes():
+    """Aciertos, cálculos lanzados y peticiones que esperaron un cálculo en curso (`unidas`)."""
+    return svc.cache_reportes.estadisticas()
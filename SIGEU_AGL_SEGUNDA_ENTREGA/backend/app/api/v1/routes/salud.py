@@ -0,0 +1,39 @@
+# app/api/v1/routes/salud.py
+import time
+from fastapi import APIRouter, Response, status
+from sqlalchemy import text
+from sqlalchemy.exc import SQLAlchemyError
+
+from app.core import arranque
+from app.db import obtener_engine
+from app.db import pool, replica
+
+router = APIRouter(prefix="/health", tags=["salud"])
+
+
+@router.get("/db", summary="Conectividad y ocupación del pool")
+async def salud_db(response: Response):
+    """SELECT 1 con una conexión del pool; 503 si la BD no responde. Con réplica, también su estado."""
+    engine = obtener_engine()
+    datos = {"pool": pool.estado(engine)}
+    t = time.perf_counter()
+    try:
+        async with engine.connect() as cx:
+            await cx.execute(text("SELECT 1"))
+        datos["estado"] = "ok"
+    except SQLAlchemyError as e:
+        datos["estado"] = "error"
+        datos["detalle"] = str(getattr(e, "orig", None) or e)
+        response.status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+    datos["latencia_ms"] = round((time.perf_counter() - t) * 1000, 2)
+    # la réplica no cambia el código: si no responde, las lecturas van a la primaria
+    estado_replica = replica.estado()
+    if estado_replica is not None:
+        datos["replica"] = estado_replica
+    return datos
+
+
+@router.get("/arranque", summary="Costo de arranque del worker")
+async def salud_arranque():
+    """Duración de cada fase del arranque de este proceso (importación, engine, pool) y cuándo quedó listo."""
+    return arranque.estado()
@@ -0,0 +1,116 @@
+# app/core/arranque.py
+"""
+Costo de arranque de un worker.
+
+En el proceso: `main.py` importa este módulo primero y marca cada fase (fin de
+la importación, engine, calentamiento del pool, despacho de notificaciones,
+listo para atender). `GET /health/arranque` las devuelve.
+
+Fuera del proceso, al estilo de `python -X importtime`: corre
+`import app.main` en un intérprete limpio con -X importtime y resume el
+tiempo propio por módulo y por paquete.
+
+    python -m app.core.arranque --top 25
+    python -m app.core.arranque --entorno ARRANQUE_PEREZOSO=true
+"""
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, NamedTuple, Optional
+
+# referencia: primera línea de la app que se ejecuta (antes de fastapi y sqlalchemy)
+INICIO = time.perf_counter()
+
+_fases: Dict[str, float] = {}
+_listo: Optional[float] = None
+
+
+@contextmanager
+def fase(nombre: str) -> Iterator[None]:
+    t = time.perf_counter()
+    try:
+        yield
+    finally:
+        _fases[nombre] = time.perf_counter() - t
+
+
+def marcar(nombre: str) -> None:
+    """Fase que va desde INICIO hasta ahora (p. ej. la importación de la app)."""
+    _fases[nombre] = time.perf_counter() - INICIO
+
+
+def marcar_listo() -> None:
+    global _listo
+    _listo = time.perf_counter() - INICIO
+
+
+def estado() -> Dict[str, Any]:
+    return {
+        "fases_ms": {k: round(v * 1000, 1) for k, v in _fases.items()},
+        "listo_ms": round(_listo * 1000, 1) if _listo is not None else None,
+    }
+
+
+# ---------- informe de importación ----------
+class Importacion(NamedTuple):
+    modulo: str
+    propio_us: int
+    acumulado_us: int
+
+
+def medir_importacion(modulo: str = "app.main", entorno: Optional[Dict[str, str]] = None) -> List[Importacion]:
+    """Importa `modulo` en un intérprete nuevo con -X importtime y devuelve cada módulo cargado."""
+    # importados aquí: este módulo es lo primero que carga la app y debe ser liviano
+    import os
+    import re
+    import subprocess
+    import sys
+
+    linea_re = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \| (\s*)(\S+)")
+    salida = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {modulo}"],
+        env={**os.environ, **(entorno or {})}, capture_output=True, text=True, check=True,
+    )
+    filas = []
+    for linea in salida.stderr.splitlines():
+        m = linea_re.match(linea)
+        if m:
+            filas.append(Importacion(m.group(4), int(m.group(1)), int(m.group(2))))
+    return filas
+
+
+def por_paquete(filas: List[Importacion]) -> Dict[str, int]:
+    """Tiempo propio sumado por paquete; los de la app se separan por subpaquete (app.schemas, ...)."""
+    total: Dict[str, int] = {}
+    for f in filas:
+        partes = f.modulo.split(".")
+        clave = ".".join(partes[:2]) if partes[0] == "app" and len(partes) > 1 else partes[0]
+        total[clave] = total.get(clave, 0) + f.propio_us
+    return dict(sorted(total.items(), key=lambda kv: -kv[1]))
+
+
+def informe(modulo: str = "app.main", top: int = 20, entorno: Optional[Dict[str, str]] = None) -> str:
+    filas = medir_importacion(modulo, entorno)
+    raiz = next((f for f in filas if f.modulo == modulo), None)
+    lineas = [f"import {modulo}: {raiz.acumulado_us / 1000:.1f} ms en total" if raiz else f"import {modulo}", ""]
+    lineas.append(f"{'paquete':<32}{'propio ms':>10}")
+    for paquete, us in list(por_paquete(filas).items())[:top]:
+        lineas.append(f"{paquete:<32}{us / 1000:>10.1f}")
+    lineas += ["", f"{'módulo':<48}{'propio ms':>10}{'acum. ms':>10}"]
+    for f in sorted(filas, key=lambda f: -f.propio_us)[:top]:
+        lineas.append(f"{f.modulo:<48}{f.propio_us / 1000:>10.1f}{f.acumulado_us / 1000:>10.1f}")
+    return "\n".join(lineas)
+
+
+def main() -> None:
+    import argparse
+
+    ap = argparse.ArgumentParser(description="Tiempo de importación de la app por paquete y por módulo")
+    ap.add_argument("--modulo", default="app.main")
+    ap.add_argument("--top", type=int, default=20)
+    ap.add_argument("--entorno", action="append", default=[], metavar="CLAVE=valor")
+    args = ap.parse_args()
+    print(informe(args.modulo, args.top, dict(kv.split("=", 1) for kv in args.entorno)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,283 @@
+# app/core/metricas.py
+"""
+Métricas del proceso en formato de texto de Prometheus, sin dependencias.
+
+- Middleware ASGI: latencia por ruta (plantilla, no la URL concreta), peticiones
+  en curso y tiempo de BD acumulado por petición. La diferencia entre ambos
+  histogramas es lo que se va en validación, ORM y serialización.
+- Eventos del engine: duración de cada sentencia SQL por tipo, muestras de
+  sentencias lentas y espera para obtener una conexión del pool.
+- Despacho de notificaciones: intentos por resultado, pendientes y retraso.
+
+Cada worker tiene su propio registro; Prometheus los raspa por separado.
+"""
+import time
+from bisect import bisect_left
+from collections import deque
+from contextvars import ContextVar
+from datetime import datetime
+from typing import Any, Deque, Dict, List, Optional, Sequence, Tuple
+
+from sqlalchemy import event, make_url
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, Pool
+
+from app.core.config import settings
+
+# límites en segundos (las cubetas son acumulativas al exponerlas)
+CUBETAS_HTTP = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+CUBETAS_SQL = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 1.0, 5.0)
+CUBETAS_ENTREGA = (0.5, 1.0, 5.0, 15.0, 60.0, 300.0, 900.0, 3600.0, 21600.0)
+
+# METRICAS, METRICAS_SQL_LENTA_MS y METRICAS_SQL_MUESTRAS (ver app/core/config.py)
+ACTIVAS = settings.metricas
+SQL_LENTA_S = settings.metricas_sql_lenta_ms / 1000
+SQL_MUESTRAS = settings.metricas_sql_muestras
+
+Etiquetas = Tuple[str, ...]
+
+
+# ---------- tipos de métrica ----------
+class Contador:
+    def __init__(self, nombre: str, ayuda: str, etiquetas: Sequence[str] = ()) -> None:
+        self.nombre, self.ayuda, self.etiquetas = nombre, ayuda, tuple(etiquetas)
+        self.valores: Dict[Etiquetas, float] = {}
+
+    def inc(self, *valores: str, n: float = 1) -> None:
+        self.valores[valores] = self.valores.get(valores, 0) + n
+
+    def exponer(self) -> List[str]:
+        lineas = [f"# HELP {self.nombre} {self.ayuda}", f"# TYPE {self.nombre} counter"]
+        for valores, v in sorted(self.valores.items()):
+            lineas.append(f"{self.nombre}{_etiquetas(self.etiquetas, valores)} {_num(v)}")
+        return lineas
+
+
+class Medidor(Contador):
+    """Valor que sube y baja (gauge)."""
+
+    def dec(self, *valores: str, n: float = 1) -> None:
+        self.inc(*valores, n=-n)
+
+    def fijar(self, *valores: str, v: float) -> None:
+        self.valores[valores] = v
+
+    def exponer(self) -> List[str]:
+        lineas = super().exponer()
+        lineas[1] = f"# TYPE {self.nombre} gauge"
+        return lineas
+
+
+class Histograma:
+    def __init__(self, nombre: str, ayuda: str, etiquetas: Sequence[str], cubetas: Sequence[float]) -> None:
+        self.nombre, self.ayuda, self.etiquetas = nombre, ayuda, tuple(etiquetas)
+        self.cubetas = tuple(cubetas)
+        # etiquetas -> [conteo por cubeta (+Inf al final), suma, total]
+        self._series: Dict[Etiquetas, list] = {}
+
+    def observar(self, segundos: float, *valores: str) -> None:
+        serie = self._series.get(valores)
+        if serie is None:
+            serie = self._series[valores] = [[0] * (len(self.cubetas) + 1), 0.0, 0]
+        serie[0][bisect_left(self.cubetas, segundos)] += 1
+        serie[1] += segundos
+        serie[2] += 1
+
+    def resumen(self, *valores: str) -> Dict[str, Any]:
+        """Total, media y p95 aproximado (límite de la cubeta que lo contiene), en ms."""
+        serie = self._series.get(valores)
+        if serie is None or not serie[2]:
+            return {"total": 0}
+        conteos, suma, total = serie
+        acumulado, p95 = 0, None
+        for limite, n in zip(self.cubetas + (float("inf"),), conteos):
+            acumulado += n
+            if acumulado >= 0.95 * total:
+                p95 = limite
+                break
+        return {
+            "total": total,
+            "media_ms": round(suma / total * 1000, 3),
+            "p95_ms_max": None if p95 == float("inf") else p95 * 1000,
+        }
+
+    def exponer(self) -> List[str]:
+        lineas = [f"# HELP {self.nombre} {self.ayuda}", f"# TYPE {self.nombre} histogram"]
+        for valores, (conteos, suma, total) in sorted(self._series.items()):
+            acumulado = 0
+            for limite, n in zip(self.cubetas + (float("inf"),), conteos):
+                acumulado += n
+                le = "+Inf" if limite == float("inf") else _num(limite)
+                etq = _etiquetas(self.etiquetas + ("le",), valores + (le,))
+                lineas.append(f"{self.nombre}_bucket{etq} {acumulado}")
+            etq = _etiquetas(self.etiquetas, valores)
+            lineas.append(f"{self.nombre}_sum{etq} {_num(suma)}")
+            lineas.append(f"{self.nombre}_count{etq} {total}")
+        return lineas
+
+
+def _num(v: float) -> str:
+    return str(int(v)) if float(v).is_integer() else repr(float(v))
+
+
+def _etiquetas(nombres: Etiquetas, valores: Etiquetas) -> str:
+    if not nombres:
+        return ""
+    pares = (f'{n}="{_escapar(v)}"' for n, v in zip(nombres, valores))
+    return "{" + ",".join(pares) + "}"
+
+
+def _escapar(v: str) -> str:
+    return v.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+# ---------- registro del proceso ----------
+http_duracion = Histograma(
+    "sigeu_http_request_duration_seconds", "Duración de la petición por ruta.",
+    ("metodo", "ruta", "codigo"), CUBETAS_HTTP,
+)
+http_bd = Histograma(
+    "sigeu_http_request_db_seconds", "Tiempo en sentencias SQL dentro de cada petición.",
+    ("metodo", "ruta"), CUBETAS_HTTP,
+)
+http_en_curso = Medidor("sigeu_http_requests_in_flight", "Peticiones en curso.")
+sql_duracion = Histograma(
+    "sigeu_db_statement_duration_seconds", "Duración de cada sentencia SQL por tipo.",
+    ("operacion",), CUBETAS_SQL,
+)
+sql_lentas = Contador("sigeu_db_slow_statements_total", "Sentencias por encima del umbral de lentitud.")
+pool_espera = Histograma(
+    "sigeu_db_pool_checkout_wait_seconds", "Espera para obtener una conexión del pool.", (), CUBETAS_SQL,
+)
+pool_en_uso = Medidor("sigeu_db_pool_checked_out", "Conexiones prestadas por el pool.")
+notificaciones_intentos = Contador(
+    "sigeu_notifications_total", "Intentos de envío de notificaciones por resultado.", ("resultado",),
+)
+notificaciones_pendientes = Medidor("sigeu_notifications_pending", "Notificaciones leídas y aún sin confirmar.")
+notificaciones_retraso = Medidor(
+    "sigeu_notifications_lag_seconds", "Antigüedad de la notificación pendiente más vieja (desde la revisión).",
+)
+notificaciones_entrega = Histograma(
+    "sigeu_notifications_delivery_seconds", "Desde la revisión hasta la entrega.", (), CUBETAS_ENTREGA,
+)
+
+REGISTRO = (
+    http_duracion, http_bd, http_en_curso, sql_duracion, sql_lentas, pool_espera, pool_en_uso,
+    notificaciones_intentos, notificaciones_pendientes, notificaciones_retraso, notificaciones_entrega,
+)
+
+# últimas sentencias lentas (sin parámetros: pueden traer datos personales)
+muestras_lentas: Deque[Dict[str, Any]] = deque(maxlen=SQL_MUESTRAS)
+
+# tiempo de BD acumulado por la petición en curso: [segundos]
+_bd_peticion: ContextVar[Optional[List[float]]] = ContextVar("bd_peticion", default=None)
+
+
+def exponer() -> str:
+    lineas: List[str] = []
+    for metrica in REGISTRO:
+        lineas.extend(metrica.exponer())
+    return "\n".join(lineas) + "\n"
+
+
+# ---------- middleware HTTP ----------
+class MetricasHTTP:
+    """Middleware ASGI puro (no envuelve el cuerpo: sirve también con StreamingResponse)."""
+
+    def __init__(self, app) -> None:
+        self.app = app
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        codigo = 500
+
+        async def enviar(mensaje) -> None:
+            nonlocal codigo
+            if mensaje["type"] == "http.response.start":
+                codigo = mensaje["status"]
+            await send(mensaje)
+
+        bd = [0.0]
+        ficha = _bd_peticion.set(bd)
+        http_en_curso.inc()
+        t = time.perf_counter()
+        try:
+            await self.app(scope, receive, enviar)
+        finally:
+            duracion = time.perf_counter() - t
+            http_en_curso.dec()
+            _bd_peticion.reset(ficha)
+            # plantilla de la ruta (/api/v1/{id_evento}); sin ruta = 404, se agrupan
+            ruta = getattr(scope.get("route"), "path", "sin_ruta")
+            http_duracion.observar(duracion, scope["method"], ruta, str(codigo))
+            http_bd.observar(bd[0], scope["method"], ruta)
+
+
+# ---------- SQL y pool ----------
+class PoolMedido(AsyncAdaptedQueuePool):
+    """Pool por defecto de los drivers async, midiendo cuánto se espera en cada checkout."""
+
+    def _do_get(self):
+        # no hay evento público previo al checkout: se mide aquí
+        t = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            pool_espera.observar(time.perf_counter() - t)
+
+
+def clase_pool(url: str, medir: bool = True) -> type[Pool]:
+    """Pool que elegiría el driver; si es el de cola (aiomysql, asyncmy) y `medir`, PoolMedido."""
+    u = make_url(url)
+    por_defecto = u.get_dialect().get_pool_class(u)
+    return PoolMedido if medir and por_defecto is AsyncAdaptedQueuePool else por_defecto
+
+
+def _operacion(sql: str) -> str:
+    palabra = sql.lstrip().split(None, 1)[0].upper() if sql.strip() else ""
+    return palabra if palabra in ("SELECT", "INSERT", "UPDATE", "DELETE", "WITH") else "OTRA"
+
+
+def instrumentar_engine(engine: AsyncEngine) -> None:
+    sync = engine.sync_engine
+
+    @event.listens_for(sync, "before_cursor_execute")
+    def _antes(conn, cursor, sentencia, parametros, contexto, executemany):
+        conn.info.setdefault("metricas_t", []).append(time.perf_counter())
+
+    @event.listens_for(sync, "after_cursor_execute")
+    def _despues(conn, cursor, sentencia, parametros, contexto, executemany):
+        inicios = conn.info.get("metricas_t")
+        if not inicios:
+            return
+        duracion = time.perf_counter() - inicios.pop()
+        sql_duracion.observar(duracion, _operacion(sentencia))
+        bd = _bd_peticion.get()
+        if bd is not None:
+            bd[0] += duracion
+        if duracion >= SQL_LENTA_S:
+            sql_lentas.inc()
+            muestras_lentas.append({
+                "fecha": datetime.now().isoformat(timespec="seconds"),
+                "ms": round(duracion * 1000, 2),
+                "executemany": executemany,
+                "sql": " ".join(sentencia.split())[:1000],
+            })
+
+    @event.listens_for(sync, "handle_error")
+    def _error(contexto):
+        # la sentencia falló: no queda after_cursor_execute que consuma el inicio
+        inicios = contexto.connection.info.get("metricas_t") if contexto.connection else None
+        if inicios:
+            inicios.pop()
+
+    @event.listens_for(sync.pool, "checkout")
+    def _prestada(*_):
+        pool_en_uso.inc()
+
+    @event.listens_for(sync.pool, "checkin")
+    def _devuelta(*_):
+        pool_en_uso.dec()
@@ -0,0 +1,88 @@
+# app/crud/agenda.py
+from typing import Iterable, List, Tuple
+from datetime import datetime
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select
+from app.models.evento import Evento
+from app.models.evento_instalacion import EventoInstalacion
+from app.models.instalacion import Instalacion
+
+
+# Reservas vigentes: instalación por defecto (evento.idInstalacion).
+# Los eventos rechazados no ocupan espacio.
+async def reservas_principales(session: AsyncSession) -> List[Tuple[int, int, datetime, datetime]]:
+    result = await session.execute(
+        select(Evento.idEvento, Evento.idInstalacion, Evento.fechaInicio, Evento.fechaFin)
+        .where(Evento.estado != "rechazado")
+    )
+    return [tuple(r) for r in result.all()]
+
+
+# Instalaciones adicionales (eventoInstalacion) de eventos vigentes
+async def instalaciones_adicionales(session: AsyncSession) -> List[Tuple[int, int]]:
+    result = await session.execute(
+        select(EventoInstalacion.idEvento, EventoInstalacion.idInstalacion)
+        .join(Evento, Evento.idEvento == EventoInstalacion.idEvento)
+        .where(Evento.estado != "rechazado")
+    )
+    return [tuple(r) for r in result.all()]
+
+
+# (idEvento, idInstalacion) adicionales de esos eventos, con cualquier estado (al reactivar uno rechazado)
+async def adicionales_de(session: AsyncSession, ids: Iterable[int]) -> List[Tuple[int, int]]:
+    result = await session.execute(
+        select(EventoInstalacion.idEvento, EventoInstalacion.idInstalacion)
+        .where(EventoInstalacion.idEvento.in_(list(ids)))
+    )
+    return [tuple(r) for r in result.all()]
+
+
+# Catálogo de instalaciones (para disponibilidad por capacidad y tipo)
+async def instalaciones(session: AsyncSession) -> List[Tuple[int, str, str, int, str]]:
+    result = await session.execute(
+        select(
+            Instalacion.idInstalacion, Instalacion.nombre, Instalacion.tipo,
+            Instalacion.capacidad, Instalacion.ubicacion,
+        )
+    )
+    return [tuple(r) for r in result.all()]
+
+
+# Bloquea las filas de las instalaciones hasta el fin de la transacción (SELECT ... FOR UPDATE):
+# dos procesos que reservan la misma sala se turnan entre verificar el horario y confirmar.
+# SQLite no tiene FOR UPDATE (se omite): ahí escribe una sola conexión a la vez.
+async def bloquear_instalaciones(session: AsyncSession, ids: Iterable[int]) -> None:
+    await session.execute(
+        select(Instalacion.idInstalacion)
+        .where(Instalacion.idInstalacion.in_(sorted(set(ids))))
+        .order_by(Instalacion.idInstalacion)
+        .with_for_update()
+    )
+
+
+# Reservas vigentes que ocupan alguna de `salas` (por defecto o adicional) y se solapan con
+# [desde, hasta), más todas las instalaciones adicionales de esos eventos. Lectura con bloqueo
+# compartido: ve lo último confirmado aunque la transacción ya haya leído antes (REPEATABLE READ).
+async def reservas_en(
+    session: AsyncSession, salas: Iterable[int], desde: datetime, hasta: datetime,
+) -> Tuple[List[Tuple[int, int, datetime, datetime]], List[Tuple[int, int]]]:
+    salas = sorted(set(salas))
+    columnas = (Evento.idEvento, Evento.idInstalacion, Evento.fechaInicio, Evento.fechaFin)
+    vigentes = (Evento.estado != "rechazado", Evento.fechaInicio < hasta, Evento.fechaFin > desde)
+    principales = await session.execute(
+        select(*columnas).where(Evento.idInstalacion.in_(salas), *vigentes).with_for_update(read=True)
+    )
+    por_adicional = await session.execute(
+        select(*columnas)
+        .join(EventoInstalacion, EventoInstalacion.idEvento == Evento.idEvento)
+        .where(EventoInstalacion.idInstalacion.in_(salas), *vigentes)
+        .with_for_update(read=True)
+    )
+    reservas = {r[0]: tuple(r) for r in [*principales.all(), *por_adicional.all()]}
+    if not reservas:
+        return [], []
+    result = await session.execute(
+        select(EventoInstalacion.idEvento, EventoInstalacion.idInstalacion)
+        .where(EventoInstalacion.idEvento.in_(list(reservas)))
+    )
+    return list(reservas.values()), [tuple(r) for r in result.all()]
@@ -0,0 +1,13 @@
+# app/crud/busqueda.py
+from typing import List, Optional, Tuple
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select
+from app.models.evento import Evento
+
+
+# Texto indexable y filtros de cada evento (idEvento, nombre, descripcion, categoria, estado)
+async def textos(session: AsyncSession) -> List[Tuple[int, str, Optional[str], str, str]]:
+    result = await session.execute(
+        select(Evento.idEvento, Evento.nombre, Evento.descripcion, Evento.categoria, Evento.estado)
+    )
+    return [tuple(r) for r in result.all()]
@@ -0,0 +1,94 @@
+# app/crud/evaluacion.py
+from typing import Any, Dict, Iterable, List, Mapping
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, insert, update, text
+from sqlalchemy.engine import Row
+from app.models.evento import Evento
+from app.models.evaluacion import Evaluacion
+from app.models.notificacion import Notificacion
+
+# trigger de 5_objetos_crud_evento.sql que replica evento.estado y notifica por fila
+TRIGGER_INSERCION = "trg_eval_after_insert"
+
+
+async def trigger_instalado(session: AsyncSession) -> bool:
+    dialecto = session.bind.dialect.name
+    if dialecto == "mysql":
+        sql = text(
+            "SELECT COUNT(*) FROM information_schema.TRIGGERS "
+            "WHERE TRIGGER_SCHEMA = DATABASE() AND TRIGGER_NAME = :nombre"
+        )
+    elif dialecto == "sqlite":
+        sql = text("SELECT COUNT(*) FROM sqlite_master WHERE type = 'trigger' AND name = :nombre")
+    else:
+        return False
+    return bool((await session.execute(sql, {"nombre": TRIGGER_INSERCION})).scalar())
+
+
+# Eventos rechazados entre `ids`, sin bloquear: un veredicto aprobado los reactiva y sus
+# salas se bloquean antes que las filas de evento, en el mismo orden que PUT /api/v1/{id}
+async def rechazados(session: AsyncSession, ids: Iterable[int]) -> List[Row]:
+    result = await session.execute(
+        select(Evento.idEvento, Evento.idInstalacion, Evento.fechaInicio, Evento.fechaFin)
+        .where(Evento.idEvento.in_(list(ids)), Evento.estado == "rechazado")
+    )
+    return list(result.all())
+
+
+# Eventos a evaluar, bloqueados hasta el commit (FOR UPDATE; SQLite lo ignora)
+async def bloquear_eventos(session: AsyncSession, ids: Iterable[int]) -> Dict[int, Row]:
+    result = await session.execute(
+        select(
+            Evento.idEvento, Evento.estado, Evento.categoria, Evento.idOrganizador,
+            Evento.idInstalacion, Evento.fechaInicio, Evento.fechaFin, Evento.fechaRegistro,
+        )
+        .where(Evento.idEvento.in_(list(ids)))
+        .with_for_update()
+    )
+    return {r.idEvento: r for r in result.all()}
+
+
+async def insertar_evaluaciones(session: AsyncSession, filas: List[Dict[str, Any]]) -> List[int]:
+    """
+    Inserta las evaluaciones y devuelve sus ids en el mismo orden de `filas`.
+    Los eventos deben estar bloqueados con `bloquear_eventos`. No hace commit.
+    """
+    # executemany: la sentencia compilada se reutiliza entre lotes y el driver
+    # la agrupa en INSERT multi-fila (insertmanyvalues / reescritura de aiomysql).
+    # Los ids de un INSERT crecen en el orden de las filas.
+    if session.bind.dialect.insert_executemany_returning:
+        stmt = insert(Evaluacion).returning(Evaluacion.idEvaluacion)
+        return sorted((await session.scalars(stmt, filas)).all())
+
+    # MySQL (sin RETURNING): con los eventos bloqueados nadie más puede agregarles
+    # evaluaciones, así que las n más recientes de esos eventos son las nuestras
+    await session.execute(insert(Evaluacion), filas)
+    ids = (await session.scalars(
+        select(Evaluacion.idEvaluacion)
+        .where(Evaluacion.idEvento.in_({f["idEvento"] for f in filas}))
+        .order_by(Evaluacion.idEvaluacion.desc())
+        .limit(len(filas))
+    )).all()
+    return sorted(ids)
+
+
+# Un UPDATE ... WHERE idEvento IN (...) por veredicto (a lo sumo dos por lote)
+async def actualizar_estados(session: AsyncSession, estados: Mapping[int, str]) -> int:
+    por_estado: Dict[str, List[int]] = {}
+    for id_evento, estado in estados.items():
+        por_estado.setdefault(estado, []).append(id_evento)
+    total = 0
+    for estado, ids in por_estado.items():
+        result = await session.execute(
+            update(Evento)
+            .where(Evento.idEvento.in_(ids))
+            .values(estado=estado, version=Evento.version + 1)
+            .execution_options(synchronize_session=False)
+        )
+        total += result.rowcount
+    return total
+
+
+# Todas las notificaciones del lote en un executemany (INSERT multi-fila en MySQL)
+async def insertar_notificaciones(session: AsyncSession, filas: List[Dict[str, Any]]) -> None:
+    await session.execute(insert(Notificacion), filas)
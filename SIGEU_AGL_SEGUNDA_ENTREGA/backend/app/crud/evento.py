@@ -1,7 +1,12 @@
 # app/crud/evento.py
-from typing import List, Optional, Dict, Any
+from datetime import datetime
+from typing import List, Optional, Dict, Any, Sequence, Tuple
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, delete
+from sqlalchemy import Row, select, delete, insert, update, or_, and_
+from sqlalchemy.orm import joinedload, selectinload
+from sqlalchemy.orm.attributes import set_committed_value
+from sqlalchemy.sql import Select
+from app.crud import indice as crud_indice
 from app.models.evento import Evento
 
 
@@ -11,19 +16,92 @@ async def crear(session: AsyncSession, data: Dict[str, Any]) -> Evento:
     data debe venir con claves que el ORM entiende (by_alias=True en el service),
     p. ej.: idOrganizador, idInstalacion, fechaInicio, fechaFin, rutaAvalPDF, estado, categoria, nombre, descripcion
     """
-    obj = Evento(**data)
-    session.add(obj)
+    if session.bind.dialect.insert_returning:
+        # INSERT ... RETURNING: id y valores por defecto del servidor en la misma sentencia
+        obj = (await session.scalars(insert(Evento).returning(Evento), [data])).one()
+    else:
+        # MySQL: el id llega con la respuesta del INSERT (lastrowid); fechaRegistro
+        # la pone la BD y queda en None aquí (no se relee la fila)
+        obj = Evento(**data)
+        session.add(obj)
+    await crud_indice.registrar_cambio(session)
     await session.commit()
-    await session.refresh(obj)
+    if "fechaRegistro" not in obj.__dict__:
+        # con server_default el ORM la marca para releer; en AsyncSession eso fallaría al leerla
+        set_committed_value(obj, "fechaRegistro", None)
     return obj
 
 
-# READ - list
-async def listar(session: AsyncSession) -> List[Evento]:
-    result = await session.execute(
-        select(Evento).order_by(Evento.idEvento.desc())
-    )
-    return list(result.scalars().all())
+# CREATE - lote (un solo executemany; no recupera los ids generados)
+async def insertar_lote(session: AsyncSession, filas: List[Dict[str, Any]]) -> None:
+    """
+    Inserta varias filas en una sola sentencia dentro de la transacción actual.
+    No hace commit: el llamador decide cuándo confirmar el lote completo.
+    """
+    await session.execute(insert(Evento), filas)
+
+
+# Filtros comunes (listado, exportes): `fuente` es Evento o las columnas de una vista
+def aplicar_filtros(
+    stmt: Select,
+    fuente: Any = Evento,
+    q: Optional[str] = None,
+    categoria: Optional[str] = None,
+    estado: Optional[str] = None,
+    fecha_ini: Optional[datetime] = None,
+    fecha_fin: Optional[datetime] = None,
+) -> Select:
+    if q:
+        like = f"%{q}%"
+        stmt = stmt.where(or_(fuente.nombre.like(like), fuente.descripcion.like(like)))
+    if categoria:
+        stmt = stmt.where(fuente.categoria == categoria)
+    if estado:
+        stmt = stmt.where(fuente.estado == estado)
+    if fecha_ini:
+        stmt = stmt.where(fuente.fechaInicio >= fecha_ini)
+    if fecha_fin:
+        stmt = stmt.where(fuente.fechaFin <= fecha_fin)
+    return stmt
+
+
+# Keyset: orden "id" -> (idEvento DESC); orden "fecha" -> (fechaInicio DESC, idEvento DESC).
+# `despues` es la clave del último registro de la página anterior: (idEvento, fechaInicio).
+def aplicar_keyset(
+    stmt: Select,
+    fuente: Any = Evento,
+    orden: str = "id",
+    despues: Optional[Tuple[int, Optional[datetime]]] = None,
+) -> Select:
+    if orden == "fecha":
+        if despues:
+            id_ult, fecha_ult = despues
+            stmt = stmt.where(or_(
+                fuente.fechaInicio < fecha_ult,
+                and_(fuente.fechaInicio == fecha_ult, fuente.idEvento < id_ult),
+            ))
+        return stmt.order_by(fuente.fechaInicio.desc(), fuente.idEvento.desc())
+
+    if despues:
+        stmt = stmt.where(fuente.idEvento < despues[0])
+    return stmt.order_by(fuente.idEvento.desc())
+
+
+# READ - list (paginado por keyset: el costo no crece con la profundidad de la página).
+# Devuelve tuplas de `columnas`, sin instanciar el ORM ni pasar por la sesión.
+async def listar_filas(
+    session: AsyncSession,
+    columnas: Sequence[str],
+    *,
+    orden: str = "id",
+    limit: int = 50,
+    despues: Optional[Tuple[int, Optional[datetime]]] = None,
+    **filtros: Any,
+) -> List[Row]:
+    stmt = aplicar_filtros(select(*(Evento.__table__.c[c] for c in columnas)), Evento, **filtros)
+    stmt = aplicar_keyset(stmt, Evento, orden, despues).limit(limit)
+    result = await session.execute(stmt)
+    return list(result.all())
 
 
 # READ - by id
@@ -32,29 +110,103 @@ async def obtener(session: AsyncSession, id_evento: int) -> Optional[Evento]:
     return obj
 
 
-# UPDATE (parcial)
-async def actualizar(session: AsyncSession, id_evento: int, cambios: Dict[str, Any]) -> Optional[Evento]:
-    obj = await session.get(Evento, id_evento)
-    if not obj:
-        return None
+# READ - varios por id (un solo SELECT ... IN; el orden lo decide el llamador)
+async def obtener_varios(session: AsyncSession, ids: List[int]) -> Dict[int, Evento]:
+    if not ids:
+        return {}
+    result = await session.execute(select(Evento).where(Evento.idEvento.in_(ids)))
+    return {obj.idEvento: obj for obj in result.scalars().all()}
+
 
-    # aplica cambios en atributos válidos
-    for k, v in cambios.items():
-        # protección mínima: ignora claves desconocidas
-        if hasattr(obj, k):
-            setattr(obj, k, v)
+# READ - varios por id como tuplas de `columnas` (un solo SELECT ... IN)
+async def obtener_filas(session: AsyncSession, ids: Sequence[int], columnas: Sequence[str]) -> List[Row]:
+    if not ids:
+        return []
+    stmt = select(*(Evento.__table__.c[c] for c in columnas)).where(Evento.idEvento.in_(ids))
+    return list((await session.execute(stmt)).all())
 
+
+
+# READ - varios por id con sus relaciones (detalle). Siempre 5 sentencias, sin
+# importar cuántos ids (hasta 500, el tamaño de lote de selectinload):
+# evento + organizador + instalación en un JOIN, y un SELECT ... IN por cada
+# colección (instalaciones adicionales, organizaciones, participantes, evaluaciones).
+async def obtener_detalles(session: AsyncSession, ids: Sequence[int]) -> List[Evento]:
+    if not ids:
+        return []
+    # aquí y no arriba: importar el router de eventos no carga los modelos del detalle
+    from app.models.evento_organizacion import EventoOrganizacion
+    from app.models.usuario_evento import UsuarioEvento
+    stmt = (
+        select(Evento)
+        .where(Evento.idEvento.in_(ids))
+        .options(
+            joinedload(Evento.organizador, innerjoin=True),
+            joinedload(Evento.instalacion, innerjoin=True),
+            selectinload(Evento.instalaciones_adicionales),
+            selectinload(Evento.organizaciones).joinedload(EventoOrganizacion.organizacion, innerjoin=True),
+            selectinload(Evento.participantes).joinedload(UsuarioEvento.usuario, innerjoin=True),
+            selectinload(Evento.evaluaciones),
+        )
+    )
+    return list((await session.scalars(stmt)).all())
+
+# UPDATE (parcial): un solo UPDATE con las columnas enviadas; sube `version`.
+# Con `versiones` es condicional (WHERE ... AND version IN (...)): None si el
+# evento no existe o ya está en otra versión; el llamador distingue con `version_actual`.
+async def actualizar(
+    session: AsyncSession, id_evento: int, cambios: Dict[str, Any], versiones: Optional[Sequence[int]] = None,
+) -> Optional[Evento]:
+    # protección mínima: ignora claves que no son columnas (version la pone el UPDATE)
+    valores = {k: v for k, v in cambios.items() if k in Evento.__table__.c and k != "version"}
+    condicion = Evento.idEvento == id_evento
+    if versiones is not None:
+        condicion = and_(condicion, Evento.version.in_(versiones))
+    if valores:
+        valores["version"] = Evento.version + 1
+
+    if valores and session.bind.dialect.update_returning:
+        # UPDATE ... RETURNING: la fila actualizada sin otra lectura
+        stmt = (
+            update(Evento).where(condicion).values(valores).returning(Evento)
+            .execution_options(synchronize_session=False, populate_existing=True)
+        )
+        obj = (await session.scalars(stmt)).one_or_none()
+    else:
+        # MySQL: UPDATE y SELECT en la misma transacción (antes: SELECT, UPDATE, SELECT)
+        obj = None
+        aplicado = True
+        if valores:
+            result = await session.execute(
+                update(Evento).where(condicion).values(valores)
+                .execution_options(synchronize_session=False)
+            )
+            # el UPDATE siempre cambia `version`: 0 filas = no existe o la versión no coincidía
+            aplicado = result.rowcount > 0
+            condicion = Evento.idEvento == id_evento
+        if aplicado:
+            obj = (await session.scalars(
+                select(Evento).where(condicion).execution_options(populate_existing=True)
+            )).one_or_none()
+
+    if valores and obj is not None:
+        await crud_indice.registrar_cambio(session)
     await session.commit()
-    await session.refresh(obj)
     return obj
 
 
-# DELETE
-async def eliminar(session: AsyncSession, id_evento: int) -> bool:
-    obj = await session.get(Evento, id_evento)
-    if not obj:
-        return False
+# Versión vigente de un evento (None si no existe)
+async def version_actual(session: AsyncSession, id_evento: int) -> Optional[int]:
+    return await session.scalar(select(Evento.version).where(Evento.idEvento == id_evento))
+
 
-    await session.delete(obj)
+# DELETE: un solo DELETE; filas afectadas = 0 si no existía
+async def eliminar(session: AsyncSession, id_evento: int) -> bool:
+    result = await session.execute(
+        delete(Evento).where(Evento.idEvento == id_evento)
+        .execution_options(synchronize_session=False)
+    )
+    if result.rowcount:
+        await crud_indice.registrar_cambio(session)
     await session.commit()
-    return True
+    return result.rowcount > 0
@@ -0,0 +1,32 @@
+# app/crud/indice.py
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import insert, select, update
+from app.models.marca_cambios import MarcaCambios
+
+# session.info[...]: valores de la marca que dejó esta transacción (se confirman con el commit)
+MARCAS_PROPIAS = "marcas_propias"
+
+
+# Marca de cambios para los índices en memoria: el contador de marcaCambios, una
+# lectura por clave primaria. Sube una vez por transacción del backend que cambia
+# eventos o veredictos (registrar_cambio) y con los triggers de eventoInstalacion.
+async def marca_cambios(session: AsyncSession) -> int:
+    return await session.scalar(select(MarcaCambios.contador).where(MarcaCambios.id == 1)) or 0
+
+
+# Sube la marca dentro de la transacción actual, justo antes del commit: la fila
+# queda bloqueada hasta confirmar, así que el valor leído es solo de esta transacción.
+async def registrar_cambio(session: AsyncSession) -> int:
+    result = await session.execute(
+        update(MarcaCambios).where(MarcaCambios.id == 1)
+        .values(contador=MarcaCambios.contador + 1)
+        .execution_options(synchronize_session=False)
+    )
+    if result.rowcount:
+        valor = await session.scalar(select(MarcaCambios.contador).where(MarcaCambios.id == 1))
+    else:
+        # base sin la fila inicial (11_marca_cambios.sql la inserta)
+        await session.execute(insert(MarcaCambios).values(id=1, contador=1))
+        valor = 1
+    session.info.setdefault(MARCAS_PROPIAS, []).append(valor)
+    return valor
@@ -0,0 +1,47 @@
+# app/crud/kpi.py
+from typing import Any, List, Tuple
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, func
+from app.models.evento import Evento
+from app.models.evento_instalacion import EventoInstalacion
+from app.models.evaluacion import Evaluacion
+from app.models.usuario import Usuario
+from app.models.instalacion import Instalacion
+
+
+# Columnas de evento que alimentan los indicadores (sin TEXT)
+async def eventos(session: AsyncSession) -> List[Tuple[Any, ...]]:
+    result = await session.execute(
+        select(
+            Evento.idEvento, Evento.estado, Evento.categoria, Evento.idOrganizador,
+            Evento.idInstalacion, Evento.fechaInicio, Evento.fechaFin, Evento.fechaRegistro,
+        )
+    )
+    return [tuple(r) for r in result.all()]
+
+
+async def instalaciones_adicionales(session: AsyncSession) -> List[Tuple[int, int]]:
+    result = await session.execute(select(EventoInstalacion.idEvento, EventoInstalacion.idInstalacion))
+    return [tuple(r) for r in result.all()]
+
+
+# (idEvento, estado de la evaluación, cantidad)
+async def evaluaciones_por_evento(session: AsyncSession) -> List[Tuple[int, str, int]]:
+    result = await session.execute(
+        select(Evaluacion.idEvento, Evaluacion.estado, func.count())
+        .group_by(Evaluacion.idEvento, Evaluacion.estado)
+    )
+    return [tuple(r) for r in result.all()]
+
+
+async def nombres_organizadores(session: AsyncSession) -> List[Tuple[int, str]]:
+    result = await session.execute(
+        select(Usuario.idUsuario, Usuario.nombre)
+        .where(Usuario.idUsuario.in_(select(Evento.idOrganizador).distinct()))
+    )
+    return [tuple(r) for r in result.all()]
+
+
+async def nombres_instalaciones(session: AsyncSession) -> List[Tuple[int, str]]:
+    result = await session.execute(select(Instalacion.idInstalacion, Instalacion.nombre))
+    return [tuple(r) for r in result.all()]
@@ -0,0 +1,43 @@
+# app/crud/notificacion.py
+from datetime import datetime
+from typing import Any, Collection, Iterable, List, Tuple
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, update
+from app.models.evento import Evento
+from app.models.evaluacion import Evaluacion
+from app.models.notificacion import Notificacion
+from app.models.usuario import Usuario
+
+
+# Pendientes (fechaEnvio NULL) que no estén en `excluir` (las que el despachador ya tiene en
+# curso), con lo necesario para armar el mensaje. Se recorre siempre desde la más vieja: un id
+# bajo confirmado después de otro más alto (transacciones concurrentes) no se pierde.
+# ix_notificacion_fechaEnvio evita leer las ya enviadas.
+async def pendientes(session: AsyncSession, excluir: Collection[int], limite: int) -> List[Tuple[Any, ...]]:
+    condiciones = [Notificacion.fechaEnvio.is_(None)]
+    if excluir:
+        condiciones.append(Notificacion.idNotificacion.not_in(list(excluir)))
+    result = await session.execute(
+        select(
+            Notificacion.idNotificacion, Notificacion.tipoNotificacion, Notificacion.justificacion,
+            Notificacion.urlPDF, Usuario.correo, Usuario.nombre,
+            Evento.idEvento, Evento.nombre, Evaluacion.fechaRevision,
+        )
+        .join(Usuario, Usuario.idUsuario == Notificacion.usuarioReceptor)
+        .join(Evaluacion, Evaluacion.idEvaluacion == Notificacion.idEvaluacion)
+        .join(Evento, Evento.idEvento == Evaluacion.idEvento)
+        .where(*condiciones)
+        .order_by(Notificacion.idNotificacion)
+        .limit(limite)
+    )
+    return [tuple(r) for r in result.all()]
+
+
+async def marcar_enviadas(session: AsyncSession, ids: Iterable[int], fecha: datetime) -> None:
+    await session.execute(
+        update(Notificacion)
+        .where(Notificacion.idNotificacion.in_(list(ids)))
+        .values(fechaEnvio=fecha)
+        .execution_options(synchronize_session=False)
+    )
+    await session.commit()
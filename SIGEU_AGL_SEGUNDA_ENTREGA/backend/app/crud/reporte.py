@@ -0,0 +1,221 @@
+# app/crud/reporte.py
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Sequence
+from sqlalchemy import DateTime, Integer, Select, case, column, func, select, table
+from sqlalchemy.engine import Connection, Row
+from sqlalchemy.ext.asyncio import AsyncSession, AsyncResult
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.schema import ExecutableDDLElement
+from sqlalchemy.sql.functions import FunctionElement
+from app.crud.evento import aplicar_filtros
+from app.models.evaluacion import Evaluacion
+from app.models.evento import Evento
+from app.models.instalacion import Instalacion
+from app.models.usuario import Usuario
+
+# Vista definida en sql/6. vista_reporte_eventos.sql; en un esquema creado desde los
+# modelos (perfil SQLite) la crea `crear_vistas`. Las fechas llevan tipo para que SQLite,
+# que las guarda como texto, las devuelva como datetime igual que MySQL
+vi_eventos_base = table(
+    "vi_eventos_base",
+    column("idEvento"),
+    column("nombre"),
+    column("descripcion"),
+    column("categoria"),
+    column("estado"),
+    column("fechaInicio", DateTime),
+    column("fechaFin", DateTime),
+    column("duracion_horas"),
+    column("fechaRegistro", DateTime),
+    column("rutaAvalPDF"),
+    column("idOrganizador"),
+    column("organizador_nombre"),
+    column("organizador_rol"),
+    column("idInstalacion"),
+    column("instalacion_nombre"),
+    column("instalacion_tipo"),
+    column("instalacion_capacidad"),
+)
+
+COLUMNAS_EVENTOS_BASE = [c.name for c in vi_eventos_base.columns]
+
+
+# READ - streaming con cursor del lado del servidor: solo `filas_por_bloque`
+# registros viven en memoria a la vez, sin importar el tamaño del resultado
+async def stream_eventos_base(session: AsyncSession, filas_por_bloque: int, **filtros: Any) -> AsyncResult:
+    stmt = aplicar_filtros(select(vi_eventos_base), vi_eventos_base.c, **filtros)
+    stmt = stmt.order_by(vi_eventos_base.c.idEvento).execution_options(yield_per=filas_por_bloque)
+    return await session.stream(stmt)
+
+
+class horas_entre(FunctionElement):
+    """TIMESTAMPDIFF(HOUR, inicio, fin): horas completas; en SQLite con julianday."""
+    type = Integer()
+    inherit_cache = True
+    name = "horas_entre"
+
+
+@compiles(horas_entre)
+def _horas_entre(elemento, compilador, **kw):
+    inicio, fin = (compilador.process(c, **kw) for c in elemento.clauses)
+    return f"TIMESTAMPDIFF(HOUR, {inicio}, {fin})"
+
+
+@compiles(horas_entre, "sqlite")
+def _horas_entre_sqlite(elemento, compilador, **kw):
+    inicio, fin = (compilador.process(c, **kw) for c in elemento.clauses)
+    # a segundos enteros antes de dividir: julianday arrastra error de coma flotante
+    return f"(CAST(ROUND((julianday({fin}) - julianday({inicio})) * 86400) AS INTEGER) / 3600)"
+
+
+# ---------- Vista vi_eventos_base desde los modelos ----------
+class CrearVista(ExecutableDDLElement):
+    def __init__(self, nombre: str, consulta: Select) -> None:
+        self.nombre = nombre
+        self.consulta = consulta
+
+
+@compiles(CrearVista)
+def _crear_vista(elemento, compilador, **kw):
+    consulta = compilador.sql_compiler.process(elemento.consulta, literal_binds=True)
+    return f"CREATE OR REPLACE VIEW {compilador.preparer.quote(elemento.nombre)} AS {consulta}"
+
+
+@compiles(CrearVista, "sqlite")
+def _crear_vista_sqlite(elemento, compilador, **kw):
+    consulta = compilador.sql_compiler.process(elemento.consulta, literal_binds=True)
+    return f"CREATE VIEW IF NOT EXISTS {compilador.preparer.quote(elemento.nombre)} AS {consulta}"
+
+
+def _consulta_eventos_base() -> Select:
+    # mismas columnas y en el mismo orden que sql/6; duracion_horas con horas_entre (TIMESTAMPDIFF)
+    columnas = {
+        "idEvento": Evento.idEvento,
+        "nombre": Evento.nombre,
+        "descripcion": Evento.descripcion,
+        "categoria": Evento.categoria,
+        "estado": Evento.estado,
+        "fechaInicio": Evento.fechaInicio,
+        "fechaFin": Evento.fechaFin,
+        "duracion_horas": horas_entre(Evento.fechaInicio, Evento.fechaFin),
+        "fechaRegistro": Evento.fechaRegistro,
+        "rutaAvalPDF": Evento.rutaAvalPDF,
+        "idOrganizador": Evento.idOrganizador,
+        "organizador_nombre": Usuario.nombre,
+        "organizador_rol": Usuario.rol,
+        "idInstalacion": Evento.idInstalacion,
+        "instalacion_nombre": Instalacion.nombre,
+        "instalacion_tipo": Instalacion.tipo,
+        "instalacion_capacidad": Instalacion.capacidad,
+    }
+    return (
+        select(*(c.label(nombre) for nombre, c in columnas.items()))
+        .join(Usuario, Usuario.idUsuario == Evento.idOrganizador)
+        .join(Instalacion, Instalacion.idInstalacion == Evento.idInstalacion)
+    )
+
+
+# Vistas que usa el backend, para el esquema creado con create_all (app/db/sqlite.py);
+# en MySQL las instala sql/6. Se llama con una conexión síncrona (run_sync).
+def crear_vistas(conexion: Connection) -> None:
+    conexion.execute(CrearVista(vi_eventos_base.name, _consulta_eventos_base()))
+
+
+# ---------- Agregados de las Consultas 03-07 (SQLAlchemy Core, /api/v1/reportes) ----------
+
+
+def _cohorte(
+    stmt: Select,
+    desde: Optional[datetime] = None,
+    hasta: Optional[datetime] = None,
+    categoria: Optional[str] = None,
+    id_organizador: Optional[int] = None,
+) -> Select:
+    # eventos registrados en [desde, hasta), de la categoría / el organizador pedidos
+    if desde:
+        stmt = stmt.where(Evento.fechaRegistro >= desde)
+    if hasta:
+        stmt = stmt.where(Evento.fechaRegistro < hasta)
+    if categoria:
+        stmt = stmt.where(Evento.categoria == categoria)
+    if id_organizador:
+        stmt = stmt.where(Evento.idOrganizador == id_organizador)
+    return stmt
+
+
+def _veredictos():
+    aprobados = func.sum(case((Evaluacion.estado == "aprobado", 1), else_=0))
+    return aprobados, func.count(Evaluacion.idEvaluacion)
+
+
+# Consulta 03: eventos por estado (la tasa y los pendientes se arman con esto)
+async def eventos_por_estado(session: AsyncSession, **filtros: Any) -> Dict[str, int]:
+    stmt = _cohorte(select(Evento.estado, func.count()).group_by(Evento.estado), **filtros)
+    return {estado: n for estado, n in (await session.execute(stmt)).all()}
+
+
+# Consulta 04: horas promedio desde fechaRegistro hasta fechaRevision, por veredicto
+async def tiempo_a_decision(session: AsyncSession, **filtros: Any) -> List[Row]:
+    stmt = _cohorte(
+        select(
+            Evaluacion.estado,
+            func.count().label("evaluaciones"),
+            func.avg(horas_entre(Evento.fechaRegistro, Evaluacion.fechaRevision)).label("horas_promedio"),
+        )
+        .join(Evento, Evento.idEvento == Evaluacion.idEvento)
+        .where(Evaluacion.fechaRevision.is_not(None), Evento.fechaRegistro.is_not(None))
+        .group_by(Evaluacion.estado)
+        .order_by(Evaluacion.estado),
+        **filtros,
+    )
+    return (await session.execute(stmt)).all()
+
+
+# Consulta 05: evaluaciones aprobadas / total por organizador, de mayor a menor tasa
+async def aprobacion_por_organizador(session: AsyncSession, limit: int, **filtros: Any) -> List[Row]:
+    aprobados, evaluados = _veredictos()
+    stmt = _cohorte(
+        select(
+            Usuario.idUsuario.label("id_usuario"), Usuario.nombre,
+            aprobados.label("aprobados"), evaluados.label("evaluados"),
+        )
+        .select_from(Evento)
+        .join(Usuario, Usuario.idUsuario == Evento.idOrganizador)
+        .join(Evaluacion, Evaluacion.idEvento == Evento.idEvento)
+        .group_by(Usuario.idUsuario, Usuario.nombre)
+        .order_by((aprobados * 1.0 / evaluados).desc(), evaluados.desc(), Usuario.idUsuario)
+        .limit(limit),
+        **filtros,
+    )
+    return (await session.execute(stmt)).all()
+
+
+# Consulta 06: evaluaciones aprobadas / total por categoría
+async def aprobacion_por_categoria(session: AsyncSession, **filtros: Any) -> List[Row]:
+    aprobados, evaluados = _veredictos()
+    stmt = _cohorte(
+        select(Evento.categoria, aprobados.label("aprobados"), evaluados.label("evaluados"))
+        .join(Evaluacion, Evaluacion.idEvento == Evento.idEvento)
+        .group_by(Evento.categoria)
+        .order_by((aprobados * 1.0 / evaluados).desc(), Evento.categoria),
+        **filtros,
+    )
+    return (await session.execute(stmt)).all()
+
+
+# Consulta 07: pendientes por tramo de antigüedad. `inicios[i]` es la primera fechaRegistro
+# del tramo i (decrecientes); lo anterior a inicios[-1] es el último tramo. Las
+# comparaciones son contra fechaRegistro, así que el rango sale del índice (estado, fechaRegistro).
+async def pendientes_por_tramo(
+    session: AsyncSession, estados: Sequence[str], inicios: Sequence[datetime], hasta_excl: datetime,
+    **filtros: Any,
+) -> Dict[int, int]:
+    tramo = case(*((Evento.fechaRegistro >= inicio, i) for i, inicio in enumerate(inicios)), else_=len(inicios))
+    stmt = _cohorte(
+        select(tramo.label("tramo"), func.count())
+        .where(Evento.estado.in_(estados), Evento.fechaRegistro < hasta_excl)
+        # por la etiqueta: MySQL (ONLY_FULL_GROUP_BY) no reconoce el CASE repetido con otros parámetros
+        .group_by("tramo"),
+        **filtros,
+    )
+    return {i: n for i, n in (await session.execute(stmt)).all()}
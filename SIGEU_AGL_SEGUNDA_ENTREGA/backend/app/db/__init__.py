@@ -1,4 +1,14 @@
 # app/db/__init__.py
-from .session import engine, SessionLocal, get_session  # re-export
+from . import session as _session
+from .session import get_session, obtener_engine, obtener_sesiones  # re-export
+from .replica import get_read_session, get_write_session
 
-__all__ = ["engine", "SessionLocal", "get_session"]
+__all__ = [
+    "engine", "SessionLocal", "get_session", "get_read_session", "get_write_session",
+    "obtener_engine", "obtener_sesiones",
+]
+
+
+def __getattr__(nombre: str):
+    # engine y SessionLocal se crean en el primer acceso (ver app/db/session.py)
+    return getattr(_session, nombre)
@@ -0,0 +1,71 @@
+# app/db/pool.py
+"""Ping selectivo, calentamiento y estado del pool del engine."""
+import asyncio
+import time
+from typing import Any, Dict
+
+from sqlalchemy import event, exc
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import QueuePool
+
+from app.core import metricas
+
+
+def ping_si_inactiva(engine: AsyncEngine, segundos: float) -> None:
+    """
+    Como pool_pre_ping, pero solo para conexiones que pasaron más de `segundos`
+    en reposo: bajo carga las conexiones rotan rápido y no pagan el viaje extra.
+    """
+    dialecto = engine.sync_engine.dialect
+
+    @event.listens_for(engine.sync_engine, "checkin")
+    def _devuelta(dbapi_con, registro):
+        registro.info["devuelta"] = time.monotonic()
+
+    @event.listens_for(engine.sync_engine, "checkout")
+    def _prestada(dbapi_con, registro, proxy):
+        devuelta = registro.info.get("devuelta")
+        if devuelta is None or time.monotonic() - devuelta < segundos:
+            return
+        try:
+            dialecto.do_ping(dbapi_con)
+        except Exception as e:
+            # el pool descarta esta conexión y reintenta con otra
+            raise exc.DisconnectionError() from e
+
+
+def usa_pool(engine: AsyncEngine) -> bool:
+    return isinstance(engine.sync_engine.pool, QueuePool)
+
+
+async def calentar(engine: AsyncEngine, n: int) -> int:
+    """Abre hasta `n` conexiones a la vez y las deja en el pool. Devuelve cuántas abrió."""
+    if not usa_pool(engine):
+        return 0
+    n = min(n, engine.sync_engine.pool.size())
+    if n <= 0:
+        return 0
+    conexiones = await asyncio.gather(*(engine.connect() for _ in range(n)))
+    for cx in conexiones:
+        await cx.close()
+    return n
+
+
+def estado(engine: AsyncEngine) -> Dict[str, Any]:
+    pool = engine.sync_engine.pool
+    datos: Dict[str, Any] = {"clase": type(pool).__name__}
+    if isinstance(pool, QueuePool):
+        capacidad = pool.size() + pool._max_overflow
+        datos.update({
+            "tamano": pool.size(),
+            "max_overflow": pool._max_overflow,
+            "timeout_s": pool.timeout(),
+            "prestadas": pool.checkedout(),
+            "en_reposo": pool.checkedin(),
+            "desborde": max(pool.overflow(), 0),
+            "ocupacion_pct": round(pool.checkedout() / capacidad * 100, 1) if capacidad else None,
+        })
+    espera = metricas.pool_espera.resumen()
+    if espera["total"]:
+        datos["espera_checkout"] = espera
+    return datos
@@ -0,0 +1,174 @@
+# app/db/replica.py
+"""
+Lecturas en una réplica (READ_DATABASE_URL), escrituras en la primaria (DATABASE_URL).
+
+    get_write_session   sesión de la primaria; si confirma una escritura, el
+                        cliente recibe la cookie `sigeu_primaria`
+    get_read_session    sesión de la réplica, salvo que:
+                        - no haya réplica configurada,
+                        - el cliente tenga la cookie vigente (escribió hace menos de
+                          DB_REPLICA_RETRASO_MAX_S: lee lo que acaba de escribir), o
+                        - la réplica no responda: se lee de la primaria y no se
+                          vuelve a probar hasta pasados DB_REPLICA_REINTENTO_S.
+
+Los índices en memoria (agenda, KPIs, búsqueda) se arman siempre desde la
+primaria, porque después solo se actualizan con las escrituras del propio
+proceso (ver IndiceEnMemoria.asegurar_cargado).
+
+Para probarlo en local bastan dos archivos SQLite, el segundo copiado del primero:
+    DATABASE_URL=sqlite+aiosqlite:///./sigeu.db
+    READ_DATABASE_URL=sqlite+aiosqlite:///./sigeu_replica.db
+"""
+import logging
+import math
+import time
+from contextlib import asynccontextmanager
+from typing import Any, AsyncGenerator, AsyncIterator, Dict, Optional
+
+from fastapi import Request
+from sqlalchemy import event
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.db import pool
+from app.db.session import obtener_engine_lectura, obtener_sesiones, obtener_sesiones_lectura
+
+log = logging.getLogger("sigeu")
+
+COOKIE_PRIMARIA = "sigeu_primaria"
+# request.state: hasta cuándo (epoch) leer de la primaria; lo pone get_write_session tras un commit
+_ESTADO_PRIMARIA = "primaria_hasta"
+
+
+class _Replica:
+    def __init__(self) -> None:
+        self.caida_hasta = 0.0     # time.monotonic()
+        self.fallos = 0
+        self.ultimo_error: Optional[str] = None
+        self.lecturas = 0
+        self.lecturas_primaria = 0
+
+    def disponible(self) -> bool:
+        return time.monotonic() >= self.caida_hasta
+
+    def marcar_caida(self, error: BaseException) -> None:
+        self.fallos += 1
+        self.ultimo_error = str(getattr(error, "orig", None) or error)
+        self.caida_hasta = time.monotonic() + settings.db_replica_reintento_s
+        log.warning(
+            "Réplica de lectura no disponible (%s); se lee de la primaria durante %.0f s",
+            self.ultimo_error, settings.db_replica_reintento_s,
+        )
+
+
+replica = _Replica()
+
+
+def configurada() -> bool:
+    return bool(settings.read_database_url)
+
+
+def es_replica(session: AsyncSession) -> bool:
+    return session.info.get("replica", False)
+
+
+def lee_de_primaria(request: Request) -> bool:
+    """El cliente escribió hace menos de DB_REPLICA_RETRASO_MAX_S (cookie `sigeu_primaria`)."""
+    valor = request.cookies.get(COOKIE_PRIMARIA)
+    if not valor:
+        return False
+    try:
+        return time.time() < float(valor)
+    except ValueError:
+        return False
+
+
+@asynccontextmanager
+async def sesion_lectura(primaria: bool = False) -> AsyncIterator[AsyncSession]:
+    """Sesión de la réplica (con la conexión ya abierta) o de la primaria si no corresponde o no responde."""
+    sesiones = obtener_sesiones_lectura()
+    session = None
+    if sesiones is not None and not primaria and replica.disponible():
+        session = sesiones()
+        try:
+            # se conecta aquí para poder caer a la primaria antes de que la ruta empiece
+            await session.connection()
+        except (DBAPIError, OSError) as e:
+            await session.close()
+            replica.marcar_caida(e)
+            session = None
+    if session is None:
+        replica.lecturas_primaria += 1
+        async with obtener_sesiones()() as session:
+            yield session
+        return
+
+    replica.lecturas += 1
+    try:
+        yield session
+    except DBAPIError as e:
+        # la réplica se cayó a mitad de la petición: esta falla, las siguientes van a la primaria
+        if e.connection_invalidated:
+            replica.marcar_caida(e)
+        raise
+    finally:
+        await session.close()
+
+
+async def get_read_session(request: Request) -> AsyncGenerator[AsyncSession, None]:
+    async with sesion_lectura(primaria=lee_de_primaria(request)) as session:
+        yield session
+
+
+async def get_write_session(request: Request) -> AsyncGenerator[AsyncSession, None]:
+    async with obtener_sesiones()() as session:
+        if configurada():
+            @event.listens_for(session.sync_session, "after_commit")
+            def _escribio(_sesion) -> None:
+                setattr(request.state, _ESTADO_PRIMARIA, time.time() + settings.db_replica_retraso_max_s)
+
+        yield session
+
+
+class PrimariaTrasEscritura:
+    """
+    Middleware ASGI puro: agrega la cookie `sigeu_primaria` a las respuestas de
+    peticiones que confirmaron una escritura (no depende del tipo de respuesta
+    que devuelva la ruta).
+    """
+
+    def __init__(self, app) -> None:
+        self.app = app
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        async def enviar(mensaje) -> None:
+            if mensaje["type"] == "http.response.start":
+                hasta = scope.get("state", {}).get(_ESTADO_PRIMARIA)
+                if hasta is not None:
+                    max_age = max(math.ceil(settings.db_replica_retraso_max_s), 1)
+                    cookie = f"{COOKIE_PRIMARIA}={hasta:.3f}; Max-Age={max_age}; Path=/; HttpOnly; SameSite=Lax"
+                    mensaje = {**mensaje, "headers": [*mensaje.get("headers", []), (b"set-cookie", cookie.encode())]}
+            await send(mensaje)
+
+        await self.app(scope, receive, enviar)
+
+
+def estado() -> Optional[Dict[str, Any]]:
+    """Pool y disponibilidad de la réplica, para /health/db; None si no hay réplica."""
+    engine = obtener_engine_lectura()
+    if engine is None:
+        return None
+    return {
+        "pool": pool.estado(engine),
+        "disponible": replica.disponible(),
+        "reintento_en_s": round(max(replica.caida_hasta - time.monotonic(), 0), 1),
+        "fallos": replica.fallos,
+        "ultimo_error": replica.ultimo_error,
+        "lecturas": replica.lecturas,
+        "lecturas_primaria": replica.lecturas_primaria,
+    }
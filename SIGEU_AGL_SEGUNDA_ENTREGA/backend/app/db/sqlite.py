@@ -0,0 +1,91 @@
+# app/db/sqlite.py
+"""
+Perfil SQLite (sqlite+aiosqlite) para pruebas, desarrollo local y benchmarks, sin servidor MySQL.
+
+    DATABASE_URL=sqlite+aiosqlite:///./sigeu.db     archivo, en modo WAL
+    DATABASE_URL=sqlite+aiosqlite://                en memoria (una conexión compartida por proceso)
+
+El esquema sale de Base.metadata (`crear_esquema`): los CHECK de los modelos
+(fechas, capacidad y los ENUM como `IN (...)`), los triggers trg_ue_* de
+5_objetos_crud_evento.sql como triggers de SQLite (ver models/usuario_evento.py)
+y la vista vi_eventos_base de los exportes (ver crud/reporte.crear_vistas).
+Con `DB_CREAR_ESQUEMA` sin definir la app lo crea al arrancar solo con SQLite.
+
+Para correr varias instancias a la vez (p. ej. pytest -n con pytest-xdist)
+la URL admite `{worker}`, que se reemplaza por PYTEST_XDIST_WORKER (o "main"):
+    DATABASE_URL=sqlite+aiosqlite:///./.pruebas/sigeu_{worker}.db
+Una base en memoria ya es propia de cada proceso.
+"""
+import os
+
+from sqlalchemy import event
+from sqlalchemy.engine import make_url
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.core.config import settings
+
+
+def es_sqlite(url: str) -> bool:
+    return make_url(url).get_backend_name() == "sqlite"
+
+
+def en_memoria(url: str) -> bool:
+    u = make_url(url)
+    return u.database in (None, "", ":memory:") or u.query.get("mode") == "memory"
+
+
+def url_por_worker(url: str) -> str:
+    """`{worker}` de la URL → base propia por worker de pytest-xdist (o por instancia)."""
+    if "{worker}" not in url:
+        return url
+    return url.replace("{worker}", os.environ.get("PYTEST_XDIST_WORKER", "main"))
+
+
+def _pragmas(dbapi_con, _registro) -> None:
+    cur = dbapi_con.cursor()
+    # las FK (ON DELETE CASCADE/RESTRICT) en SQLite se activan por conexión
+    cur.execute("PRAGMA foreign_keys=ON")
+    # con varias conexiones (o procesos) escribiendo: esperar el lock en vez de fallar
+    cur.execute(f"PRAGMA busy_timeout={int(settings.db_sqlite_busy_timeout_ms)}")
+    cur.close()
+
+
+def _pragmas_wal(dbapi_con, registro) -> None:
+    _pragmas(dbapi_con, registro)
+    cur = dbapi_con.cursor()
+    # lectores concurrentes con un escritor; NORMAL solo sincroniza en los checkpoints
+    cur.execute("PRAGMA journal_mode=WAL")
+    cur.execute("PRAGMA synchronous=NORMAL")
+    cur.close()
+
+
+def configurar(engine: AsyncEngine) -> None:
+    """PRAGMAs en cada conexión nueva; WAL solo para bases en archivo. Se puede llamar más de una vez."""
+    if engine.dialect.name != "sqlite":
+        return
+    url = engine.url.render_as_string(hide_password=False)
+    destino = _pragmas if en_memoria(url) or not settings.db_sqlite_wal else _pragmas_wal
+    if not event.contains(engine.sync_engine, "connect", destino):
+        event.listen(engine.sync_engine, "connect", destino)
+
+
+def crear_esquema_al_arrancar(url: str) -> bool:
+    return settings.db_crear_esquema if settings.db_crear_esquema is not None else es_sqlite(url)
+
+
+async def crear_esquema(engine: AsyncEngine) -> None:
+    """Tablas, índices, CHECK, triggers y vistas que falten, desde Base.metadata."""
+    from app.crud.reporte import crear_vistas
+    from app.models import Base, cargar_todos
+
+    cargar_todos()
+    try:
+        async with engine.begin() as cx:
+            await cx.run_sync(Base.metadata.create_all)
+            await cx.run_sync(crear_vistas)
+    except OperationalError:
+        # otro worker creó las mismas tablas entre la revisión y el CREATE: la segunda pasada ya las ve
+        async with engine.begin() as cx:
+            await cx.run_sync(Base.metadata.create_all)
+            await cx.run_sync(crear_vistas)
@@ -1,6 +1,66 @@
 # app/main.py
+from app.core import arranque  # primero: marca el inicio del arranque
+
+import logging
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
-from app.api.v1.routes.eventos import router as eventos_router
+from sqlalchemy.exc import SQLAlchemyError
+from app.api.v1.routers import incluir_routers
+from app.core.config import settings
+from app.core.metricas import ACTIVAS as METRICAS_ACTIVAS, MetricasHTTP
+from app.db import obtener_engine, obtener_sesiones
+from app.db.pool import calentar
+from app.db.replica import PrimariaTrasEscritura
+from app.db.session import DATABASE_URL, READ_DATABASE_URL, obtener_engine_lectura
+from app.db.sqlite import crear_esquema, crear_esquema_al_arrancar
+
+log = logging.getLogger("sigeu")
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # el engine (y el driver) se crean aquí, no al importar la app
+    with arranque.fase("engine"):
+        engine = obtener_engine()
+        engine_lectura = obtener_engine_lectura()
+    # perfil SQLite: la base (archivo nuevo o en memoria) se arma desde los modelos
+    if crear_esquema_al_arrancar(DATABASE_URL):
+        with arranque.fase("esquema"):
+            await crear_esquema(engine)
+    if engine_lectura is not None and crear_esquema_al_arrancar(READ_DATABASE_URL):
+        with arranque.fase("esquema"):
+            await crear_esquema(engine_lectura)
+    # conexiones abiertas antes de la primera petición; si la BD no está, se arranca igual
+    with arranque.fase("pool"):
+        for nombre, destino in (("primaria", engine), ("réplica", engine_lectura)):
+            if destino is None:
+                continue
+            try:
+                await calentar(destino, settings.db_calentar_conexiones)
+            except (SQLAlchemyError, OSError) as e:
+                log.warning("No se pudo calentar el pool de conexiones (%s): %s", nombre, e)
+    despachador = None
+    if settings.notificaciones_activas:
+        with arranque.fase("notificaciones"):
+            from app.services.notificaciones import despachador
+            await despachador.iniciar(obtener_sesiones())
+    arranque.marcar_listo()
+    log.info("Worker listo en %.0f ms", arranque.estado()["listo_ms"])
+    yield
+    if despachador is not None:
+        await despachador.detener()
+    await engine.dispose()
+    if engine_lectura is not None:
+        await engine_lectura.dispose()
+
+
+app = FastAPI(title="SIGEU", lifespan=lifespan)
+incluir_routers(app, perezoso=settings.arranque_perezoso)
+
+# con réplica: cookie para que quien escribió lea de la primaria un rato (app/db/replica.py)
+if settings.read_database_url:
+    app.add_middleware(PrimariaTrasEscritura)
+if METRICAS_ACTIVAS:
+    app.add_middleware(MetricasHTTP)
 
-app = FastAPI(title="SIGEU")
-app.include_router(eventos_router)  # 
+arranque.marcar("importacion")
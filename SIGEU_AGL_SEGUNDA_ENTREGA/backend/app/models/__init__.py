@@ -1,14 +1,37 @@
 # app/models/__init__.py
+import importlib
 
 from .base import Base
 
-# importa SOLO lo que exista 
-from .usuario import Usuario
-from .instalacion import Instalacion
-from .organizacion import Organizacion
-from .evento import Evento
-from .usuario_evento import UsuarioEvento
-from .evento_instalacion import EventoInstalacion
-from .evento_organizacion import EventoOrganizacion
-from .evaluacion import Evaluacion
-from .notificacion import Notificacion
+# Cada modelo se importa en su primer uso (`from app.models import Evento` o
+# `import app.models.evento`): importar un módulo del paquete ya no carga los
+# demás. Quien necesite el esquema completo en Base.metadata (create_all,
+# drop_all) llama a cargar_todos().
+_MODULOS = {
+    "Usuario": "usuario",
+    "Instalacion": "instalacion",
+    "Organizacion": "organizacion",
+    "Evento": "evento",
+    "UsuarioEvento": "usuario_evento",
+    "EventoInstalacion": "evento_instalacion",
+    "EventoOrganizacion": "evento_organizacion",
+    "Evaluacion": "evaluacion",
+    "Notificacion": "notificacion",
+    "MarcaCambios": "marca_cambios",
+}
+
+__all__ = ["Base", "cargar_todos", *_MODULOS]
+
+
+def __getattr__(nombre: str):
+    modulo = _MODULOS.get(nombre)
+    if modulo is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {nombre!r}")
+    modelo = getattr(importlib.import_module(f".{modulo}", __name__), nombre)
+    globals()[nombre] = modelo
+    return modelo
+
+
+def cargar_todos() -> None:
+    for nombre in _MODULOS:
+        __getattr__(nombre)
@@ -1,6 +1,6 @@
 # app/models/base.py
 from sqlalchemy.orm import DeclarativeBase, declared_attr
-from sqlalchemy import MetaData
+from sqlalchemy import BigInteger, Integer, MetaData
 
 naming_convention = {
     "ix": "ix_%(column_0_label)s",
@@ -11,6 +11,9 @@ naming_convention = {
 }
 metadata = MetaData(naming_convention=naming_convention)
 
+# BIGINT en MySQL; en SQLite solo INTEGER PRIMARY KEY es autoincremental (bases locales de bench)
+IdBigInt = BigInteger().with_variant(Integer(), "sqlite")
+
 class Base(DeclarativeBase):
     metadata = metadata
 
@@ -1,32 +1,68 @@
 # app/models/evento.py
-from sqlalchemy import BigInteger, String, Text, DateTime, Enum, ForeignKey, TIMESTAMP, CheckConstraint
-from sqlalchemy.orm import Mapped, mapped_column
-from app.models.base import Base
+from typing import TYPE_CHECKING
+from sqlalchemy import BigInteger, Integer, String, Text, DateTime, Enum, ForeignKey, TIMESTAMP, CheckConstraint, Index, event, func
+from sqlalchemy.orm import Mapper, Mapped, mapped_column, relationship
+from app.models.base import Base, IdBigInt
+
+if TYPE_CHECKING:
+    from app.models.evaluacion import Evaluacion
+    from app.models.evento_organizacion import EventoOrganizacion
+    from app.models.instalacion import Instalacion
+    from app.models.usuario import Usuario
+    from app.models.usuario_evento import UsuarioEvento
 
 class Evento(Base):
     __tablename__ = "evento"
-    idEvento: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True)
+    idEvento: Mapped[int] = mapped_column(IdBigInt, primary_key=True, autoincrement=True)
     nombre: Mapped[str] = mapped_column(String(180), nullable=False)
     descripcion: Mapped[str | None] = mapped_column(Text, nullable=True)
     fechaInicio: Mapped[DateTime] = mapped_column(DateTime, nullable=False)
     fechaFin: Mapped[DateTime] = mapped_column(DateTime, nullable=False)
-    estado: Mapped[str] = mapped_column(Enum('registrado','enRevision','aprobado','rechazado', name="evento_estado"), nullable=False)
-    categoria: Mapped[str] = mapped_column(Enum('academico','ludico', name="evento_categoria"), nullable=False)
+    estado: Mapped[str] = mapped_column(Enum('registrado','enRevision','aprobado','rechazado', name="evento_estado", create_constraint=True), nullable=False)
+    categoria: Mapped[str] = mapped_column(Enum('academico','ludico', name="evento_categoria", create_constraint=True), nullable=False)
     idOrganizador: Mapped[int] = mapped_column(BigInteger, ForeignKey("usuario.idUsuario", onupdate="CASCADE", ondelete="RESTRICT"), nullable=False)
     idInstalacion: Mapped[int] = mapped_column(BigInteger, ForeignKey("instalacion.idInstalacion", onupdate="CASCADE", ondelete="RESTRICT"), nullable=False)
     rutaAvalPDF: Mapped[str] = mapped_column(String(255), nullable=False)
-    fechaRegistro: Mapped[DateTime | None] = mapped_column(TIMESTAMP(timezone=False), nullable=True)
-    __table_args__ = (CheckConstraint("fechaFin >= fechaInicio", name="chk_evento_fechas"),)
-
-
-
+    # DEFAULT CURRENT_TIMESTAMP como en 1_CREAR_BASE_D.sql (también al crear el esquema en SQLite)
+    fechaRegistro: Mapped[DateTime | None] = mapped_column(TIMESTAMP(timezone=False), nullable=True, server_default=func.current_timestamp())
+    # sube en cada UPDATE del backend: ETag del evento y condición de If-Match (ver 8_version_evento.sql)
+    version: Mapped[int] = mapped_column(Integer, nullable=False, default=1, server_default="1")
+    __table_args__ = (
+        CheckConstraint("fechaFin >= fechaInicio", name="chk_evento_fechas"),
+        # índices del listado por keyset (ver 1_CREAR_BASE_D.sql)
+        Index("ix_evento_fechaInicio_idEvento", "fechaInicio", "idEvento"),
+        Index("ix_evento_estado_categoria_idEvento", "estado", "categoria", "idEvento"),
+        # reportes de aprobación y backlog por antigüedad (/api/v1/reportes)
+        Index("ix_evento_estado_fechaRegistro", "estado", "fechaRegistro"),
+    )
 
 
+    # Relaciones de solo lectura para GET /api/v1/{id}/detalle. Con lazy="raise"
+    # un acceso sin selectinload/joinedload explícito falla de inmediato (con
+    # AsyncSession la carga perezosa fallaría igual, pero más lejos) en vez de
+    # convertirse en N+1 consultas; las escrituras siguen yendo por las columnas.
+    organizador: Mapped["Usuario"] = relationship("Usuario", lazy="raise", viewonly=True)
+    instalacion: Mapped["Instalacion"] = relationship("Instalacion", lazy="raise", viewonly=True)
+    instalaciones_adicionales: Mapped[list["Instalacion"]] = relationship(
+        "Instalacion", secondary="eventoInstalacion", lazy="raise", viewonly=True,
+        order_by="Instalacion.idInstalacion",
+    )
+    organizaciones: Mapped[list["EventoOrganizacion"]] = relationship(
+        "EventoOrganizacion", lazy="raise", viewonly=True, order_by="EventoOrganizacion.idEventoOrganizacion",
+    )
+    participantes: Mapped[list["UsuarioEvento"]] = relationship(
+        "UsuarioEvento", lazy="raise", viewonly=True, order_by="UsuarioEvento.idUsuarioEvento",
+    )
+    evaluaciones: Mapped[list["Evaluacion"]] = relationship(
+        "Evaluacion", lazy="raise", viewonly=True, order_by="Evaluacion.idEvaluacion",
+    )
 
 
-    # NUEVO AJSUTE: backref hacia la tabla puente usuarioEvento
- #   usuario_eventos = relationship(
-#      "UsuarioEvento",
- #       back_populates="evento",
-  #      cascade="all, delete-orphan"
-# )
+# Los destinos de las relaciones van por nombre para que importar este módulo no
+# cargue otros seis (ver app/models/__init__.py). SQLAlchemy los resuelve al
+# configurar los mappers, en la primera consulta: justo antes se importan sus módulos.
+@event.listens_for(Mapper, "before_configured")
+def _cargar_relacionados() -> None:
+    from app.models import (  # noqa: F401
+        evaluacion, evento_instalacion, evento_organizacion, instalacion, usuario, usuario_evento,
+    )
@@ -1,5 +1,5 @@
 # app/models/evento_instalacion.py
-from sqlalchemy import BigInteger, ForeignKey, PrimaryKeyConstraint
+from sqlalchemy import DDL, BigInteger, ForeignKey, PrimaryKeyConstraint, event
 from sqlalchemy.orm import Mapped, mapped_column
 from app.models.base import Base
 
@@ -7,3 +7,26 @@ class EventoInstalacion(Base):
     __tablename__ = "eventoInstalacion"
     idEvento: Mapped[int] = mapped_column(BigInteger, ForeignKey("evento.idEvento", onupdate="CASCADE", ondelete="CASCADE"), primary_key=True)
     idInstalacion: Mapped[int] = mapped_column(BigInteger, ForeignKey("instalacion.idInstalacion", onupdate="CASCADE", ondelete="RESTRICT"), primary_key=True)
+
+
+# Triggers trg_ei_marca_* de 11_marca_cambios.sql para el esquema que se crea desde
+# los modelos en SQLite: el backend no escribe esta tabla, así que solo las
+# escrituras directas mueven la marca. SQLite (a diferencia de MySQL) dispara
+# triggers en el borrado en cascada de un evento: ese ya lo cuenta quien lo borró.
+_MARCA_SQLITE = (
+    """
+    CREATE TRIGGER IF NOT EXISTS trg_ei_marca_ins AFTER INSERT ON eventoInstalacion
+    BEGIN UPDATE marcaCambios SET contador = contador + 1 WHERE id = 1; END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS trg_ei_marca_upd AFTER UPDATE ON eventoInstalacion
+    BEGIN UPDATE marcaCambios SET contador = contador + 1 WHERE id = 1; END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS trg_ei_marca_del AFTER DELETE ON eventoInstalacion
+    FOR EACH ROW WHEN EXISTS (SELECT 1 FROM evento WHERE idEvento = OLD.idEvento)
+    BEGIN UPDATE marcaCambios SET contador = contador + 1 WHERE id = 1; END
+    """,
+)
+for _regla in _MARCA_SQLITE:
+    event.listen(EventoInstalacion.__table__, "after_create", DDL(_regla).execute_if(dialect="sqlite"))
@@ -0,0 +1,15 @@
+# app/models/marca_cambios.py
+from sqlalchemy import DDL, BigInteger, SmallInteger, event
+from sqlalchemy.orm import Mapped, mapped_column
+from app.models.base import Base
+
+# Una sola fila (id = 1): contador que sube en cada transacción que cambia eventos,
+# veredictos o salas adicionales. Los índices en memoria lo comparan para saber si
+# otro proceso escribió (ver crud/indice.py y 11_marca_cambios.sql).
+class MarcaCambios(Base):
+    __tablename__ = "marcaCambios"
+    id: Mapped[int] = mapped_column(SmallInteger, primary_key=True, autoincrement=False)
+    contador: Mapped[int] = mapped_column(BigInteger, nullable=False, server_default="0")
+
+
+event.listen(MarcaCambios.__table__, "after_create", DDL("INSERT INTO marcaCambios (id, contador) VALUES (1, 0)"))
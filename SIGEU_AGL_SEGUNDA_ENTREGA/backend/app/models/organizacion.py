@@ -1,12 +1,12 @@
 # app/models/organizacion.py
-from sqlalchemy import BigInteger, String
+from sqlalchemy import String
 from sqlalchemy.orm import Mapped, mapped_column
-from app.models.base import Base
+from app.models.base import Base, IdBigInt
 
 class Organizacion(Base):
     __tablename__ = "organizacion"
 
-    idOrganizacion: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True)
+    idOrganizacion: Mapped[int] = mapped_column(IdBigInt, primary_key=True, autoincrement=True)
     nombre: Mapped[str] = mapped_column(String(150), nullable=False)
     representanteLegal: Mapped[str] = mapped_column(String(120), nullable=False)
     actividadPrincipal: Mapped[str] = mapped_column(String(160), nullable=False)
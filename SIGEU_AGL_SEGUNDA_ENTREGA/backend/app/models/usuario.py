@@ -1,11 +1,11 @@
 # app/models/usuario.py
-from sqlalchemy import BigInteger, String, Enum
+from sqlalchemy import String, Enum
 from sqlalchemy.orm import Mapped, mapped_column
-from app.models.base import Base
+from app.models.base import Base, IdBigInt
 
 class Usuario(Base):
     __tablename__ = "usuario"
-    idUsuario: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True)
+    idUsuario: Mapped[int] = mapped_column(IdBigInt, primary_key=True, autoincrement=True)
     nombre: Mapped[str] = mapped_column(String(120), nullable=False)
-    correo: Mapped[str] = mapped_column(String(150), nullable=False)
-    rol: Mapped[str] = mapped_column(Enum('docente','estudiante','secretariaAcademica', name="usuario_rol"), nullable=False)
+    correo: Mapped[str] = mapped_column(String(150), nullable=False, unique=True)
+    rol: Mapped[str] = mapped_column(Enum('docente','estudiante','secretariaAcademica', name="usuario_rol", create_constraint=True), nullable=False)
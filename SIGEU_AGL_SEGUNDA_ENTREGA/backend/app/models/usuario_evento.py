@@ -1,18 +1,45 @@
 # app/models/usuario_evento.py
-from sqlalchemy import BigInteger, String, Enum, ForeignKey
-from sqlalchemy.orm import Mapped, mapped_column
-from app.models.base import Base
+from sqlalchemy import DDL, BigInteger, String, Enum, ForeignKey, event
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+from app.models.base import Base, IdBigInt
+from app.models.usuario import Usuario
 
 class UsuarioEvento(Base):
     __tablename__ = "usuarioEvento"
-    idUsuarioEvento: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True)
+    idUsuarioEvento: Mapped[int] = mapped_column(IdBigInt, primary_key=True, autoincrement=True)
     idUsuario: Mapped[int] = mapped_column(BigInteger, ForeignKey("usuario.idUsuario", onupdate="CASCADE", ondelete="CASCADE"), nullable=False)
     idEvento: Mapped[int] = mapped_column(BigInteger, ForeignKey("evento.idEvento", onupdate="CASCADE", ondelete="CASCADE"), nullable=False)
-    principal: Mapped[str] = mapped_column(Enum('S','N', name="ue_principal"), nullable=False)
-    tipoAval: Mapped[str | None] = mapped_column(Enum('director_programa','director_docencia', name="ue_tipo_aval"), nullable=True)
+    principal: Mapped[str] = mapped_column(Enum('S','N', name="ue_principal", create_constraint=True), nullable=False, server_default="N")
+    tipoAval: Mapped[str | None] = mapped_column(Enum('director_programa','director_docencia', name="ue_tipo_aval", create_constraint=True), nullable=True)
     avalPDF: Mapped[str | None] = mapped_column(String(255), nullable=True)
 
+    # solo lectura, para el detalle del evento (ver Evento.participantes)
+    usuario: Mapped[Usuario] = relationship(Usuario, lazy="raise", viewonly=True)
 
-    # Backrefs que esta alienados con los ajustes hechos en Usuario y Evento
- #   usuario = relationship("Usuario", back_populates="usuario_eventos")
-  #  evento  = relationship("Evento",  back_populates="usuario_eventos")
+
+# Triggers trg_ue_* de 5_objetos_crud_evento.sql para el esquema que se crea desde
+# los modelos en SQLite (ver app/db/sqlite.py); en MySQL los instala ese script.
+_REGLAS_SQLITE = (
+    """
+    CREATE TRIGGER IF NOT EXISTS trg_ue_check_rol BEFORE INSERT ON usuarioEvento
+    FOR EACH ROW WHEN (SELECT rol FROM usuario WHERE idUsuario = NEW.idUsuario) NOT IN ('docente', 'estudiante')
+    BEGIN SELECT RAISE(ABORT, 'usuarioEvento: solo roles docente/estudiante'); END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS trg_ue_unico_principal_ins BEFORE INSERT ON usuarioEvento
+    FOR EACH ROW WHEN NEW.principal = 'S' AND EXISTS (
+        SELECT 1 FROM usuarioEvento WHERE idEvento = NEW.idEvento AND principal = 'S'
+    )
+    BEGIN SELECT RAISE(ABORT, 'usuarioEvento: ya existe un principal= S para este evento'); END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS trg_ue_unico_principal_upd BEFORE UPDATE ON usuarioEvento
+    FOR EACH ROW WHEN NEW.principal = 'S' AND OLD.principal <> 'S' AND EXISTS (
+        SELECT 1 FROM usuarioEvento
+         WHERE idEvento = NEW.idEvento AND principal = 'S' AND idUsuarioEvento <> OLD.idUsuarioEvento
+    )
+    BEGIN SELECT RAISE(ABORT, 'usuarioEvento: ya existe un principal= S para este evento'); END
+    """,
+)
+for _regla in _REGLAS_SQLITE:
+    event.listen(UsuarioEvento.__table__, "after_create", DDL(_regla).execute_if(dialect="sqlite"))
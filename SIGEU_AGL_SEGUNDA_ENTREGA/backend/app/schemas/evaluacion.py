@@ -0,0 +1,44 @@
+# app/schemas/evaluacion.py
+from datetime import datetime
+from typing import Optional, Literal
+from pydantic import BaseModel, Field, ConfigDict, AliasChoices
+
+from app.schemas.evento import ErrorFila
+
+Veredicto = Literal["aprobado", "rechazado"]
+
+# veredictos por petición (cada uno genera una evaluación y una notificación)
+MAX_VEREDICTOS = 1000
+
+
+class VeredictoIn(BaseModel):
+    id_evento: int = Field(
+        validation_alias=AliasChoices("idEvento", "id_evento"),
+        serialization_alias="idEvento",
+    )
+    estado: Veredicto
+    comentarios: Optional[str] = None
+    acta_pdf: Optional[str] = Field(
+        default=None, max_length=255,
+        validation_alias=AliasChoices("actaPDF", "acta_pdf"),
+        serialization_alias="actaPDF",
+    )
+    # si no se envía, la fecha de la transacción
+    fecha_revision: Optional[datetime] = Field(
+        default=None,
+        validation_alias=AliasChoices("fechaRevision", "fecha_revision"),
+        serialization_alias="fechaRevision",
+    )
+
+    model_config = ConfigDict(populate_by_name=True, extra="ignore")
+
+
+class LoteVeredictos(BaseModel):
+    veredictos: list[VeredictoIn] = Field(min_length=1, max_length=MAX_VEREDICTOS)
+
+
+class ResultadoVeredictos(BaseModel):
+    recibidas: int
+    aplicadas: int                          # evaluaciones insertadas (= notificaciones)
+    eventos_actualizados: int
+    errores: list[ErrorFila]                # fila = posición en `veredictos` (1 = primero)
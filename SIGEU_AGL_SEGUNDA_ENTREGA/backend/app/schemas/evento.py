@@ -1,7 +1,9 @@
 # app/schemas/evento.py
 from datetime import datetime
-from typing import Optional, Literal
-from pydantic import BaseModel, Field, ConfigDict, model_validator, AliasChoices
+from typing import Annotated, List, Optional, Literal
+from pydantic import BaseModel, BeforeValidator, Field, ConfigDict, model_validator, AliasChoices
+
+from app.schemas.instalacion import InstalacionOut
 
 
 Categoria = Literal["academico", "ludico"]
@@ -95,4 +97,183 @@ class EventoOut(EventoBase):
         serialization_alias="idEvento",
     )
     estado: EstadoEvento
-    model_config = ConfigDict(populate_by_name=True, from_attributes=True)
\ No newline at end of file
+    # sube en cada modificación; el ETag del evento es esta versión
+    version: int
+    model_config = ConfigDict(populate_by_name=True, from_attributes=True)
+
+# ---------- Listado paginado (keyset) ----------
+OrdenListado = Literal["id", "fecha"]
+
+class FiltrosEvento(BaseModel):
+    # mismos filtros que tenía el listar del backend original, resueltos en SQL
+    q: Optional[str] = Field(default=None, min_length=1, max_length=100)
+    categoria: Optional[Categoria] = None
+    estado: Optional[EstadoEvento] = None
+    fecha_ini: Optional[datetime] = Field(default=None, description="fechaInicio >= (YYYY-MM-DD)")
+    fecha_fin: Optional[datetime] = Field(default=None, description="fechaFin <= (YYYY-MM-DD)")
+
+# nombres de salida de EventoOut que se pueden pedir con `fields`
+CampoEvento = Literal[
+    "idEvento", "nombre", "descripcion", "categoria", "idOrganizador", "idInstalacion",
+    "fechaInicio", "fechaFin", "rutaAvalPDF", "estado", "version",
+]
+
+def _separar_comas(valor):
+    # en query acepta x=a,b y también x=a&x=b
+    if not isinstance(valor, (str, list)):
+        return valor
+    partes = [valor] if isinstance(valor, str) else valor
+    return [c.strip() for p in partes for c in p.split(",") if c.strip()] if all(isinstance(p, str) for p in partes) else valor
+
+class PaginaEventos(FiltrosEvento):
+    # cursor opaco devuelto en next_cursor de la página anterior
+    cursor: Optional[str] = None
+    limit: int = Field(default=50, ge=1, le=500)
+    orden: OrdenListado = "id"
+    # proyección: solo estas columnas se leen de la BD y se devuelven
+    fields: Optional[Annotated[List[CampoEvento], BeforeValidator(_separar_comas)]] = Field(
+        default=None, min_length=1, description="campos de cada item separados por coma (p. ej. idEvento,nombre,estado)",
+    )
+
+class EventoPagina(BaseModel):
+    items: list[EventoOut]
+    next_cursor: Optional[str] = None
+
+
+# ---------- Lectura por lote ----------
+MAX_IDS_GET = 200       # límite práctico del largo de la URL
+MAX_IDS_POST = 2000
+
+class LoteIdsQuery(BaseModel):
+    ids: Annotated[List[int], BeforeValidator(_separar_comas)] = Field(
+        min_length=1, max_length=MAX_IDS_GET, description="ids separados por coma (p. ej. 3,1,2)",
+    )
+
+class LoteIds(BaseModel):
+    ids: List[int] = Field(min_length=1, max_length=MAX_IDS_POST)
+
+class EventosPorId(BaseModel):
+    items: list[EventoOut]      # en el orden pedido, sin repetidos
+    faltantes: list[int]        # ids pedidos que no existen
+
+
+
+# ---------- Detalle (evento con sus relaciones) ----------
+class UsuarioResumen(BaseModel):
+    id_usuario: int = Field(
+        validation_alias=AliasChoices("idUsuario", "id_usuario"),
+        serialization_alias="idUsuario",
+    )
+    nombre: str
+    correo: str
+    rol: str
+    model_config = ConfigDict(populate_by_name=True, from_attributes=True)
+
+class ParticipanteOut(BaseModel):
+    # fila de usuarioEvento con su usuario
+    usuario: UsuarioResumen
+    principal: Literal["S", "N"]
+    tipo_aval: Optional[str] = Field(
+        default=None,
+        validation_alias=AliasChoices("tipoAval", "tipo_aval"),
+        serialization_alias="tipoAval",
+    )
+    aval_pdf: Optional[str] = Field(
+        default=None,
+        validation_alias=AliasChoices("avalPDF", "aval_pdf"),
+        serialization_alias="avalPDF",
+    )
+    model_config = ConfigDict(populate_by_name=True, from_attributes=True)
+
+class OrganizacionResumen(BaseModel):
+    id_organizacion: int = Field(
+        validation_alias=AliasChoices("idOrganizacion", "id_organizacion"),
+        serialization_alias="idOrganizacion",
+    )
+    nombre: str
+    representante_legal: str = Field(
+        validation_alias=AliasChoices("representanteLegal", "representante_legal"),
+        serialization_alias="representanteLegal",
+    )
+    sector_economico: str = Field(
+        validation_alias=AliasChoices("sectorEconomico", "sector_economico"),
+        serialization_alias="sectorEconomico",
+    )
+    telefono: str
+    ubicacion: str
+    model_config = ConfigDict(populate_by_name=True, from_attributes=True)
+
+class OrganizacionEventoOut(BaseModel):
+    # fila de eventoOrganizacion con su organización
+    organizacion: OrganizacionResumen
+    participante: str
+    es_representante_legal: bool = Field(
+        validation_alias=AliasChoices("esRepresentanteLegal", "es_representante_legal"),
+        serialization_alias="esRepresentanteLegal",
+    )
+    certificado_pdf: Optional[str] = Field(
+        default=None,
+        validation_alias=AliasChoices("certificadoPDF", "certificado_pdf"),
+        serialization_alias="certificadoPDF",
+    )
+    model_config = ConfigDict(populate_by_name=True, from_attributes=True)
+
+class EvaluacionResumen(BaseModel):
+    id_evaluacion: int = Field(
+        validation_alias=AliasChoices("idEvaluacion", "id_evaluacion"),
+        serialization_alias="idEvaluacion",
+    )
+    estado: Literal["aprobado", "rechazado"]
+    comentarios: Optional[str] = None
+    acta_pdf: Optional[str] = Field(
+        default=None,
+        validation_alias=AliasChoices("actaPDF", "acta_pdf"),
+        serialization_alias="actaPDF",
+    )
+    fecha_revision: Optional[datetime] = Field(
+        default=None,
+        validation_alias=AliasChoices("fechaRevision", "fecha_revision"),
+        serialization_alias="fechaRevision",
+    )
+    model_config = ConfigDict(populate_by_name=True, from_attributes=True)
+
+class EventoDetalle(EventoOut):
+    organizador: UsuarioResumen
+    instalacion: InstalacionOut
+    instalaciones_adicionales: list[InstalacionOut] = Field(serialization_alias="instalacionesAdicionales")
+    organizaciones: list[OrganizacionEventoOut]
+    participantes: list[ParticipanteOut]
+    evaluaciones: list[EvaluacionResumen]       # de la más antigua a la más reciente
+
+class DetallesPorId(BaseModel):
+    items: list[EventoDetalle]  # en el orden pedido, sin repetidos
+    faltantes: list[int]        # ids pedidos que no existen
+
+
+# ---------- Carga masiva ----------
+class ErrorFila(BaseModel):
+    fila: int                   # número de registro en el archivo (1 = primer dato)
+    codigo: int                 # status HTTP equivalente: 422 validación, 409 integridad/solapamiento
+    detalle: str
+
+class ResultadoCarga(BaseModel):
+    recibidas: int
+    insertadas: int
+    errores: list[ErrorFila]
+
+
+# ---------- Búsqueda de texto ----------
+class BusquedaEventos(BaseModel):
+    q: str = Field(min_length=1, max_length=100, description="términos; el último se toma como prefijo")
+    categoria: Optional[Categoria] = None
+    estado: Optional[EstadoEvento] = None
+    cursor: Optional[str] = None
+    limit: int = Field(default=20, ge=1, le=100)
+
+class EventoEncontrado(EventoOut):
+    puntaje: float
+
+class ResultadoBusqueda(BaseModel):
+    items: list[EventoEncontrado]
+    total: int                  # coincidencias con los filtros (todas las páginas)
+    next_cursor: Optional[str] = None
@@ -0,0 +1,76 @@
+# app/schemas/instalacion.py
+from datetime import date, datetime
+from typing import Literal, Optional
+from pydantic import BaseModel, Field, ConfigDict, model_validator, AliasChoices
+
+TipoInstalacion = Literal["salon", "laboratorio", "auditorio", "otro"]
+
+
+class ConflictoOut(BaseModel):
+    # mismo contenido que la vista v_conflictos_instalacion, serializado en camel
+    id_instalacion: int = Field(serialization_alias="idInstalacion")
+    id_evento1: int = Field(serialization_alias="idEvento1")
+    id_evento2: int = Field(serialization_alias="idEvento2")
+    choque_inicio: datetime = Field(serialization_alias="choqueInicio")
+    choque_fin: datetime = Field(serialization_alias="choqueFin")
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+# ---------- Disponibilidad ----------
+class Intervalo(BaseModel):
+    desde: datetime
+    hasta: datetime
+
+    @model_validator(mode="after")
+    def _orden(self):
+        if self.hasta <= self.desde:
+            raise ValueError("hasta debe ser posterior a desde")
+        return self
+
+class FiltrosDisponibles(Intervalo):
+    capacidad: Optional[int] = Field(default=None, ge=1, description="capacidad mínima")
+    tipo: Optional[TipoInstalacion] = None
+
+class FiltrosHuecos(Intervalo):
+    duracion_min: Optional[int] = Field(default=None, ge=1, description="solo huecos de al menos estos minutos")
+
+class InstalacionOut(BaseModel):
+    # lee de la agenda ('id_instalacion') o del ORM ('idInstalacion', en el detalle de evento)
+    id_instalacion: int = Field(
+        validation_alias=AliasChoices("idInstalacion", "id_instalacion"),
+        serialization_alias="idInstalacion",
+    )
+    nombre: str
+    tipo: TipoInstalacion
+    capacidad: int
+    ubicacion: str
+
+    model_config = ConfigDict(from_attributes=True)
+
+class HuecoOut(BaseModel):
+    inicio: datetime
+    fin: datetime
+    minutos: int
+
+
+# ---------- Calendario de ocupación ----------
+class FiltrosOcupacion(BaseModel):
+    mes: str = Field(pattern=r"^\d{4}-(0[1-9]|1[0-2])$", description="YYYY-MM")
+
+class DiaOcupacionOut(BaseModel):
+    dia: date
+    minutos: int                # suma de la duración de los eventos dentro del día
+    eventos: int
+    # bit i = franja [i*30, (i+1)*30) minutos desde las 00:00 con al menos un evento
+    franjas: int
+
+class OcupacionInstalacionOut(BaseModel):
+    id_instalacion: int = Field(serialization_alias="idInstalacion")
+    nombre: str
+    dias: list[DiaOcupacionOut]  # solo los días con reservas
+
+class OcupacionMes(BaseModel):
+    mes: str
+    minutos_franja: int = Field(serialization_alias="minutosFranja")
+    instalaciones: list[OcupacionInstalacionOut]
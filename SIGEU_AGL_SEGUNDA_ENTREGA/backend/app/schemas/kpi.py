@@ -0,0 +1,105 @@
+# app/schemas/kpi.py
+from datetime import date, datetime
+from typing import Annotated, List, Optional
+from pydantic import BaseModel, BeforeValidator, Field, model_validator
+
+from app.schemas.evaluacion import Veredicto
+from app.schemas.evento import Categoria
+
+# Los nombres de campo siguen los alias de las Consultas de 4_consultas_avanzadas.sql
+
+
+class AprobacionGlobal(BaseModel):
+    aprobados: int
+    evaluados: int
+    tasa_aprobacion_pct: Optional[float]
+    pendientes: int
+
+class AprobacionOrganizador(BaseModel):
+    id_usuario: int = Field(serialization_alias="idUsuario")
+    nombre: Optional[str]
+    aprobados: int
+    evaluados: int
+    tasa_aprobacion_pct: Optional[float]
+
+class AprobacionCategoria(BaseModel):
+    categoria: str
+    aprobados: int
+    evaluados: int
+    tasa_aprobacion_pct: Optional[float]
+
+class BacklogAntiguedad(BaseModel):
+    pendientes_0a2d: int
+    pendientes_3a7d: int
+    pendientes_8a14d: int
+    pendientes_mas14d: int
+
+class HorasInstalacion(BaseModel):
+    id_instalacion: int = Field(serialization_alias="idInstalacion")
+    nombre: Optional[str]
+    horas_reservadas_30d: int
+
+class SerieMensual(BaseModel):
+    anio: int
+    mes: str
+    categoria: str
+    total_eventos: int
+
+class ResultadoReconstruccion(BaseModel):
+    eventos: int
+    verificado: bool            # había agregados incrementales contra los cuales comparar
+    consistente: bool
+    diferencias: list[str]
+
+
+# ---------- Reportes con filtros (/api/v1/reportes, en SQL) ----------
+class FiltrosReporte(BaseModel):
+    # cohorte: eventos registrados (fechaRegistro) en [desde, hasta)
+    desde: Optional[datetime] = Field(default=None, description="fechaRegistro >= (YYYY-MM-DD)")
+    hasta: Optional[datetime] = Field(default=None, description="fechaRegistro < (YYYY-MM-DD)")
+    categoria: Optional[Categoria] = None
+    id_organizador: Optional[int] = Field(default=None, ge=1)
+
+    @model_validator(mode="after")
+    def _orden(self):
+        if self.desde and self.hasta and self.hasta <= self.desde:
+            raise ValueError("hasta debe ser posterior a desde")
+        return self
+
+class FiltrosOrganizadores(FiltrosReporte):
+    limit: int = Field(default=50, ge=1, le=500)
+
+def _cortes(valor):
+    # "2,7,14" -> [2, 7, 14]
+    if isinstance(valor, str):
+        return [p.strip() for p in valor.split(",") if p.strip()]
+    return valor
+
+class FiltrosBacklog(FiltrosReporte):
+    # último día de cada tramo; el último tramo va de cortes[-1] + 1 en adelante
+    cortes: Annotated[List[int], BeforeValidator(_cortes)] = Field(
+        default=[2, 7, 14], min_length=1, max_length=12, description="días separados por coma, crecientes",
+    )
+
+    @model_validator(mode="after")
+    def _crecientes(self):
+        if self.cortes[0] < 0 or any(b <= a for a, b in zip(self.cortes, self.cortes[1:])):
+            raise ValueError("cortes debe ser una lista creciente de días >= 0")
+        return self
+
+class TiempoDecision(BaseModel):
+    # Consulta 04
+    estado: Veredicto
+    evaluaciones: int
+    horas_promedio: Optional[float]
+
+class TramoBacklog(BaseModel):
+    dias_min: int
+    dias_max: Optional[int]     # None = sin tope
+    pendientes: int
+
+class BacklogPorTramos(BaseModel):
+    # Consulta 07 con tramos configurables; días = hoy - fechaRegistro
+    hoy: date
+    total: int
+    tramos: list[TramoBacklog]
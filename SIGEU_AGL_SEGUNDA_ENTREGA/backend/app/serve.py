@@ -0,0 +1,184 @@
+# app/serve.py
+"""
+Servidor de producción: `python -m app.serve` (desde backend/).
+
+- Workers: `SERVIDOR_WORKERS`, o uno por núcleo disponible (afinidad de CPU y
+  cuota del contenedor en cgroup v2).
+- Bucle uvloop y parser httptools cuando están instalados (si no, asyncio y h11).
+- Keep-alive, backlog, límite de concurrencia y espera de apagado desde la
+  configuración (`SERVIDOR_*`).
+- Pool por worker: `DB_POOL_SIZE` y `DB_MAX_OVERFLOW` se recortan para que
+  workers + 1 (el de reemplazo durante una recarga) no abran más de
+  `DB_CONEXIONES_MAX` conexiones en total. Los workers lo reciben por entorno.
+- Índices en memoria: cada worker tiene su agenda, KPIs y búsqueda. Con más de
+  uno, `INDICES_VERIFICAR_S` (si no se definió) pasa a 2 s para que vean las
+  escrituras de los demás; los solapamientos de horario se verifican además en
+  la transacción de cada escritura (ver AgendaInstalaciones.sincronizar).
+- Recarga sin cortes (`kill -HUP <pid del supervisor>`): los workers se
+  reemplazan de a uno; el nuevo arranca, corre el lifespan y recién entonces se
+  detiene el viejo, que termina sus peticiones en curso. Si el nuevo no llega a
+  estar listo, la recarga se aborta y siguen los workers anteriores.
+"""
+import argparse
+import importlib.util
+import logging
+import math
+import multiprocessing
+import os
+from functools import partial
+from pathlib import Path
+from socket import socket
+from typing import List, Optional, Tuple
+
+import uvicorn
+from uvicorn.supervisors.multiprocess import Multiprocess, Process
+
+from app.core.config import settings
+
+log = logging.getLogger("uvicorn.error")
+
+_spawn = multiprocessing.get_context("spawn")
+
+
+def nucleos() -> int:
+    try:
+        n = len(os.sched_getaffinity(0))
+    except AttributeError:  # macOS, Windows
+        n = os.cpu_count() or 1
+    # cuota de CPU del contenedor: "max 100000" (sin límite) o "200000 100000" (2 núcleos)
+    try:
+        cuota, periodo = Path("/sys/fs/cgroup/cpu.max").read_text().split()
+        if cuota != "max":
+            n = min(n, max(1, math.ceil(int(cuota) / int(periodo))))
+    except (OSError, ValueError):
+        pass
+    return n
+
+
+def repartir_conexiones(tope: int, workers: int, pool_size: int, max_overflow: int) -> Tuple[int, int, int]:
+    """(workers, pool_size, max_overflow) por worker con (workers + 1) × (pool + overflow) ≤ tope."""
+    workers = max(1, min(workers, tope - 1))
+    por_worker = max(1, tope // (workers + 1))
+    tamano = min(pool_size, por_worker)
+    return workers, tamano, min(max_overflow, por_worker - tamano)
+
+
+def _disponible(modulo: str) -> bool:
+    return importlib.util.find_spec(modulo) is not None
+
+
+# ---------- workers ----------
+class _Servidor(uvicorn.Server):
+    def __init__(self, config: uvicorn.Config, listo) -> None:
+        super().__init__(config)
+        self._listo = listo
+
+    async def startup(self, sockets: Optional[List[socket]] = None) -> None:
+        await super().startup(sockets)
+        # lifespan terminado y escuchando: el supervisor ya puede bajar al worker anterior
+        if self.started and self._listo is not None:
+            self._listo.set()
+
+
+def _trabajador(config: uvicorn.Config, listo, sockets: Optional[List[socket]] = None) -> None:
+    _Servidor(config, listo).run(sockets=sockets)
+
+
+class Supervisor(Multiprocess):
+    """Multiprocess de uvicorn con recarga escalonada y sin crecer por encima del tope de conexiones."""
+
+    def __init__(self, config: uvicorn.Config, sockets: List[socket], max_workers: int) -> None:
+        super().__init__(config, target=partial(_trabajador, config, None), sockets=sockets)
+        self.max_workers = max_workers
+
+    def handle_hup(self) -> None:
+        log.info("SIGHUP: recarga escalonada de %d workers", len(self.processes))
+        for idx, viejo in enumerate(list(self.processes)):
+            listo = _spawn.Event()
+            nuevo = Process(self.config, partial(_trabajador, self.config, listo), self.sockets)
+            nuevo.start()
+            if not self._esperar_listo(nuevo, listo):
+                log.error("El worker nuevo no quedó listo; se aborta la recarga y siguen los anteriores")
+                nuevo.terminate()
+                nuevo.join()
+                return
+            self.processes[idx] = nuevo
+            viejo.terminate()
+            viejo.join()
+        log.info("Recarga completa")
+
+    @staticmethod
+    def _esperar_listo(proceso: Process, listo) -> bool:
+        esperado = 0.0
+        while esperado < settings.servidor_espera_listo_s:
+            if listo.wait(0.5):
+                return True
+            if not proceso.process.is_alive():
+                return False
+            esperado += 0.5
+        return False
+
+    def handle_ttin(self) -> None:
+        # el pool de cada worker se dimensionó al arrancar: uno más pasaría el tope de conexiones
+        if self.processes_num >= self.max_workers:
+            log.warning("SIGTTIN ignorado: %d workers es el máximo para DB_CONEXIONES_MAX", self.max_workers)
+            return
+        super().handle_ttin()
+
+
+# ---------- arranque ----------
+def configurar(args: argparse.Namespace) -> Tuple[uvicorn.Config, int]:
+    pedidos = args.workers or settings.servidor_workers or nucleos()
+    workers, tamano, desborde = repartir_conexiones(
+        args.conexiones_max, pedidos, settings.db_pool_size, settings.db_max_overflow,
+    )
+    # los workers se crean con spawn y leen la configuración del entorno al importar la app
+    os.environ["DB_POOL_SIZE"] = str(tamano)
+    os.environ["DB_MAX_OVERFLOW"] = str(desborde)
+    if workers > 1 and "indices_verificar_s" not in settings.model_fields_set:
+        os.environ["INDICES_VERIFICAR_S"] = "2"
+
+    loop = "uvloop" if _disponible("uvloop") else "asyncio"
+    http = "httptools" if _disponible("httptools") else "h11"
+    config = uvicorn.Config(
+        "app.main:app",
+        host=args.host,
+        port=args.puerto,
+        workers=workers,
+        loop=loop,
+        http=http,
+        backlog=settings.servidor_backlog,
+        timeout_keep_alive=settings.servidor_keep_alive_s,
+        limit_concurrency=settings.servidor_limite_concurrencia,
+        timeout_graceful_shutdown=settings.servidor_apagado_s,
+        access_log=args.access_log,
+        log_level=args.log_level,
+        server_header=False,
+    )
+    config.configure_logging()
+    if workers < pedidos:
+        log.warning("DB_CONEXIONES_MAX=%d alcanza para %d workers (se pidieron %d)", args.conexiones_max, workers, pedidos)
+    log.info(
+        "%d workers (%s/%s), pool %d+%d por worker, tope %d conexiones",
+        workers, loop, http, tamano, desborde, args.conexiones_max,
+    )
+    return config, workers
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description="Servidor de producción de SIGEU (uvicorn multi-worker)")
+    ap.add_argument("--host", default=settings.servidor_host)
+    ap.add_argument("--puerto", type=int, default=settings.servidor_puerto)
+    ap.add_argument("--workers", type=int, default=0, help="0 = SERVIDOR_WORKERS o uno por núcleo")
+    ap.add_argument("--conexiones-max", type=int, default=settings.db_conexiones_max)
+    ap.add_argument("--access-log", action="store_true", help="una línea por petición (cuesta CPU)")
+    ap.add_argument("--log-level", default="info")
+    args = ap.parse_args()
+
+    config, workers = configurar(args)
+    sock = config.bind_socket()
+    Supervisor(config, sockets=[sock], max_workers=workers).run()
+
+
+if __name__ == "__main__":
+    main()
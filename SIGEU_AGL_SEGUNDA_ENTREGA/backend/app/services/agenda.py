@@ -0,0 +1,336 @@
+# app/services/agenda.py
+"""
+Agenda de instalaciones en memoria.
+
+Por cada idInstalacion se guarda una lista de reservas (inicio, idEvento, fin)
+ordenada por inicio, construida desde `evento` (instalación por defecto) +
+`eventoInstalacion` (adicionales). Con bisect y la duración máxima de la sala,
+verificar si un horario choca cuesta O(log n + k) en lugar del self-join de la
+Consulta 08/09, que compara todos los pares de eventos de la instalación.
+El catálogo de instalaciones (capacidad, tipo) se carga junto con las reservas
+para responder disponibilidad y huecos libres sin ir a la BD, y con cada reserva
+se mantiene el calendario de ocupación por día (ver services/ocupacion.py).
+"""
+import asyncio
+import heapq
+from bisect import bisect_left, insort
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta
+from typing import AsyncIterator, Dict, FrozenSet, Iterable, List, NamedTuple, Optional, Tuple
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.crud import agenda as crud
+from app.services.indice import IndiceEnMemoria
+from app.services.ocupacion import CalendarioOcupacion, DiaOcupacion
+
+
+class Reserva(NamedTuple):
+    id_instalacion: int                 # instalación por defecto (evento.idInstalacion)
+    adicionales: FrozenSet[int]         # eventoInstalacion
+    inicio: datetime
+    fin: datetime
+
+    @property
+    def instalaciones(self) -> FrozenSet[int]:
+        return self.adicionales | {self.id_instalacion}
+
+
+class Instalacion(NamedTuple):
+    id_instalacion: int
+    nombre: str
+    tipo: str
+    capacidad: int
+    ubicacion: str
+
+
+class Hueco(NamedTuple):
+    inicio: datetime
+    fin: datetime
+
+
+class Conflicto(NamedTuple):
+    id_instalacion: int
+    id_evento1: int
+    id_evento2: int
+    choque_inicio: datetime
+    choque_fin: datetime
+
+
+def _sin_zona(dt: datetime) -> datetime:
+    # la BD guarda DATETIME sin zona; se compara igual que lo haría MySQL
+    return dt.replace(tzinfo=None) if dt.tzinfo else dt
+
+
+class _Sala:
+    __slots__ = ("reservas", "max_duracion")
+
+    def __init__(self) -> None:
+        self.reservas: List[Tuple[datetime, int, datetime]] = []  # (inicio, idEvento, fin)
+        # cota para saber hasta dónde retroceder desde el punto de búsqueda;
+        # no se reduce al quitar reservas (solo la hace conservadora)
+        self.max_duracion = timedelta(0)
+
+    def agregar(self, id_evento: int, inicio: datetime, fin: datetime) -> None:
+        insort(self.reservas, (inicio, id_evento, fin))
+        if fin - inicio > self.max_duracion:
+            self.max_duracion = fin - inicio
+
+    def quitar(self, id_evento: int, inicio: datetime) -> None:
+        i = bisect_left(self.reservas, (inicio, id_evento))
+        if i < len(self.reservas) and self.reservas[i][1] == id_evento:
+            del self.reservas[i]
+
+    def solapadas(self, inicio: datetime, fin: datetime) -> Iterable[Tuple[datetime, int, datetime]]:
+        # reservas r con r.inicio < fin y r.fin > inicio (misma regla que la Consulta 08)
+        j = bisect_left(self.reservas, (fin,)) - 1
+        limite = inicio - self.max_duracion
+        while j >= 0 and self.reservas[j][0] > limite:
+            r = self.reservas[j]
+            if r[2] > inicio:
+                yield r
+            j -= 1
+
+    def libres(self, desde: datetime, hasta: datetime) -> Iterable[Hueco]:
+        # barrido por inicio: cada reserva corre el borde libre hasta su fin
+        borde = desde
+        i = bisect_left(self.reservas, (desde - self.max_duracion,))
+        for inicio, _, fin in self.reservas[i:]:
+            if inicio >= hasta:
+                break
+            if inicio > borde:
+                yield Hueco(borde, inicio)
+            if fin > borde:
+                borde = fin
+        if borde < hasta:
+            yield Hueco(borde, hasta)
+
+
+class AgendaInstalaciones(IndiceEnMemoria):
+    def __init__(self) -> None:
+        super().__init__()
+        self._salas: Dict[int, _Sala] = {}
+        self._eventos: Dict[int, Reserva] = {}
+        self._ocupacion = CalendarioOcupacion()
+        # catálogo ordenado por (capacidad, id) para filtrar por capacidad mínima con bisect
+        self._instalaciones: Dict[int, Instalacion] = {}
+        self._por_capacidad: List[Instalacion] = []
+        self._capacidades: List[int] = []
+        self._locks: Dict[int, asyncio.Lock] = {}
+
+    # ---------- construcción ----------
+    async def _cargar(self, session: AsyncSession) -> None:
+        principales = await crud.reservas_principales(session)
+        adicionales = await crud.instalaciones_adicionales(session)
+        instalaciones = await crud.instalaciones(session)
+        self.cargar_desde(principales, adicionales, instalaciones)
+
+    def cargar_desde(
+        self,
+        principales: Iterable[Tuple[int, int, datetime, datetime]],
+        adicionales: Iterable[Tuple[int, int]] = (),
+        instalaciones: Iterable[Tuple[int, str, str, int, str]] = (),
+    ) -> None:
+        extra: Dict[int, set] = {}
+        for id_evento, id_inst in adicionales:
+            extra.setdefault(id_evento, set()).add(id_inst)
+
+        salas: Dict[int, _Sala] = {}
+        eventos: Dict[int, Reserva] = {}
+        ocupacion = CalendarioOcupacion()
+        for id_evento, id_inst, inicio, fin in principales:
+            reserva = Reserva(id_inst, frozenset(extra.get(id_evento, ())), inicio, fin)
+            eventos[id_evento] = reserva
+            for inst in reserva.instalaciones:
+                sala = salas.setdefault(inst, _Sala())
+                sala.reservas.append((inicio, id_evento, fin))
+                if fin - inicio > sala.max_duracion:
+                    sala.max_duracion = fin - inicio
+                ocupacion.agregar(inst, inicio, fin)
+        for sala in salas.values():
+            sala.reservas.sort()
+
+        catalogo = sorted((Instalacion(*f) for f in instalaciones), key=lambda i: (i.capacidad, i.id_instalacion))
+        self._instalaciones = {i.id_instalacion: i for i in catalogo}
+        self._por_capacidad = catalogo
+        self._capacidades = [i.capacidad for i in catalogo]
+
+        self._salas, self._eventos, self._ocupacion = salas, eventos, ocupacion
+        self._cargado = True
+
+    # ---------- sincronización con escrituras ----------
+    def registrar(
+        self,
+        id_evento: int,
+        id_instalacion: int,
+        inicio: datetime,
+        fin: datetime,
+        adicionales: Optional[FrozenSet[int]] = None,
+    ) -> None:
+        self._marcar_cambio()
+        if not self._cargado:
+            return
+        anterior = self._eventos.get(id_evento)
+        if adicionales is None:
+            adicionales = anterior.adicionales if anterior else frozenset()
+        self.quitar(id_evento)
+        reserva = Reserva(id_instalacion, adicionales, _sin_zona(inicio), _sin_zona(fin))
+        self._eventos[id_evento] = reserva
+        for inst in reserva.instalaciones:
+            self._salas.setdefault(inst, _Sala()).agregar(id_evento, reserva.inicio, reserva.fin)
+            self._ocupacion.agregar(inst, reserva.inicio, reserva.fin)
+
+    def quitar(self, id_evento: int) -> None:
+        self._marcar_cambio()
+        reserva = self._eventos.pop(id_evento, None)
+        if reserva is None:
+            return
+        for inst in reserva.instalaciones:
+            sala = self._salas.get(inst)
+            if sala:
+                sala.quitar(id_evento, reserva.inicio)
+                self._ocupacion.quitar(inst, reserva.inicio, reserva.fin, sala.solapadas)
+
+    # ---------- consultas ----------
+    def reserva(self, id_evento: int) -> Optional[Reserva]:
+        return self._eventos.get(id_evento)
+
+    def conflictos(
+        self,
+        instalaciones: Iterable[int],
+        inicio: datetime,
+        fin: datetime,
+        excluir: Optional[int] = None,
+    ) -> List[Tuple[int, int]]:
+        """(idInstalacion, idEvento) de las reservas que chocan con [inicio, fin)."""
+        inicio, fin = _sin_zona(inicio), _sin_zona(fin)
+        encontrados = []
+        for inst in instalaciones:
+            sala = self._salas.get(inst)
+            if not sala:
+                continue
+            for _, id_evento, _ in sala.solapadas(inicio, fin):
+                if id_evento != excluir:
+                    encontrados.append((inst, id_evento))
+        return encontrados
+
+    def instalacion(self, id_instalacion: int) -> Optional[Instalacion]:
+        return self._instalaciones.get(id_instalacion)
+
+    def disponibles(
+        self,
+        desde: datetime,
+        hasta: datetime,
+        capacidad: Optional[int] = None,
+        tipo: Optional[str] = None,
+    ) -> List[Instalacion]:
+        """Instalaciones sin reservas que se solapen con [desde, hasta), de menor a mayor capacidad."""
+        desde, hasta = _sin_zona(desde), _sin_zona(hasta)
+        i = bisect_left(self._capacidades, capacidad) if capacidad else 0
+        salida = []
+        for inst in self._por_capacidad[i:]:
+            if tipo is not None and inst.tipo != tipo:
+                continue
+            sala = self._salas.get(inst.id_instalacion)
+            if sala is None or next(sala.solapadas(desde, hasta), None) is None:
+                salida.append(inst)
+        return salida
+
+    def huecos(self, id_instalacion: int, desde: datetime, hasta: datetime) -> List[Hueco]:
+        """Ventanas libres de la instalación dentro de [desde, hasta), en orden."""
+        desde, hasta = _sin_zona(desde), _sin_zona(hasta)
+        sala = self._salas.get(id_instalacion)
+        if sala is None:
+            return [Hueco(desde, hasta)]
+        return list(sala.libres(desde, hasta))
+
+    def ocupacion(self, anio: int, mes: int) -> List[Tuple[Instalacion, List[DiaOcupacion]]]:
+        """Todas las instalaciones del catálogo (por id) con sus días ocupados del mes."""
+        return [
+            (inst, self._ocupacion.mes(id_inst, anio, mes))
+            for id_inst, inst in sorted(self._instalaciones.items())
+        ]
+
+    def conflictos_instalacion(
+        self,
+        id_instalacion: int,
+        desde: Optional[datetime] = None,
+        hasta: Optional[datetime] = None,
+    ) -> List[Conflicto]:
+        """Pares de eventos que se solapan en la sala (equivale a v_conflictos_instalacion)."""
+        sala = self._salas.get(id_instalacion)
+        if not sala:
+            return []
+        reservas = sala.reservas
+        i = 0
+        if desde is not None:
+            desde = _sin_zona(desde)
+            i = bisect_left(reservas, (desde - sala.max_duracion,))
+        if hasta is not None:
+            hasta = _sin_zona(hasta)
+
+        # barrido por inicio con un heap de reservas activas ordenado por fin
+        activos: List[Tuple[datetime, int, datetime]] = []
+        salida: List[Conflicto] = []
+        for inicio, id_evento, fin in reservas[i:]:
+            if hasta is not None and inicio >= hasta:
+                break
+            while activos and activos[0][0] <= inicio:
+                heapq.heappop(activos)
+            for fin2, id2, _ in activos:
+                choque_fin = min(fin, fin2)
+                if desde is not None and choque_fin <= desde:
+                    continue
+                salida.append(Conflicto(
+                    id_instalacion, min(id_evento, id2), max(id_evento, id2), inicio, choque_fin,
+                ))
+            heapq.heappush(activos, (fin, id_evento, inicio))
+        return salida
+
+    # ---------- exclusión entre escrituras del mismo proceso ----------
+    @asynccontextmanager
+    async def bloqueo(self, instalaciones: Iterable[int]) -> AsyncIterator[None]:
+        # verificar + escribir + registrar sin que otra petición reserve la sala en medio;
+        # se toman en orden para no generar interbloqueos
+        locks = [self._locks.setdefault(i, asyncio.Lock()) for i in sorted(set(instalaciones))]
+        for lock in locks:
+            await lock.acquire()
+        try:
+            yield
+        finally:
+            for lock in reversed(locks):
+                lock.release()
+
+    # ---------- exclusión entre procesos ----------
+    async def sincronizar(
+        self, session: AsyncSession, instalaciones: Iterable[int], desde: datetime, hasta: datetime,
+    ) -> bool:
+        """
+        Dentro de la transacción de una escritura y antes de verificar el horario:
+        bloquea las salas en la BD hasta el commit y deja la agenda de esas salas en
+        [desde, hasta) igual a la BD: agrega o corrige lo que confirmó otro proceso
+        (otro worker) y quita lo que ese proceso eliminó, rechazó o movió fuera de
+        la ventana. Así la verificación en memoria vale para todos los workers.
+        Devuelve True si la agenda estaba atrasada.
+        """
+        salas = set(instalaciones)
+        await crud.bloquear_instalaciones(session, salas)
+        principales, adicionales = await crud.reservas_en(session, salas, desde, hasta)
+        extra: Dict[int, set] = {}
+        for id_evento, id_inst in adicionales:
+            extra.setdefault(id_evento, set()).add(id_inst)
+        atrasada = False
+        for id_evento, id_inst, inicio, fin in principales:
+            reserva = Reserva(id_inst, frozenset(extra.get(id_evento, ())), _sin_zona(inicio), _sin_zona(fin))
+            if self._eventos.get(id_evento) != reserva:
+                self.registrar(id_evento, id_inst, inicio, fin, reserva.adicionales)
+                atrasada = True
+        # ids negativos: filas de una carga masiva aún sin id real (services/carga.py)
+        en_bd = {r[0] for r in principales}
+        sobrantes = {i for _, i in self.conflictos(salas, desde, hasta) if i > 0 and i not in en_bd}
+        for id_evento in sobrantes:
+            self.quitar(id_evento)
+        return atrasada or bool(sobrantes)
+
+
+# instancia del proceso
+agenda = AgendaInstalaciones()
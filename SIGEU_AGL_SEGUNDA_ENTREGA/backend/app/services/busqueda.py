@@ -0,0 +1,342 @@
+# app/services/busqueda.py
+"""
+Índice invertido en memoria sobre evento.nombre y evento.descripcion.
+
+`LIKE '%q%'` sobre un TEXT no puede usar índices: cada búsqueda recorre la
+tabla. Aquí cada término normalizado (minúsculas, sin tildes, sin palabras
+vacías del español) apunta a los eventos que lo contienen, con su peso BM25
+precalculado (el nombre pesa el doble que la descripción). Una consulta toca
+solo las listas de sus términos; el último término se toma como prefijo para
+buscar mientras se escribe. Con muchas coincidencias no se puntúan todas: los
+términos frecuentes guardan su lista ordenada por peso y se lee solo el
+comienzo.
+"""
+import base64
+import binascii
+import json
+import math
+import re
+import unicodedata
+from bisect import bisect_left, insort
+from heapq import heappush, heapreplace, merge, nlargest
+from typing import Any, Dict, Iterable, Iterator, List, NamedTuple, Optional, Set, Tuple
+from fastapi import HTTPException, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.crud import busqueda as crud
+from app.crud import evento as crud_evento
+from app.schemas.evento import BusquedaEventos, EventoEncontrado, EventoOut
+from app.services.indice import IndiceEnMemoria
+
+PALABRAS_VACIAS = frozenset(
+    "a al con de del e el en entre es la las lo los mas o para por que se sin sobre su sus un una y u".split()
+)
+PESO_NOMBRE = 2
+# BM25
+K1 = 1.2
+B = 0.75
+# el último término de la consulta se expande a lo sumo a estos términos del vocabulario
+MAX_EXPANSION = 50
+MIN_PREFIJO = 2
+# con menos coincidencias se puntúan todas; con más se recorren por peso y se corta antes
+MAX_EXHAUSTIVO = 5_000
+# términos con al menos estas apariciones guardan su lista ordenada por peso
+MIN_ORDEN = 2_000
+
+_separador = re.compile(r"[^0-9a-zñ]+")
+_tildes = str.maketrans("áéíóúüàèìòùâêîôûäëïö", "aeiouuaeiouaeiouaeio")
+
+
+def normalizar(texto: str) -> str:
+    # sin tildes ni diéresis; la ñ se conserva (año ≠ ano)
+    texto = texto.lower().translate(_tildes)
+    if texto.isascii() or all(c.isascii() or c == "ñ" for c in texto):
+        return texto
+    texto = texto.replace("ñ", "\0")
+    sin_marcas = "".join(c for c in unicodedata.normalize("NFKD", texto) if not unicodedata.combining(c))
+    return sin_marcas.replace("\0", "ñ")
+
+
+def tokenizar(texto: Optional[str]) -> List[str]:
+    if not texto:
+        return []
+    return [t for t in _separador.split(normalizar(texto)) if t and t not in PALABRAS_VACIAS]
+
+
+def _frecuencias(nombre: str, descripcion: Optional[str]) -> Dict[str, int]:
+    # frecuencia ponderada: cada aparición en el nombre cuenta PESO_NOMBRE
+    frecuencias: Dict[str, int] = {}
+    for t in tokenizar(nombre):
+        frecuencias[t] = frecuencias.get(t, 0) + PESO_NOMBRE
+    for t in tokenizar(descripcion):
+        frecuencias[t] = frecuencias.get(t, 0) + 1
+    return frecuencias
+
+
+class Documento(NamedTuple):
+    terminos: Tuple[str, ...]
+    categoria: str
+    estado: str
+
+
+class Encontrado(NamedTuple):
+    id_evento: int
+    puntaje: float
+
+
+class IndiceTexto(IndiceEnMemoria):
+    def __init__(self) -> None:
+        super().__init__()
+        self._docs: Dict[int, Documento] = {}
+        # término -> {idEvento: peso BM25 sin idf}; el idf se aplica al consultar
+        self._listas: Dict[str, Dict[int, float]] = {}
+        self._vocabulario: List[str] = []   # ordenado, para expandir prefijos
+        # listas largas ordenadas por (peso, idEvento) descendente; se arman al consultarlas
+        self._orden: Dict[str, List[int]] = {}
+        # largo medio de la última carga (los pesos de escrituras posteriores lo reutilizan)
+        self._largo_medio = 1.0
+        # (frecuencia, largo) -> peso: pocos valores distintos, objetos float compartidos
+        self._pesos: Dict[Tuple[int, int], float] = {}
+
+    # ---------- construcción ----------
+    async def _cargar(self, session: AsyncSession) -> None:
+        self.cargar_desde(await crud.textos(session))
+
+    def cargar_desde(self, filas: Iterable[Tuple[int, str, Optional[str], str, str]]) -> None:
+        self._docs, self._listas, self._orden, self._pesos = {}, {}, {}, {}
+        docs = [(i, _frecuencias(nombre, desc), cat, est) for i, nombre, desc, cat, est in filas]
+        largo_total = sum(sum(f.values()) for _, f, _, _ in docs)
+        self._largo_medio = largo_total / len(docs) if docs else 1.0
+        for id_evento, frecuencias, categoria, estado in docs:
+            self._agregar(id_evento, frecuencias, categoria, estado)
+        self._vocabulario = sorted(self._listas)
+        self._cargado = True
+
+    def _peso(self, f: int, largo: int) -> float:
+        peso = self._pesos.get((f, largo))
+        if peso is None:
+            norma = K1 * (1 - B + B * largo / self._largo_medio)
+            peso = self._pesos[(f, largo)] = f * (K1 + 1) / (f + norma)
+        return peso
+
+    def _agregar(self, id_evento: int, frecuencias: Dict[str, int], categoria: str, estado: str) -> List[str]:
+        self._docs[id_evento] = Documento(tuple(frecuencias), categoria, estado)
+        largo = sum(frecuencias.values())
+        nuevos = []
+        for t, f in frecuencias.items():
+            lista = self._listas.get(t)
+            if lista is None:
+                lista = self._listas[t] = {}
+                nuevos.append(t)
+            lista[id_evento] = self._peso(f, largo)
+            orden = self._orden.get(t)
+            if orden is not None:
+                insort(orden, id_evento, key=self._clave(lista))
+        return nuevos
+
+    @staticmethod
+    def _clave(lista: Dict[int, float]):
+        return lambda i: (-lista[i], -i)
+
+    # ---------- sincronización con escrituras ----------
+    def indexar(self, id_evento: int, nombre: str, descripcion: Optional[str], categoria: str, estado: str) -> None:
+        self._marcar_cambio()
+        if not self._cargado:
+            return
+        self.quitar(id_evento)
+        for t in self._agregar(id_evento, _frecuencias(nombre, descripcion), categoria, estado):
+            insort(self._vocabulario, t)
+
+    def cambiar_estado(self, id_evento: int, estado: str) -> None:
+        self._marcar_cambio()
+        doc = self._docs.get(id_evento) if self._cargado else None
+        if doc is not None:
+            self._docs[id_evento] = doc._replace(estado=estado)
+
+    def quitar(self, id_evento: int) -> None:
+        self._marcar_cambio()
+        doc = self._docs.pop(id_evento, None)
+        if doc is None:
+            return
+        for t in doc.terminos:
+            lista = self._listas[t]
+            orden = self._orden.get(t)
+            if orden is not None:
+                clave = self._clave(lista)
+                i = bisect_left(orden, clave(id_evento), key=clave)
+                if i < len(orden) and orden[i] == id_evento:
+                    del orden[i]
+            del lista[id_evento]
+            if not lista:
+                del self._listas[t]
+                self._orden.pop(t, None)
+                i = bisect_left(self._vocabulario, t)
+                if i < len(self._vocabulario) and self._vocabulario[i] == t:
+                    del self._vocabulario[i]
+
+    # ---------- consulta ----------
+    def _expandir(self, prefijo: str) -> List[str]:
+        if len(prefijo) < MIN_PREFIJO:
+            return [prefijo] if prefijo in self._listas else []
+        i = bisect_left(self._vocabulario, prefijo)
+        terminos = []
+        while i < len(self._vocabulario) and len(terminos) < MAX_EXPANSION:
+            t = self._vocabulario[i]
+            if not t.startswith(prefijo):
+                break
+            terminos.append(t)
+            i += 1
+        return terminos
+
+    def _ordenada(self, termino: str) -> List[int]:
+        orden = self._orden.get(termino)
+        if orden is None:
+            lista = self._listas[termino]
+            orden = sorted(lista, key=self._clave(lista))
+            if len(orden) >= MIN_ORDEN:
+                self._orden[termino] = orden
+        return orden
+
+    def _flujo(self, termino: str, idf: float) -> Iterator[Tuple[float, int]]:
+        lista = self._listas[termino]
+        return ((idf * lista[i], i) for i in self._ordenada(termino))
+
+    def _peso_maximo(self, termino: str) -> float:
+        lista = self._listas[termino]
+        orden = self._orden.get(termino)
+        return lista[orden[0]] if orden else max(lista.values())
+
+    def buscar(
+        self,
+        q: str,
+        limite: int,
+        despues: Optional[Encontrado] = None,
+        categoria: Optional[str] = None,
+        estado: Optional[str] = None,
+    ) -> Tuple[List[Encontrado], int]:
+        """
+        Eventos que contienen todos los términos de `q` (el último como prefijo,
+        salvo que la consulta termine en espacio), ordenados por puntaje y luego
+        por id descendente. Devuelve la página y el total de coincidencias.
+        """
+        terminos = tokenizar(q)
+        if not terminos or not self._docs:
+            return [], 0
+        # un grupo por término; el último agrupa sus expansiones y cuenta la mejor
+        grupos = [[t] if t in self._listas else [] for t in terminos[:-1]]
+        ultimo = terminos[-1]
+        if q[-1:].isspace():
+            grupos.append([ultimo] if ultimo in self._listas else [])
+        else:
+            grupos.append(self._expandir(ultimo))
+        if not all(grupos):
+            return [], 0
+
+        n = len(self._docs)
+        idf = {}
+        for g in grupos:
+            for t in g:
+                df = len(self._listas[t])
+                idf[t] = math.log(1 + (n - df + 0.5) / (df + 0.5))
+        listas = self._listas
+
+        # 1) coincidencias y total con operaciones de conjuntos (en C)
+        conjuntos = [
+            listas[g[0]].keys() if len(g) == 1 else set().union(*(listas[t].keys() for t in g))
+            for g in grupos
+        ]
+        conjuntos.sort(key=len)
+        candidatos = conjuntos[0]
+        for c in conjuntos[1:]:
+            candidatos = candidatos & c
+        if categoria or estado:
+            docs = self._docs
+            candidatos = {
+                i for i in candidatos
+                if (not categoria or docs[i].categoria == categoria) and (not estado or docs[i].estado == estado)
+            }
+        total = len(candidatos)
+        if not total:
+            return [], 0
+
+        def puntaje(i: int) -> float:
+            s = 0.0
+            for g in grupos:
+                if len(g) == 1:
+                    s += idf[g[0]] * listas[g[0]][i]
+                else:
+                    s += max(idf[t] * listas[t].get(i, 0.0) for t in g)
+            return round(s, 6)
+
+        cursor = (despues.puntaje, despues.id_evento) if despues else None
+        if total <= MAX_EXHAUSTIVO:
+            claves = ((puntaje(i), i) for i in candidatos)
+            if cursor:
+                claves = (k for k in claves if k < cursor)
+            return [Encontrado(i, p) for p, i in nlargest(limite, claves)], total
+
+        # 2) muchas coincidencias: se recorre el grupo más corto por peso descendente
+        #    y se corta cuando ni con el máximo de los demás grupos se entra a la página
+        grupos.sort(key=lambda g: sum(len(listas[t]) for t in g))
+        guia, resto = grupos[0], grupos[1:]
+        cota_resto = sum(max(idf[t] * self._peso_maximo(t) for t in g) for g in resto)
+        flujos = [self._flujo(t, idf[t]) for t in guia]
+        flujo = flujos[0] if len(flujos) == 1 else merge(*flujos, reverse=True)
+        vistos: Optional[Set[int]] = set() if len(flujos) > 1 else None
+
+        pagina: List[Tuple[float, int]] = []  # min-heap con los `limite` mejores
+        for v, i in flujo:
+            if len(pagina) == limite and round(v + cota_resto, 6) < pagina[0][0]:
+                break
+            if vistos is not None:
+                if i in vistos:
+                    continue
+                vistos.add(i)
+            if i not in candidatos:
+                continue
+            clave = (puntaje(i), i)
+            if cursor and clave >= cursor:
+                continue
+            if len(pagina) < limite:
+                heappush(pagina, clave)
+            elif clave > pagina[0]:
+                heapreplace(pagina, clave)
+        return [Encontrado(i, p) for p, i in sorted(pagina, reverse=True)], total
+
+
+buscador = IndiceTexto()
+
+
+# ---------- CURSOR (opaco: puntaje e id del último resultado) ----------
+def _codificar_cursor(ultimo: Encontrado) -> str:
+    crudo = {"p": ultimo.puntaje, "id": ultimo.id_evento}
+    return base64.urlsafe_b64encode(json.dumps(crudo, separators=(",", ":")).encode()).decode().rstrip("=")
+
+
+def _decodificar_cursor(cursor: str) -> Encontrado:
+    try:
+        crudo = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+        return Encontrado(int(crudo["id"]), float(crudo["p"]))
+    except (binascii.Error, ValueError, KeyError, TypeError) as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f"Cursor inválido: {e}")
+
+
+async def buscar(session: AsyncSession, params: BusquedaEventos) -> Dict[str, Any]:
+    despues = _decodificar_cursor(params.cursor) if params.cursor else None
+    await buscador.asegurar_cargado(session)
+    # uno extra para saber si hay página siguiente
+    encontrados, total = buscador.buscar(
+        params.q, params.limit + 1, despues, categoria=params.categoria, estado=params.estado,
+    )
+    next_cursor = None
+    if len(encontrados) > params.limit:
+        encontrados = encontrados[: params.limit]
+        next_cursor = _codificar_cursor(encontrados[-1])
+
+    # las filas completas salen de la BD por PK (solo la página)
+    objetos = await crud_evento.obtener_varios(session, [e.id_evento for e in encontrados])
+    items = [
+        EventoEncontrado(**EventoOut.model_validate(objetos[e.id_evento]).model_dump(), puntaje=e.puntaje)
+        for e in encontrados if e.id_evento in objetos
+    ]
+    return {"items": items, "total": total, "next_cursor": next_cursor}
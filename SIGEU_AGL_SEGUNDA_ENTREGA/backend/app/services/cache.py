@@ -0,0 +1,276 @@
+# app/services/cache.py
+import asyncio
+import hashlib
+import json
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Generic, Hashable, List, NamedTuple, Optional, Protocol, Tuple, TypeVar
+
+from app.core.config import settings
+
+V = TypeVar("V")
+
+
+# ---------- Nivel 1: en el proceso ----------
+class CacheLRU(Generic[V]):
+    """LRU acotado por número de entradas, con vencimiento por TTL (segundos)."""
+
+    def __init__(self, max_entradas: int, ttl: float) -> None:
+        self.max_entradas = max_entradas
+        self.ttl = ttl
+        self._datos: "OrderedDict[Hashable, Tuple[float, V]]" = OrderedDict()
+        self.aciertos = 0
+        self.fallos = 0
+        self.desalojos = 0
+
+    def obtener(self, clave: Hashable) -> Optional[V]:
+        item = self._datos.get(clave)
+        if item is None:
+            self.fallos += 1
+            return None
+        vence, valor = item
+        if vence < time.monotonic():
+            del self._datos[clave]
+            self.fallos += 1
+            return None
+        self._datos.move_to_end(clave)
+        self.aciertos += 1
+        return valor
+
+    def guardar(self, clave: Hashable, valor: V) -> None:
+        self._datos[clave] = (time.monotonic() + self.ttl, valor)
+        self._datos.move_to_end(clave)
+        while len(self._datos) > self.max_entradas:
+            self._datos.popitem(last=False)
+            self.desalojos += 1
+
+    def quitar(self, clave: Hashable) -> None:
+        self._datos.pop(clave, None)
+
+    def limpiar(self) -> None:
+        self._datos.clear()
+
+    def estadisticas(self) -> Dict[str, Any]:
+        return {
+            "entradas": len(self._datos),
+            "max_entradas": self.max_entradas,
+            "ttl_s": self.ttl,
+            "aciertos": self.aciertos,
+            "fallos": self.fallos,
+            "desalojos": self.desalojos,
+        }
+
+
+# ---------- Nivel 2: compartido entre workers (opcional) ----------
+class BackendCompartido(Protocol):
+    """Lo que debe cumplir un almacén compartido (p. ej. un cliente Redis)."""
+
+    async def get(self, clave: str) -> Optional[bytes]: ...
+
+    async def set(self, clave: str, valor: bytes, ttl: float) -> None: ...
+
+    async def delete(self, clave: str) -> None: ...
+
+
+class BackendMemoriaLocal:
+    """Sustituto local de un backend compartido, para desarrollo y pruebas."""
+
+    def __init__(self) -> None:
+        self._datos: Dict[str, Tuple[float, bytes]] = {}
+
+    async def get(self, clave: str) -> Optional[bytes]:
+        item = self._datos.get(clave)
+        if item is None or item[0] < time.monotonic():
+            self._datos.pop(clave, None)
+            return None
+        return item[1]
+
+    async def set(self, clave: str, valor: bytes, ttl: float) -> None:
+        self._datos[clave] = (time.monotonic() + ttl, valor)
+
+    async def delete(self, clave: str) -> None:
+        self._datos.pop(clave, None)
+
+
+# ---------- Cache de respuestas serializadas ----------
+class EntradaCache(NamedTuple):
+    cuerpo: bytes   # JSON listo para enviar
+    etag: str
+
+
+def calcular_etag(cuerpo: bytes) -> str:
+    return '"' + hashlib.blake2b(cuerpo, digest_size=12).hexdigest() + '"'
+
+
+def etag_version(version: int) -> str:
+    return f'"{version}"'
+
+
+def etag_de_version(cuerpo: bytes) -> str:
+    """ETag de una representación con campo `version` (uno que sube en cada escritura)."""
+    return etag_version(json.loads(cuerpo)["version"])
+
+
+def versiones_if_match(if_match: Optional[str]) -> Optional[List[int]]:
+    """
+    Versiones aceptadas por un If-Match con ETags de `etag_de_version`; None si
+    no hay condición (encabezado ausente o `*`). Etiquetas que no son versiones
+    no coinciden con nada: la lista puede quedar vacía.
+    """
+    if not if_match or if_match.strip() == "*":
+        return None
+    versiones = []
+    for etiqueta in if_match.split(","):
+        valor = etiqueta.strip().removeprefix("W/").strip('"')
+        if valor.isdigit():
+            versiones.append(int(valor))
+    return versiones
+
+
+def etag_coincide(if_none_match: Optional[str], etag: str) -> bool:
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    # lista separada por comas; las etiquetas débiles (W/) se comparan igual
+    candidatos = {e.strip().removeprefix("W/") for e in if_none_match.split(",")}
+    return etag in candidatos
+
+
+class CacheRespuestas:
+    """
+    Cache read-through de cuerpos JSON por id. L1 en el proceso; L2 opcional
+    compartido. Las invalidaciones llegan a L1 del propio worker y a L2; en
+    otros workers el TTL de L1 acota cuánto puede durar una copia vieja.
+    """
+
+    def __init__(
+        self, prefijo: str, max_entradas: int, ttl: float, etag: Callable[[bytes], str] = calcular_etag,
+        retraso_replica: float = 0,
+    ) -> None:
+        self.prefijo = prefijo
+        self.etag = etag
+        self.local: CacheLRU[EntradaCache] = CacheLRU(max_entradas, ttl)
+        self.compartido: Optional[BackendCompartido] = None
+        self.aciertos_compartido = 0
+        # sube en cada invalidación: una lectura que empezó antes no debe guardar su resultado
+        self._marca = 0
+        # id -> momento de su última invalidación, solo los de los últimos `retraso_replica` segundos:
+        # una lectura de la réplica en ese lapso puede traer todavía la versión anterior
+        self.retraso_replica = retraso_replica
+        self._invalidados: "OrderedDict[int, float]" = OrderedDict()
+
+    def _clave(self, id_: int) -> str:
+        return f"{self.prefijo}:{id_}"
+
+    def marca(self) -> int:
+        return self._marca
+
+    async def obtener(self, id_: int) -> Optional[EntradaCache]:
+        entrada = self.local.obtener(id_)
+        if entrada is not None or self.compartido is None:
+            return entrada
+        cuerpo = await self.compartido.get(self._clave(id_))
+        if cuerpo is None:
+            return None
+        self.aciertos_compartido += 1
+        entrada = EntradaCache(cuerpo, self.etag(cuerpo))
+        self.local.guardar(id_, entrada)
+        return entrada
+
+    def _invalidado_hace_poco(self, id_: int) -> bool:
+        limite = time.monotonic() - self.retraso_replica
+        while self._invalidados:
+            primero, cuando = next(iter(self._invalidados.items()))
+            if cuando >= limite:
+                break
+            del self._invalidados[primero]
+        return id_ in self._invalidados
+
+    async def guardar(
+        self, id_: int, cuerpo: bytes, marca: Optional[int] = None, desde_replica: bool = False,
+    ) -> EntradaCache:
+        entrada = EntradaCache(cuerpo, self.etag(cuerpo))
+        if marca is not None and marca != self._marca:
+            return entrada
+        if desde_replica and self._invalidado_hace_poco(id_):
+            return entrada
+        self.local.guardar(id_, entrada)
+        if self.compartido is not None:
+            await self.compartido.set(self._clave(id_), cuerpo, self.local.ttl)
+        return entrada
+
+    async def invalidar(self, id_: int) -> None:
+        self._marca += 1
+        self.local.quitar(id_)
+        if self.retraso_replica:
+            self._invalidados.pop(id_, None)
+            self._invalidados[id_] = time.monotonic()
+        if self.compartido is not None:
+            await self.compartido.delete(self._clave(id_))
+
+    def estadisticas(self) -> Dict[str, Any]:
+        datos = self.local.estadisticas()
+        datos["compartido"] = type(self.compartido).__name__ if self.compartido else None
+        datos["aciertos_compartido"] = self.aciertos_compartido
+        return datos
+
+
+# ---------- Resultados calculados, con peticiones simultáneas unidas ----------
+class CacheCoalescida(Generic[V]):
+    """
+    TTL corto más single-flight: si llegan varias peticiones por la misma clave
+    mientras se calcula, todas esperan ese cálculo en vez de lanzar uno cada una.
+    El cálculo corre en su propia tarea: si el cliente que lo inició se
+    desconecta, los demás igual reciben el resultado.
+    """
+
+    def __init__(self, max_entradas: int, ttl: float) -> None:
+        self.local: CacheLRU[V] = CacheLRU(max_entradas, ttl)
+        self._en_curso: Dict[Hashable, "asyncio.Task[V]"] = {}
+        self.calculos = 0
+        self.unidas = 0
+
+    async def obtener(self, clave: Hashable, calcular: Callable[[], Awaitable[V]]) -> V:
+        valor = self.local.obtener(clave)
+        if valor is not None:
+            return valor
+        tarea = self._en_curso.get(clave)
+        if tarea is None:
+            self.calculos += 1
+            tarea = asyncio.create_task(self._calcular(clave, calcular))
+            # si nadie la espera (todos cancelados), el error no queda como "never retrieved"
+            tarea.add_done_callback(lambda t: t.cancelled() or t.exception())
+            self._en_curso[clave] = tarea
+        else:
+            self.unidas += 1
+        return await asyncio.shield(tarea)
+
+    async def _calcular(self, clave: Hashable, calcular: Callable[[], Awaitable[V]]) -> V:
+        try:
+            valor = await calcular()
+            if self.local.ttl > 0:
+                self.local.guardar(clave, valor)
+            return valor
+        finally:
+            del self._en_curso[clave]
+
+    def limpiar(self) -> None:
+        self.local.limpiar()
+
+    def estadisticas(self) -> Dict[str, Any]:
+        datos = self.local.estadisticas()
+        datos.update({"calculos": self.calculos, "unidas": self.unidas, "en_curso": len(self._en_curso)})
+        return datos
+
+
+cache_eventos = CacheRespuestas(
+    "evento",
+    max_entradas=settings.cache_eventos_max,
+    ttl=settings.cache_eventos_ttl,
+    etag=etag_de_version,
+    retraso_replica=settings.db_replica_retraso_max_s if settings.read_database_url else 0,
+)
+
+if settings.cache_eventos_compartido == "memoria":
+    cache_eventos.compartido = BackendMemoriaLocal()
@@ -0,0 +1,226 @@
+# app/services/carga.py
+import csv
+import itertools
+import json
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple, Union
+from pydantic import ValidationError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.exc import IntegrityError, DataError
+from app.crud import evento as crud
+from app.crud import indice as crud_indice
+from app.schemas.evento import EventoCrear, ErrorFila
+from app.services.agenda import agenda
+from app.services.busqueda import buscador
+from app.services.kpi import kpis
+
+# filas validadas e insertadas por sentencia
+TAM_BLOQUE = 1000
+
+# ids negativos para reservar en la agenda las filas aún sin id real
+_ids_provisionales = itertools.count(-1, -1)
+
+# (número de registro, dict con el registro | error de formato)
+Registro = Tuple[int, Any]
+# línea decodificada | error de codificación (se reporta en su fila, no corta la carga)
+Linea = Union[str, ValueError]
+
+
+# ---------- LECTURA DEL CUERPO (streaming) ----------
+async def _lineas(stream: AsyncIterator[bytes]) -> AsyncIterator[Linea]:
+    resto = b""
+    primera = True
+    async for trozo in stream:
+        resto += trozo
+        *completas, resto = resto.split(b"\n")
+        for linea in completas:
+            yield _decodificar(linea, primera)
+            primera = False
+    if resto:
+        yield _decodificar(resto, primera)
+
+
+def _decodificar(linea: bytes, primera: bool) -> Linea:
+    try:
+        texto = linea.decode("utf-8").rstrip("\r")
+    except UnicodeDecodeError as e:
+        return ValueError(
+            f"codificación inválida (se esperaba UTF-8): byte 0x{linea[e.start]:02x} en la posición {e.start + 1}"
+        )
+    # BOM que agregan algunas hojas de cálculo al exportar
+    return texto.lstrip("\ufeff") if primera else texto
+
+
+async def registros_ndjson(stream: AsyncIterator[bytes]) -> AsyncIterator[Registro]:
+    n = 0
+    async for linea in _lineas(stream):
+        if isinstance(linea, ValueError):
+            n += 1
+            yield n, linea
+            continue
+        if not linea.strip():
+            continue
+        n += 1
+        try:
+            yield n, json.loads(linea)
+        except json.JSONDecodeError as e:
+            yield n, ValueError(f"JSON inválido: {e.msg}")
+
+
+async def registros_csv(stream: AsyncIterator[bytes]) -> AsyncIterator[Registro]:
+    # primera fila = encabezado con los nombres de campo (camelCase o snake_case)
+    encabezado: Optional[List[str]] = None
+    error_encabezado: Optional[ValueError] = None
+    pendiente = ""
+    n = 0
+    async for linea in _lineas(stream):
+        if isinstance(linea, ValueError):
+            # se descarta el registro completo (con las líneas que ya llevaba entre comillas)
+            pendiente = ""
+            if encabezado is None:
+                encabezado, error_encabezado = [], ValueError(f"encabezado ilegible: {linea}")
+            else:
+                n += 1
+                yield n, linea
+            continue
+        pendiente = f"{pendiente}\n{linea}" if pendiente else linea
+        if pendiente.count('"') % 2:
+            # campo entre comillas con salto de línea: sigue en la próxima línea
+            continue
+        registro, pendiente = pendiente, ""
+        if not registro.strip():
+            continue
+        valores = next(csv.reader([registro]))
+        if encabezado is None:
+            encabezado = [c.strip() for c in valores]
+            continue
+        n += 1
+        if error_encabezado is not None:
+            yield n, error_encabezado
+        elif len(valores) != len(encabezado):
+            yield n, ValueError(f"se esperaban {len(encabezado)} columnas y llegaron {len(valores)}")
+        else:
+            # celdas vacías = campo no enviado (aplican los valores por defecto del schema)
+            yield n, {k: v for k, v in zip(encabezado, valores) if v != ""}
+
+
+def formato_de(content_type: Optional[str]) -> str:
+    return "csv" if content_type and "csv" in content_type else "ndjson"
+
+
+# ---------- CARGA ----------
+async def cargar(session: AsyncSession, registros: AsyncIterator[Registro]) -> Dict[str, Any]:
+    """
+    Valida e inserta los registros por bloques de TAM_BLOQUE dentro de una sola
+    transacción. Las filas con error se reportan y se omiten; el resto se confirma.
+    """
+    recibidas = insertadas = 0
+    errores: List[ErrorFila] = []
+    provisionales: Dict[int, int] = {}  # id provisional en la agenda -> fila
+
+    await agenda.asegurar_cargado(session)
+    try:
+        bloque: List[Registro] = []
+        async for registro in registros:
+            recibidas += 1
+            bloque.append(registro)
+            if len(bloque) >= TAM_BLOQUE:
+                insertadas += await _procesar_bloque(session, bloque, errores, provisionales)
+                bloque = []
+        if bloque:
+            insertadas += await _procesar_bloque(session, bloque, errores, provisionales)
+        if insertadas:
+            await crud_indice.registrar_cambio(session)
+        await session.commit()
+    except BaseException:
+        await session.rollback()
+        # además de las provisionales, la sincronización pudo registrar filas de bloques ya revertidos
+        agenda.invalidar()
+        raise
+
+    # los ids reales los asignó la BD: agenda, indicadores y búsqueda se reconstruyen en el siguiente uso
+    if insertadas:
+        agenda.invalidar()
+        kpis.invalidar()
+        buscador.invalidar()
+    errores.sort(key=lambda e: e.fila)
+    return {"recibidas": recibidas, "insertadas": insertadas, "errores": errores}
+
+
+def _resumir(e: ValidationError) -> str:
+    return "; ".join(
+        f"{'.'.join(str(p) for p in err['loc']) or 'registro'}: {err['msg']}" for err in e.errors()
+    )
+
+
+async def _procesar_bloque(
+    session: AsyncSession,
+    bloque: List[Registro],
+    errores: List[ErrorFila],
+    provisionales: Dict[int, int],
+) -> int:
+    # 1) validación con el mismo schema del POST individual
+    validas: List[Tuple[int, Dict[str, Any]]] = []
+    for n, registro in bloque:
+        if isinstance(registro, Exception):
+            errores.append(ErrorFila(fila=n, codigo=422, detalle=str(registro)))
+            continue
+        try:
+            payload = EventoCrear.model_validate(registro)
+        except ValidationError as e:
+            errores.append(ErrorFila(fila=n, codigo=422, detalle=_resumir(e)))
+            continue
+        data = payload.model_dump(by_alias=True)
+        data["estado"] = data["estado"] or "registrado"
+        validas.append((n, data))
+
+    # 2) solapamientos contra la agenda, que ya incluye las filas previas del archivo
+    #    (y, tras sincronizar, lo que otros workers reservaron en esas salas y fechas)
+    aceptadas: List[Tuple[int, Dict[str, Any], Optional[int]]] = []
+    vigentes = [d for _, d in validas if d["estado"] != "rechazado"]
+    async with agenda.bloqueo({d["idInstalacion"] for _, d in validas}):
+        if vigentes:
+            await agenda.sincronizar(
+                session, {d["idInstalacion"] for d in vigentes},
+                min(d["fechaInicio"] for d in vigentes), max(d["fechaFin"] for d in vigentes),
+            )
+        for n, data in validas:
+            id_prov = None
+            if data["estado"] != "rechazado":
+                choques = agenda.conflictos((data["idInstalacion"],), data["fechaInicio"], data["fechaFin"])
+                if choques:
+                    eventos = sorted(i for _, i in choques if i > 0)
+                    filas = sorted(provisionales[i] for _, i in choques if i in provisionales)
+                    errores.append(ErrorFila(
+                        fila=n, codigo=409,
+                        detalle=f"La instalación ya está reservada en ese horario (eventos {eventos}, filas {filas})",
+                    ))
+                    continue
+                id_prov = next(_ids_provisionales)
+                agenda.registrar(id_prov, data["idInstalacion"], data["fechaInicio"], data["fechaFin"])
+                provisionales[id_prov] = n
+            aceptadas.append((n, data, id_prov))
+
+    if not aceptadas:
+        return 0
+
+    # 3) un solo executemany por bloque; si la BD rechaza alguna fila (FK/CHECK),
+    #    se repite fila por fila en savepoints para aislar las que fallan
+    try:
+        async with session.begin_nested():
+            await crud.insertar_lote(session, [d for _, d, _ in aceptadas])
+        return len(aceptadas)
+    except (IntegrityError, DataError):
+        pass
+
+    ok = 0
+    for n, data, id_prov in aceptadas:
+        try:
+            async with session.begin_nested():
+                await crud.insertar_lote(session, [data])
+            ok += 1
+        except (IntegrityError, DataError) as e:
+            errores.append(ErrorFila(fila=n, codigo=409, detalle=f"Violación de integridad: {str(e.orig)}"))
+            if id_prov is not None:
+                agenda.quitar(id_prov)
+                provisionales.pop(id_prov, None)
+    return ok
@@ -0,0 +1,161 @@
+# app/services/evaluacion.py
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Sequence
+from fastapi import HTTPException, status
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.exc import IntegrityError, DataError
+from app.crud import agenda as crud_agenda
+from app.crud import evaluacion as crud
+from app.crud import indice as crud_indice
+from app.schemas.evaluacion import LoteVeredictos, VeredictoIn
+from app.schemas.evento import ErrorFila
+from app.services.agenda import agenda, Reserva
+from app.services.busqueda import buscador
+from app.services.cache import cache_eventos
+from app.services.kpi import kpis
+from app.services.notificaciones import despachador
+
+
+async def aplicar_lote(session: AsyncSession, lote: LoteVeredictos) -> Dict[str, Any]:
+    """
+    Registra todos los veredictos en una transacción: evaluaciones en un INSERT
+    multi-fila, `evento.estado` con un UPDATE por veredicto (gana el último de
+    cada evento) y una notificación por evaluación en otro INSERT multi-fila.
+    Los veredictos sobre eventos inexistentes se reportan en `errores`, igual que
+    los de un evento rechazado que se aprueba cuando sus salas (principal y
+    adicionales) ya están ocupadas en su horario: esos no se aplican (409).
+    """
+    veredictos = lote.veredictos
+    finales = {v.id_evento: v.estado for v in veredictos}
+    reactivados = await _reservas_a_reactivar(session, [i for i, e in finales.items() if e != "rechazado"])
+    if not reactivados:
+        return await _aplicar(session, veredictos, reactivados)
+
+    # como en PUT /api/v1/{id}: las salas se bloquean y sincronizan antes de tocar los eventos
+    await agenda.asegurar_cargado(session)
+    salas = frozenset().union(*(r.instalaciones for r in reactivados.values()))
+    async with agenda.bloqueo(salas):
+        desde = min(r.inicio for r in reactivados.values())
+        hasta = max(r.fin for r in reactivados.values())
+        if await agenda.sincronizar(session, salas, desde, hasta):
+            kpis.invalidar()
+            buscador.invalidar()
+        return await _aplicar(session, veredictos, reactivados)
+
+
+async def _reservas_a_reactivar(session: AsyncSession, aprobados: Sequence[int]) -> Dict[int, Reserva]:
+    if not aprobados:
+        return {}
+    filas = await crud.rechazados(session, aprobados)
+    if not filas:
+        return {}
+    extra: Dict[int, set] = {}
+    for id_evento, id_inst in await crud_agenda.adicionales_de(session, [f.idEvento for f in filas]):
+        extra.setdefault(id_evento, set()).add(id_inst)
+    return {
+        f.idEvento: Reserva(f.idInstalacion, frozenset(extra.get(f.idEvento, ())), f.fechaInicio, f.fechaFin)
+        for f in filas
+    }
+
+
+def _choque_al_reactivar(id_evento: int, ev: Any, reserva: Optional[Reserva]) -> Optional[str]:
+    leida = (reserva.id_instalacion, reserva.inicio, reserva.fin) if reserva else None
+    if leida != (ev.idInstalacion, ev.fechaInicio, ev.fechaFin):
+        # pasó a rechazado o cambió de sala/horario entre la lectura y el bloqueo
+        return f"El evento {id_evento} cambió mientras se evaluaba; reintente"
+    choques = agenda.conflictos(reserva.instalaciones, reserva.inicio, reserva.fin, excluir=id_evento)
+    if choques:
+        return f"La instalación ya está reservada en ese horario (eventos {sorted({i for _, i in choques})})"
+    return None
+
+
+async def _aplicar(
+    session: AsyncSession, veredictos: List[VeredictoIn], reactivados: Dict[int, Reserva],
+) -> Dict[str, Any]:
+    eventos = await crud.bloquear_eventos(session, {v.id_evento for v in veredictos})
+    finales = {v.id_evento: v.estado for v in veredictos if v.id_evento in eventos}
+
+    # aprobar un evento rechazado vuelve a ocupar sus salas: si chocan, ningún veredicto del evento se aplica
+    choques: Dict[int, str] = {}
+    for id_evento, estado in finales.items():
+        if estado != "rechazado" and eventos[id_evento].estado == "rechazado":
+            detalle = _choque_al_reactivar(id_evento, eventos[id_evento], reactivados.get(id_evento))
+            if detalle:
+                choques[id_evento] = detalle
+
+    errores: List[ErrorFila] = []
+    validos = []
+    for n, v in enumerate(veredictos, start=1):
+        if v.id_evento not in eventos:
+            errores.append(ErrorFila(fila=n, codigo=404, detalle=f"Evento {v.id_evento} no encontrado"))
+        elif v.id_evento in choques:
+            errores.append(ErrorFila(fila=n, codigo=409, detalle=choques[v.id_evento]))
+        else:
+            validos.append(v)
+    if not validos:
+        await session.rollback()
+        return {"recibidas": len(veredictos), "aplicadas": 0, "eventos_actualizados": 0, "errores": errores}
+
+    ahora = datetime.now()
+    finales = {i: e for i, e in finales.items() if i not in choques}
+    cambios = {i: e for i, e in finales.items() if eventos[i].estado != e}
+    try:
+        # en cada lote: 7_evaluaciones_en_aplicacion.sql puede correrse (o el trigger
+        # reinstalarse) con la app en marcha, y guardar la respuesta dejaría de aplicar
+        # los veredictos o los duplicaría hasta reiniciar
+        trigger = await crud.trigger_instalado(session)
+        ids = await crud.insertar_evaluaciones(session, [
+            {
+                "idEvento": v.id_evento, "estado": v.estado, "comentarios": v.comentarios,
+                "actaPDF": v.acta_pdf, "fechaRevision": v.fecha_revision or ahora,
+            }
+            for v in validos
+        ])
+        if cambios:
+            # también con el trigger: él no incrementa `version` y el ETag quedaría igual
+            await crud.actualizar_estados(session, cambios)
+        if not trigger:
+            await crud.insertar_notificaciones(session, [
+                {
+                    "idEvaluacion": id_eval, "tipoNotificacion": v.estado, "justificacion": v.comentarios,
+                    "urlPDF": v.acta_pdf, "usuarioReceptor": eventos[v.id_evento].idOrganizador,
+                    "fechaEnvio": None,  # pendiente: la entrega la hace el despachador
+                }
+                for id_eval, v in zip(ids, validos)
+            ])
+        await crud_indice.registrar_cambio(session)
+        await session.commit()
+    except (IntegrityError, DataError) as e:
+        await session.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"Violación de integridad al registrar evaluaciones: {str(e.orig)}",
+        )
+
+    if not trigger:
+        despachador.avisar()
+
+    # estructuras en memoria, después del commit
+    for v in validos:
+        kpis.registrar_evaluaciones(v.id_evento, v.estado)
+    for id_evento, estado in cambios.items():
+        ev = eventos[id_evento]
+        kpis.registrar_evento(
+            id_evento, estado, ev.categoria, ev.idOrganizador, ev.idInstalacion,
+            ev.fechaInicio, ev.fechaFin, ev.fechaRegistro,
+        )
+        buscador.cambiar_estado(id_evento, estado)
+        if estado == "rechazado":
+            agenda.quitar(id_evento)
+        elif ev.estado == "rechazado":
+            # vuelve a ocupar sus salas (principal + adicionales), ya verificadas
+            r = reactivados[id_evento]
+            agenda.registrar(id_evento, r.id_instalacion, r.inicio, r.fin, r.adicionales)
+        await cache_eventos.invalidar(id_evento)
+
+    return {
+        "recibidas": len(veredictos),
+        "aplicadas": len(validos),
+        "eventos_actualizados": len(cambios),
+        "errores": errores,
+    }
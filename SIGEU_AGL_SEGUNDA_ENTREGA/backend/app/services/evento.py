@@ -1,11 +1,60 @@
 # app/services/evento.py
-from typing import List, Optional, Dict, Any
+import base64
+import binascii
+import json
+from datetime import datetime
+from functools import lru_cache
+from typing import Any, Dict, FrozenSet, List, NamedTuple, Optional, Sequence, Tuple
 from fastapi import HTTPException, status
+from pydantic import ConfigDict, TypeAdapter, create_model
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.exc import IntegrityError
-from app.schemas.evento import EventoCrear, EventoActualizar
+from app.schemas.evento import (
+    DetallesPorId, EventoCrear, EventoActualizar, EventoDetalle, EventoOut, EventoPagina, PaginaEventos,
+)
+from app.crud import agenda as crud_agenda
 from app.crud import evento as crud
+from app.db.replica import es_replica
 from app.models.evento import Evento
+from app.services.agenda import agenda, Reserva
+from app.services.busqueda import buscador
+from app.services.cache import cache_eventos, EntradaCache, etag_version, versiones_if_match
+from app.services.kpi import kpis
+
+# campos que cambian la ocupación de una instalación
+_CAMPOS_AGENDA = {"fechaInicio", "fechaFin", "idInstalacion", "estado"}
+# columnas que necesita el cursor del listado
+_COLUMNAS_CURSOR = ("idEvento", "fechaInicio")
+
+
+# ---------- DISPONIBILIDAD ----------
+def _verificar_disponibilidad(reserva: Reserva, excluir: Optional[int] = None) -> None:
+    choques = agenda.conflictos(reserva.instalaciones, reserva.inicio, reserva.fin, excluir=excluir)
+    if choques:
+        por_sala: Dict[int, List[int]] = {}
+        for inst, id_evento in choques:
+            por_sala.setdefault(inst, []).append(id_evento)
+        detalle = "; ".join(f"instalación {i}: eventos {sorted(ids)}" for i, ids in sorted(por_sala.items()))
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"La instalación ya está reservada en ese horario ({detalle})",
+        )
+
+
+async def _sincronizar_agenda(session: AsyncSession, reserva: Reserva) -> None:
+    # otro worker (u otro proceso) reservó en estas salas sin que esta copia se enterara:
+    # el resto de los índices del proceso tampoco está al día
+    if await agenda.sincronizar(session, reserva.instalaciones, reserva.inicio, reserva.fin):
+        kpis.invalidar()
+        buscador.invalidar()
+
+
+def _registrar_indicadores(obj: Evento) -> None:
+    kpis.registrar_evento(
+        obj.idEvento, obj.estado, obj.categoria, obj.idOrganizador, obj.idInstalacion,
+        obj.fechaInicio, obj.fechaFin, obj.fechaRegistro,
+    )
+    buscador.indexar(obj.idEvento, obj.nombre, obj.descripcion, obj.categoria, obj.estado)
 
 
 # ---------- CREATE ----------
@@ -14,22 +63,104 @@ async def crear(session: AsyncSession, payload: EventoCrear) -> Evento:
     data: Dict[str, Any] = payload.model_dump(by_alias=True, exclude_none=True)
     # por si el cliente no envía estado
     data.setdefault("estado", "registrado")
+    vigente = data["estado"] != "rechazado"
+    reserva = Reserva(data["idInstalacion"], frozenset(), data["fechaInicio"], data["fechaFin"])
+
+    await agenda.asegurar_cargado(session)
+    async with agenda.bloqueo(reserva.instalaciones):
+        if vigente:
+            await _sincronizar_agenda(session, reserva)
+            _verificar_disponibilidad(reserva)
+        try:
+            obj = await crud.crear(session, data)
+        except IntegrityError as e:
+            await session.rollback()
+            # FK/UNIQUE/CHK → 409 (o 400 según prefieras)
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail=f"Violación de integridad al crear evento: {str(e.orig)}",
+            )
+        if vigente:
+            agenda.registrar(obj.idEvento, obj.idInstalacion, obj.fechaInicio, obj.fechaFin)
+    _registrar_indicadores(obj)
+    return obj
+
+
+# ---------- CURSOR (opaco para el cliente) ----------
+def _codificar_cursor(orden: str, obj: Any) -> str:
+    # obj: Evento o fila del listado (ambos con idEvento y fechaInicio)
+    crudo = {"o": orden, "id": obj.idEvento, "f": obj.fechaInicio.isoformat()}
+    return base64.urlsafe_b64encode(json.dumps(crudo, separators=(",", ":")).encode()).decode().rstrip("=")
+
+
+def _decodificar_cursor(cursor: str, orden: str) -> Tuple[int, Optional[datetime]]:
     try:
-        obj = await crud.crear(session, data)
-        return obj
-    except IntegrityError as e:
-        await session.rollback()
-        # FK/UNIQUE/CHK → 409 (o 400 según prefieras)
-        raise HTTPException(
-            status_code=status.HTTP_409_CONFLICT,
-            detail=f"Violación de integridad al crear evento: {str(e.orig)}",
+        relleno = "=" * (-len(cursor) % 4)
+        crudo = json.loads(base64.urlsafe_b64decode(cursor + relleno))
+        if crudo["o"] != orden:
+            raise ValueError("el cursor pertenece a otro orden")
+        return int(crudo["id"]), datetime.fromisoformat(crudo["f"])
+    except (binascii.Error, ValueError, KeyError, TypeError) as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f"Cursor inválido: {e}")
+
+
+# ---------- SERIALIZACIÓN DE LISTADOS ----------
+class Proyeccion(NamedTuple):
+    nombres: Tuple[str, ...]      # campos del schema, en su orden
+    columnas: Tuple[str, ...]     # columnas a leer: las de `nombres` y al final las que faltan para el cursor
+    pagina: TypeAdapter
+
+
+@lru_cache(maxsize=64)
+def proyeccion(campos: Optional[FrozenSet[str]] = None) -> Proyeccion:
+    """
+    Columnas y serializador de una página con solo `campos` (nombres de salida:
+    idEvento, fechaInicio, ...), o con EventoOut completo si es None. El alias de
+    salida de cada campo es el nombre de su columna en el ORM.
+    """
+    if campos is None:
+        modelo, pagina = EventoOut, EventoPagina
+    else:
+        modelo = create_model(
+            "EventoParcial",
+            __config__=ConfigDict(populate_by_name=True),
+            **{n: (f.annotation, f) for n, f in EventoOut.model_fields.items() if (f.serialization_alias or n) in campos},
         )
+        pagina = create_model("EventoPaginaParcial", items=(List[modelo], ...), next_cursor=(Optional[str], None))
+    nombres = tuple(modelo.model_fields)
+    columnas = tuple(f.serialization_alias or n for n, f in modelo.model_fields.items())
+    columnas += tuple(c for c in _COLUMNAS_CURSOR if c not in columnas)
+    return Proyeccion(nombres, columnas, TypeAdapter(pagina))
+
+
+def serializar_pagina(
+    filas: Sequence[Sequence[Any]], next_cursor: Optional[str], proy: Optional[Proyeccion] = None,
+) -> bytes:
+    """
+    Página de eventos como JSON a partir de tuplas en el orden de `proy.columnas`.
+    Mismos bytes que el response_model, pero la validación y el volcado corren
+    enteros en pydantic-core, sin leer atributos de objetos ORM.
+    """
+    proy = proy or proyeccion()
+    # zip corta en `nombres`: las columnas extra del cursor no salen en la respuesta
+    items = [dict(zip(proy.nombres, f)) for f in filas]
+    return proy.pagina.dump_json(proy.pagina.validate_python({"items": items, "next_cursor": next_cursor}), by_alias=True)
 
 
 # ---------- READ ----------
-async def listar(session: AsyncSession) -> List[Evento]:
-    objetos = await crud.listar(session)
-    return objetos
+async def listar(session: AsyncSession, pagina: PaginaEventos) -> bytes:
+    filtros = pagina.model_dump(include={"q", "categoria", "estado", "fecha_ini", "fecha_fin"})
+    despues = _decodificar_cursor(pagina.cursor, pagina.orden) if pagina.cursor else None
+    proy = proyeccion(frozenset(pagina.fields) if pagina.fields else None)
+    # se pide un registro extra solo para saber si existe una página siguiente
+    filas = await crud.listar_filas(
+        session, proy.columnas, orden=pagina.orden, limit=pagina.limit + 1, despues=despues, **filtros
+    )
+    next_cursor = None
+    if len(filas) > pagina.limit:
+        filas = filas[: pagina.limit]
+        next_cursor = _codificar_cursor(pagina.orden, filas[-1])
+    return serializar_pagina(filas, next_cursor, proy)
 
 
 async def obtener(session: AsyncSession, id_evento: int) -> Evento:
@@ -39,14 +170,137 @@ async def obtener(session: AsyncSession, id_evento: int) -> Evento:
     return obj
 
 
+async def obtener_serializado(session: AsyncSession, id_evento: int) -> EntradaCache:
+    """`EventoOut` ya serializado a JSON (con su ETag), leído a través de la cache."""
+    entrada = await cache_eventos.obtener(id_evento)
+    if entrada is not None:
+        return entrada
+    marca = cache_eventos.marca()
+    obj = await obtener(session, id_evento)
+    cuerpo = EventoOut.model_validate(obj).model_dump_json(by_alias=True).encode()
+    return await cache_eventos.guardar(id_evento, cuerpo, marca, desde_replica=es_replica(session))
+
+
+_evento_out = TypeAdapter(EventoOut)
+
+
+async def obtener_lote(session: AsyncSession, ids: Sequence[int]) -> bytes:
+    """
+    `EventosPorId` serializado: los eventos en el orden pedido y sin repetidos.
+    Los que están en la cache de detalle salen de ahí; el resto, de un solo
+    SELECT ... IN, y quedan en la cache para las lecturas siguientes. Los ids
+    que no existen van en `faltantes`.
+    """
+    pedidos = list(dict.fromkeys(ids))
+    cuerpos: Dict[int, bytes] = {}
+    for id_evento in pedidos:
+        entrada = await cache_eventos.obtener(id_evento)
+        if entrada is not None:
+            cuerpos[id_evento] = entrada.cuerpo
+
+    pendientes = [i for i in pedidos if i not in cuerpos]
+    if pendientes:
+        marca = cache_eventos.marca()
+        replica = es_replica(session)
+        proy = proyeccion()
+        for fila in await crud.obtener_filas(session, pendientes, proy.columnas):
+            # mismos bytes que GET /api/v1/{id_evento}: la entrada sirve para ambos
+            cuerpo = _evento_out.dump_json(_evento_out.validate_python(dict(zip(proy.nombres, fila))), by_alias=True)
+            cuerpos[fila.idEvento] = (
+                await cache_eventos.guardar(fila.idEvento, cuerpo, marca, desde_replica=replica)
+            ).cuerpo
+
+    items = b",".join(cuerpos[i] for i in pedidos if i in cuerpos)
+    faltantes = json.dumps([i for i in pedidos if i not in cuerpos], separators=(",", ":")).encode()
+    return b'{"items":[' + items + b'],"faltantes":' + faltantes + b"}"
+
+
+
+async def obtener_detalle(session: AsyncSession, id_evento: int) -> bytes:
+    """`EventoDetalle` serializado: el evento con organizador, instalaciones, organizaciones, participantes y evaluaciones."""
+    objs = await crud.obtener_detalles(session, [id_evento])
+    if not objs:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Evento no encontrado")
+    return EventoDetalle.model_validate(objs[0]).model_dump_json(by_alias=True).encode()
+
+
+async def obtener_detalles(session: AsyncSession, ids: Sequence[int]) -> bytes:
+    """
+    `DetallesPorId` serializado, en el orden pedido y sin repetidos. Las
+    consultas son las mismas que para un solo evento (ver crud.obtener_detalles).
+    No pasa por la cache de eventos: las tablas relacionadas se modifican por
+    rutas que no la invalidan.
+    """
+    pedidos = list(dict.fromkeys(ids))
+    por_id = {obj.idEvento: obj for obj in await crud.obtener_detalles(session, pedidos)}
+    resultado = DetallesPorId(
+        items=[EventoDetalle.model_validate(por_id[i]) for i in pedidos if i in por_id],
+        faltantes=[i for i in pedidos if i not in por_id],
+    )
+    return resultado.model_dump_json(by_alias=True).encode()
+
 # ---------- UPDATE ----------
-async def actualizar(session: AsyncSession, id_evento: int, payload: EventoActualizar) -> Evento:
+async def actualizar(
+    session: AsyncSession, id_evento: int, payload: EventoActualizar, if_match: Optional[str] = None,
+) -> Evento:
     # usa alias + exclude_unset para parches parciales
     cambios: Dict[str, Any] = payload.model_dump(by_alias=True, exclude_unset=True, exclude_none=True)
-    try:
-        obj = await crud.actualizar(session, id_evento, cambios)
+    versiones = versiones_if_match(if_match)
+    if not _CAMPOS_AGENDA & cambios.keys():
+        return await _aplicar_cambios(session, id_evento, cambios, versiones)
+
+    await agenda.asegurar_cargado(session)
+    actual = agenda.reserva(id_evento)
+    previa = actual
+    if actual is None:
+        # sin reserva en la agenda: rechazado, inexistente o creado por otro worker
+        obj = await crud.obtener(session, id_evento)
         if not obj:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Evento no encontrado")
+        # las salas adicionales (eventoInstalacion) vuelven a ocuparse si se reactiva
+        adicionales = frozenset(i for _, i in await crud_agenda.adicionales_de(session, [id_evento]))
+        actual = Reserva(obj.idInstalacion, adicionales, obj.fechaInicio, obj.fechaFin)
+        if obj.estado != "rechazado":
+            previa = actual
+    vigente = cambios["estado"] != "rechazado" if "estado" in cambios else previa is not None
+    nueva = None
+    if vigente:
+        nueva = actual._replace(
+            id_instalacion=cambios.get("idInstalacion", actual.id_instalacion),
+            inicio=cambios.get("fechaInicio", actual.inicio),
+            fin=cambios.get("fechaFin", actual.fin),
+        )
+
+    salas = (previa.instalaciones if previa else frozenset()) | (nueva.instalaciones if nueva else frozenset())
+    async with agenda.bloqueo(salas):
+        if nueva:
+            await _sincronizar_agenda(session, nueva)
+            _verificar_disponibilidad(nueva, excluir=id_evento)
+        obj = await _aplicar_cambios(session, id_evento, cambios, versiones)
+        if nueva:
+            agenda.registrar(obj.idEvento, obj.idInstalacion, obj.fechaInicio, obj.fechaFin, nueva.adicionales)
+        else:
+            agenda.quitar(id_evento)
+    return obj
+
+
+async def _aplicar_cambios(
+    session: AsyncSession, id_evento: int, cambios: Dict[str, Any], versiones: Optional[List[int]] = None,
+) -> Evento:
+    try:
+        obj = await crud.actualizar(session, id_evento, cambios, versiones)
+        if not obj:
+            vigente = await crud.version_actual(session, id_evento) if versiones is not None else None
+            if vigente is None:
+                raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Evento no encontrado")
+            # otro cliente lo modificó después de la versión que envió este (If-Match)
+            raise HTTPException(
+                status_code=status.HTTP_412_PRECONDITION_FAILED,
+                detail=f"El evento cambió: la versión vigente es {vigente}",
+                headers={"ETag": etag_version(vigente)},
+            )
+        await cache_eventos.invalidar(id_evento)
+        _registrar_indicadores(obj)
         return obj
     except IntegrityError as e:
         await session.rollback()
@@ -61,3 +315,7 @@ async def eliminar(session: AsyncSession, id_evento: int) -> None:
     ok = await crud.eliminar(session, id_evento)
     if not ok:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Evento no encontrado")
+    agenda.quitar(id_evento)
+    kpis.quitar_evento(id_evento)
+    buscador.quitar(id_evento)
+    await cache_eventos.invalidar(id_evento)
@@ -0,0 +1,145 @@
+# app/services/indice.py
+import asyncio
+import time
+from abc import ABC, abstractmethod
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Optional, Set
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.crud import indice as crud
+from app.db import obtener_sesiones
+from app.db.replica import es_replica
+
+
+@asynccontextmanager
+async def _primaria(session: AsyncSession) -> AsyncIterator[AsyncSession]:
+    # una foto atrasada de la réplica quedaría así hasta el próximo cambio: se lee de la primaria
+    if es_replica(session):
+        async with obtener_sesiones()() as primaria:
+            yield primaria
+    else:
+        yield session
+
+
+class _MarcaBD:
+    """Última marca de cambios leída de la BD, compartida por los índices del proceso."""
+
+    # valores propios que se recuerdan; pasado el tope se olvidan los ya leídos
+    MAX_PROPIAS = 4096
+
+    def __init__(self) -> None:
+        self.valor: Optional[int] = None
+        self.leida = float("-inf")     # time.monotonic()
+        self._propias: Set[int] = set()
+
+    def vencida(self, vigencia_s: float) -> bool:
+        return self.valor is None or time.monotonic() - self.leida >= vigencia_s
+
+    async def leer(self, session: AsyncSession) -> int:
+        self.leida = time.monotonic()
+        self.valor = await crud.marca_cambios(session)
+        return self.valor
+
+    def propia(self, valor: int) -> None:
+        self._propias.add(valor)
+        if len(self._propias) > self.MAX_PROPIAS and self.valor is not None:
+            # un índice que no se consultó desde entonces se reconstruirá: solo cuesta una carga
+            self._propias = {v for v in self._propias if v > self.valor}
+
+    def solo_propias(self, desde: int, hasta: int) -> bool:
+        # el contador sube de a uno por transacción: ¿todos los valores en (desde, hasta] son de este proceso?
+        return 0 <= hasta - desde <= len(self._propias) and all(
+            v in self._propias for v in range(desde + 1, hasta + 1)
+        )
+
+
+_marca = _MarcaBD()
+
+
+@event.listens_for(Session, "after_commit")
+def _confirmar_marcas(session: Session) -> None:
+    # solo tras el commit: un valor revertido lo puede volver a tomar otro proceso
+    for valor in session.info.pop(crud.MARCAS_PROPIAS, ()):
+        _marca.propia(valor)
+
+
+@event.listens_for(Session, "after_rollback")
+def _descartar_marcas(session: Session) -> None:
+    session.info.pop(crud.MARCAS_PROPIAS, None)
+
+
+class IndiceEnMemoria(ABC):
+    """
+    Base para estructuras en memoria que se construyen desde la BD la primera vez
+    que se usan y luego se mantienen al día con cada escritura del API.
+
+    La BD sigue siendo la fuente de verdad: cada proceso (worker) tiene su propia
+    copia, y `invalidar()` obliga a reconstruirla en el siguiente uso. Con varios
+    workers las escrituras de los otros no llegan a esta copia: con
+    INDICES_VERIFICAR_S > 0 se compara cada tanto la marca de cambios de la BD
+    (crud/indice.py) con la de la última carga y, si se movió por una escritura
+    que no hizo este proceso, se reconstruye.
+    """
+
+    def __init__(self) -> None:
+        self._cargado = False
+        self._version = 0
+        self._marca: Optional[int] = None
+        self._lock = asyncio.Lock()
+
+    @property
+    def cargado(self) -> bool:
+        return self._cargado
+
+    @property
+    def version(self) -> int:
+        # cambia con cada escritura y con invalidar(): clave para lo que se derive del índice
+        return self._version
+
+    async def asegurar_cargado(self, session: AsyncSession) -> None:
+        if self._cargado and not await self._cambio_en_bd(session):
+            return
+        async with self._lock:
+            if self._cargado and not await self._cambio_en_bd(session):
+                return
+            version = self._version
+            async with _primaria(session) as fuente:
+                # leída antes de cargar: lo que se confirme durante la carga mueve la marca
+                marca = await _marca.leer(fuente) if settings.indices_verificar_s else None
+                await self._cargar(fuente)
+            self._marca = marca
+            # si hubo escrituras mientras se leía la BD, la foto puede estar vieja:
+            # se usa igual en esta llamada pero se vuelve a cargar en la siguiente
+            self._cargado = version == self._version
+
+    async def _cambio_en_bd(self, session: AsyncSession) -> bool:
+        if not settings.indices_verificar_s:
+            return False
+        marca = _marca.valor
+        if _marca.vencida(settings.indices_verificar_s):
+            async with _primaria(session) as fuente:
+                marca = await _marca.leer(fuente)
+        if marca == self._marca:
+            return False
+        if self._marca is not None and _marca.solo_propias(self._marca, marca):
+            # escrituras de este proceso: ya se aplicaron aquí después de su commit
+            self._marca = marca
+            return False
+        # también descarta lo derivado del índice (claves por `version`)
+        self.invalidar()
+        return True
+
+    def invalidar(self) -> None:
+        self._cargado = False
+        self._version += 1
+
+    def _marcar_cambio(self) -> None:
+        # las subclases lo llaman en cada escritura aplicada (o ignorada por no estar cargado)
+        self._version += 1
+
+    @abstractmethod
+    async def _cargar(self, session: AsyncSession) -> None:
+        """Reconstruye la estructura desde la BD."""
@@ -0,0 +1,77 @@
+# app/services/instalacion.py
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Tuple
+from fastapi import HTTPException, status
+from pydantic import TypeAdapter
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.schemas.instalacion import FiltrosDisponibles, FiltrosHuecos, FiltrosOcupacion, HuecoOut, OcupacionMes
+from app.services.agenda import agenda, Conflicto, Instalacion
+from app.services.ocupacion import MINUTOS_FRANJA
+
+
+def _verificar_instalacion(id_instalacion: int) -> None:
+    if agenda.instalacion(id_instalacion) is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Instalación no encontrada")
+
+
+# ---------- CONFLICTOS ----------
+async def conflictos(
+    session: AsyncSession,
+    id_instalacion: int,
+    desde: Optional[datetime] = None,
+    hasta: Optional[datetime] = None,
+) -> List[Conflicto]:
+    await agenda.asegurar_cargado(session)
+    _verificar_instalacion(id_instalacion)
+    return agenda.conflictos_instalacion(id_instalacion, desde, hasta)
+
+
+# ---------- DISPONIBILIDAD ----------
+async def disponibles(session: AsyncSession, filtros: FiltrosDisponibles) -> List[Instalacion]:
+    await agenda.asegurar_cargado(session)
+    return agenda.disponibles(filtros.desde, filtros.hasta, filtros.capacidad, filtros.tipo)
+
+
+async def huecos(session: AsyncSession, id_instalacion: int, filtros: FiltrosHuecos) -> List[HuecoOut]:
+    await agenda.asegurar_cargado(session)
+    _verificar_instalacion(id_instalacion)
+    minimo = timedelta(minutes=filtros.duracion_min or 0)
+    return [
+        HuecoOut(inicio=h.inicio, fin=h.fin, minutos=int((h.fin - h.inicio).total_seconds() // 60))
+        for h in agenda.huecos(id_instalacion, filtros.desde, filtros.hasta)
+        if h.fin - h.inicio >= minimo
+    ]
+
+
+# ---------- OCUPACIÓN ----------
+_ocupacion_mes = TypeAdapter(OcupacionMes)
+# mes -> (versión de la agenda, respuesta); la UI pide los mismos meses una y otra vez
+_respuestas_ocupacion: Dict[str, Tuple[int, bytes]] = {}
+_MAX_MESES = 24
+
+
+async def ocupacion(session: AsyncSession, filtros: FiltrosOcupacion) -> bytes:
+    """`OcupacionMes` serializado, leído del calendario que mantiene la agenda."""
+    await agenda.asegurar_cargado(session)
+    guardada = _respuestas_ocupacion.get(filtros.mes)
+    if guardada is not None and guardada[0] == agenda.version:
+        return guardada[1]
+
+    version = agenda.version
+    anio, mes = (int(p) for p in filtros.mes.split("-"))
+    resultado = {
+        "mes": filtros.mes,
+        "minutos_franja": MINUTOS_FRANJA,
+        "instalaciones": [
+            {"id_instalacion": inst.id_instalacion, "nombre": inst.nombre, "dias": [d._asdict() for d in dias]}
+            for inst, dias in agenda.ocupacion(anio, mes)
+        ],
+    }
+    cuerpo = _ocupacion_mes.dump_json(_ocupacion_mes.validate_python(resultado), by_alias=True)
+    # con una recarga pendiente (escrituras durante la carga) la foto puede estar vieja: no se guarda
+    if agenda.cargado:
+        _respuestas_ocupacion.pop(filtros.mes, None)
+        if len(_respuestas_ocupacion) >= _MAX_MESES:
+            del _respuestas_ocupacion[next(iter(_respuestas_ocupacion))]
+        _respuestas_ocupacion[filtros.mes] = (version, cuerpo)
+    return cuerpo
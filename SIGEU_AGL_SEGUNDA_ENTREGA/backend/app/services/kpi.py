@@ -0,0 +1,319 @@
+# app/services/kpi.py
+"""
+Indicadores de gestión (Consultas 02, 03, 05, 06, 07 y 12 de 4_consultas_avanzadas.sql)
+mantenidos como agregados en memoria.
+
+Se construyen una vez desde la BD y cada escritura del API aplica solo su delta
+(quita la contribución anterior del evento y suma la nueva), de modo que servir
+un indicador no vuelve a recorrer `evento`/`evaluacion`.
+"""
+from collections import Counter
+from datetime import date, datetime, timedelta
+from typing import Any, Dict, FrozenSet, Hashable, Iterable, List, NamedTuple, Optional, Tuple
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.crud import kpi as crud
+from app.services.indice import IndiceEnMemoria
+
+PENDIENTES = ("registrado", "enRevision")
+EVALUADOS = ("aprobado", "rechazado")
+
+
+class _Evento(NamedTuple):
+    estado: str
+    categoria: str
+    id_organizador: int
+    id_instalacion: int
+    instalaciones: FrozenSet[int]   # por defecto + adicionales (como el UNION de la Consulta 02)
+    inicio: datetime
+    fin: datetime
+    registro: Optional[date]
+    aprobadas: int                  # evaluaciones del evento por veredicto
+    rechazadas: int
+
+
+def _sumar(contador: Counter, clave: Hashable, delta: int) -> None:
+    valor = contador[clave] + delta
+    if valor:
+        contador[clave] = valor
+    else:
+        del contador[clave]
+
+
+def _horas(inicio: datetime, fin: datetime) -> int:
+    # TIMESTAMPDIFF(HOUR, inicio, fin): horas completas
+    return int((fin - inicio).total_seconds() // 3600)
+
+
+def tasa_aprobacion(aprobados: int, evaluados: int) -> Optional[float]:
+    return round(100 * aprobados / evaluados, 2) if evaluados else None
+
+
+def _restar_meses(d: date, meses: int) -> date:
+    total = d.year * 12 + d.month - 1 - meses
+    anio, mes = divmod(total, 12)
+    mes += 1
+    ultimo_dia = (date(anio + (mes == 12), mes % 12 + 1, 1) - timedelta(days=1)).day
+    return date(anio, mes, min(d.day, ultimo_dia))
+
+
+class IndicadoresEventos(IndiceEnMemoria):
+    def __init__(self) -> None:
+        super().__init__()
+        self._reiniciar()
+
+    def _reiniciar(self) -> None:
+        self._eventos: Dict[int, _Evento] = {}
+        self._por_estado: Counter = Counter()
+        self._eval_organizador: Counter = Counter()     # (idOrganizador, veredicto)
+        self._eval_categoria: Counter = Counter()       # (categoria, veredicto)
+        self._pendientes_por_registro: Counter = Counter()  # date(fechaRegistro)
+        self._horas_por_dia: Counter = Counter()        # (idInstalacion, date(fechaInicio))
+        self._eventos_por_dia: Counter = Counter()      # (date(fechaInicio), categoria)
+        self._nombres_organizador: Dict[int, str] = {}
+        self._nombres_instalacion: Dict[int, str] = {}
+
+    # ---------- construcción ----------
+    async def _cargar(self, session: AsyncSession) -> None:
+        self.cargar_desde(
+            await crud.eventos(session),
+            await crud.instalaciones_adicionales(session),
+            await crud.evaluaciones_por_evento(session),
+            await crud.nombres_organizadores(session),
+            await crud.nombres_instalaciones(session),
+        )
+
+    def cargar_desde(
+        self,
+        eventos: Iterable[Tuple[Any, ...]],
+        adicionales: Iterable[Tuple[int, int]] = (),
+        evaluaciones: Iterable[Tuple[int, str, int]] = (),
+        nombres_organizador: Iterable[Tuple[int, str]] = (),
+        nombres_instalacion: Iterable[Tuple[int, str]] = (),
+    ) -> None:
+        extra: Dict[int, set] = {}
+        for id_evento, id_inst in adicionales:
+            extra.setdefault(id_evento, set()).add(id_inst)
+        veredictos: Counter = Counter()
+        for id_evento, estado, cantidad in evaluaciones:
+            veredictos[(id_evento, estado)] += cantidad
+
+        self._reiniciar()
+        for id_evento, estado, categoria, id_org, id_inst, inicio, fin, registro in eventos:
+            ev = _Evento(
+                estado, categoria, id_org, id_inst,
+                frozenset(extra.get(id_evento, ())) | {id_inst},
+                inicio, fin,
+                registro.date() if registro else None,
+                veredictos[(id_evento, "aprobado")], veredictos[(id_evento, "rechazado")],
+            )
+            self._eventos[id_evento] = ev
+            self._aplicar(ev, +1)
+        self._nombres_organizador = dict(nombres_organizador)
+        self._nombres_instalacion = dict(nombres_instalacion)
+        self._cargado = True
+
+    def _aplicar(self, ev: _Evento, signo: int) -> None:
+        _sumar(self._por_estado, ev.estado, signo)
+        if ev.aprobadas:
+            _sumar(self._eval_organizador, (ev.id_organizador, "aprobado"), signo * ev.aprobadas)
+            _sumar(self._eval_categoria, (ev.categoria, "aprobado"), signo * ev.aprobadas)
+        if ev.rechazadas:
+            _sumar(self._eval_organizador, (ev.id_organizador, "rechazado"), signo * ev.rechazadas)
+            _sumar(self._eval_categoria, (ev.categoria, "rechazado"), signo * ev.rechazadas)
+        if ev.estado in PENDIENTES and ev.registro:
+            _sumar(self._pendientes_por_registro, ev.registro, signo)
+        horas = _horas(ev.inicio, ev.fin)
+        if horas:
+            for inst in ev.instalaciones:
+                _sumar(self._horas_por_dia, (inst, ev.inicio.date()), signo * horas)
+        _sumar(self._eventos_por_dia, (ev.inicio.date(), ev.categoria), signo)
+
+    # ---------- sincronización con escrituras ----------
+    def registrar_evento(
+        self,
+        id_evento: int,
+        estado: str,
+        categoria: str,
+        id_organizador: int,
+        id_instalacion: int,
+        inicio: datetime,
+        fin: datetime,
+        fecha_registro: Optional[datetime] = None,
+    ) -> None:
+        self._marcar_cambio()
+        if not self._cargado:
+            return
+        anterior = self._eventos.pop(id_evento, None)
+        if anterior:
+            self._aplicar(anterior, -1)
+        if fecha_registro is not None:
+            registro = fecha_registro.date()
+        else:
+            # fechaRegistro la pone la BD (CURRENT_TIMESTAMP) al insertar
+            registro = anterior.registro if anterior else date.today()
+        adicionales = anterior.instalaciones - {anterior.id_instalacion} if anterior else frozenset()
+        ev = _Evento(
+            estado, categoria, id_organizador, id_instalacion,
+            adicionales | {id_instalacion},
+            inicio.replace(tzinfo=None), fin.replace(tzinfo=None), registro,
+            anterior.aprobadas if anterior else 0, anterior.rechazadas if anterior else 0,
+        )
+        self._eventos[id_evento] = ev
+        self._aplicar(ev, +1)
+
+    def quitar_evento(self, id_evento: int) -> None:
+        self._marcar_cambio()
+        anterior = self._eventos.pop(id_evento, None)
+        if anterior:
+            # las evaluaciones se borran en cascada con el evento
+            self._aplicar(anterior, -1)
+
+    def registrar_evaluaciones(self, id_evento: int, veredicto: str, cantidad: int = 1) -> None:
+        self._marcar_cambio()
+        anterior = self._eventos.get(id_evento) if self._cargado else None
+        if anterior is None:
+            return
+        self._aplicar(anterior, -1)
+        ev = anterior._replace(
+            aprobadas=anterior.aprobadas + (cantidad if veredicto == "aprobado" else 0),
+            rechazadas=anterior.rechazadas + (cantidad if veredicto == "rechazado" else 0),
+        )
+        self._eventos[id_evento] = ev
+        self._aplicar(ev, +1)
+
+    # ---------- indicadores ----------
+    def aprobacion_global(self) -> Dict[str, Any]:
+        # Consulta 03
+        aprobados = self._por_estado["aprobado"]
+        evaluados = sum(self._por_estado[e] for e in EVALUADOS)
+        return {
+            "aprobados": aprobados,
+            "evaluados": evaluados,
+            "tasa_aprobacion_pct": tasa_aprobacion(aprobados, evaluados),
+            "pendientes": sum(self._por_estado[e] for e in PENDIENTES),
+        }
+
+    def aprobacion_por_organizador(self) -> List[Dict[str, Any]]:
+        # Consulta 05
+        filas = []
+        for id_org in {org for org, _ in self._eval_organizador}:
+            aprobados = self._eval_organizador[(id_org, "aprobado")]
+            evaluados = aprobados + self._eval_organizador[(id_org, "rechazado")]
+            filas.append({
+                "id_usuario": id_org,
+                "nombre": self._nombres_organizador.get(id_org),
+                "aprobados": aprobados,
+                "evaluados": evaluados,
+                "tasa_aprobacion_pct": tasa_aprobacion(aprobados, evaluados),
+            })
+        filas.sort(key=lambda f: (-(f["tasa_aprobacion_pct"] or 0), -f["evaluados"], f["id_usuario"]))
+        return filas
+
+    def aprobacion_por_categoria(self) -> List[Dict[str, Any]]:
+        # Consulta 06
+        filas = []
+        for categoria in {cat for cat, _ in self._eval_categoria}:
+            aprobados = self._eval_categoria[(categoria, "aprobado")]
+            evaluados = aprobados + self._eval_categoria[(categoria, "rechazado")]
+            filas.append({
+                "categoria": categoria,
+                "aprobados": aprobados,
+                "evaluados": evaluados,
+                "tasa_aprobacion_pct": tasa_aprobacion(aprobados, evaluados),
+            })
+        filas.sort(key=lambda f: (-(f["tasa_aprobacion_pct"] or 0), f["categoria"]))
+        return filas
+
+    def backlog(self, hoy: Optional[date] = None) -> Dict[str, int]:
+        # Consulta 07: días desde fechaRegistro de los pendientes
+        hoy = hoy or date.today()
+        buckets = {"pendientes_0a2d": 0, "pendientes_3a7d": 0, "pendientes_8a14d": 0, "pendientes_mas14d": 0}
+        for registro, cantidad in self._pendientes_por_registro.items():
+            dias = (hoy - registro).days
+            if dias < 0:
+                continue
+            if dias <= 2:
+                buckets["pendientes_0a2d"] += cantidad
+            elif dias <= 7:
+                buckets["pendientes_3a7d"] += cantidad
+            elif dias <= 14:
+                buckets["pendientes_8a14d"] += cantidad
+            else:
+                buckets["pendientes_mas14d"] += cantidad
+        return buckets
+
+    def horas_instalacion_30d(self, hoy: Optional[date] = None) -> List[Dict[str, Any]]:
+        # Consulta 02 / fn_horas_instalacion_30d: eventos con fechaInicio >= hoy - 30 días
+        limite = (hoy or date.today()) - timedelta(days=30)
+        horas: Counter = Counter()
+        for (inst, dia), h in self._horas_por_dia.items():
+            if dia >= limite:
+                horas[inst] += h
+        filas = [
+            {"id_instalacion": inst, "nombre": self._nombres_instalacion.get(inst), "horas_reservadas_30d": h}
+            for inst, h in horas.items() if h
+        ]
+        filas.sort(key=lambda f: (-f["horas_reservadas_30d"], f["id_instalacion"]))
+        return filas
+
+    def serie_mensual(self, meses: int = 12, hoy: Optional[date] = None) -> List[Dict[str, Any]]:
+        # Consulta 12: eventos por mes de fechaInicio y categoría
+        limite = _restar_meses(hoy or date.today(), meses)
+        totales: Counter = Counter()
+        for (dia, categoria), cantidad in self._eventos_por_dia.items():
+            if dia >= limite:
+                totales[(dia.year, dia.month, categoria)] += cantidad
+        return [
+            {"anio": anio, "mes": f"{mes:02d}", "categoria": categoria, "total_eventos": total}
+            for (anio, mes, categoria), total in sorted(totales.items())
+        ]
+
+    # ---------- verificación ----------
+    def resumen(self) -> Dict[str, Counter]:
+        return {
+            "por_estado": self._por_estado,
+            "evaluaciones_por_organizador": self._eval_organizador,
+            "evaluaciones_por_categoria": self._eval_categoria,
+            "pendientes_por_registro": self._pendientes_por_registro,
+            "horas_por_dia": self._horas_por_dia,
+            "eventos_por_dia": self._eventos_por_dia,
+        }
+
+    def adoptar(self, otro: "IndicadoresEventos") -> None:
+        """Toma los agregados de `otro` (reconstruido desde la BD) sin cambiar de instancia."""
+        for nombre in (
+            "_eventos", "_por_estado", "_eval_organizador", "_eval_categoria",
+            "_pendientes_por_registro", "_horas_por_dia", "_eventos_por_dia",
+            "_nombres_organizador", "_nombres_instalacion",
+        ):
+            setattr(self, nombre, getattr(otro, nombre))
+        self._marcar_cambio()
+        self._cargado = True
+
+
+# instancia del proceso
+kpis = IndicadoresEventos()
+
+
+async def reconstruir(session: AsyncSession) -> Dict[str, Any]:
+    """
+    Reconstrucción completa desde la BD. Si los agregados incrementales ya estaban
+    cargados, informa qué indicadores no coincidían con el recálculo.
+    """
+    nuevo = IndicadoresEventos()
+    await nuevo._cargar(session)
+    diferencias: List[str] = []
+    if kpis.cargado:
+        actual = kpis.resumen()
+        for nombre, contador in nuevo.resumen().items():
+            if actual[nombre] != contador:
+                diferencias.append(nombre)
+    verificado = kpis.cargado
+    kpis.adoptar(nuevo)
+    return {
+        "eventos": len(nuevo._eventos),
+        "verificado": verificado,
+        "consistente": not diferencias,
+        "diferencias": diferencias,
+    }
@@ -0,0 +1,333 @@
+# app/services/notificaciones.py
+"""
+Despacho asíncrono de la tabla notificacion.
+
+Pendiente = `fechaEnvio` NULL. Un bucle por proceso lee pendientes por lotes
+(siempre desde la más vieja, sin las que ya tiene en curso), las entrega con
+un emisor intercambiable (a lo sumo `notificaciones_trabajadores` envíos a la
+vez, con reintentos y espera exponencial) y marca `fechaEnvio` en un solo
+UPDATE por ronda. Quien registra un veredicto solo llama a `avisar()`: nunca
+espera la entrega.
+
+No se guarda un "último id leído": los ids autoincrementales de transacciones
+concurrentes se confirman en cualquier orden, y una notificación con id menor
+que otra ya leída quedaría sin enviar.
+
+Entrega al menos una vez: si el proceso cae entre el envío y la marca, la
+notificación se vuelve a enviar al arrancar. Con varios workers de uvicorn
+despacha solo el que toma el candado; los demás reintentan tomarlo en cada
+vuelta del bucle (cada `notificaciones_intervalo_s` o al recibir un aviso),
+así que si el que despacha termina (p. ej. en una recarga escalonada, donde el
+worker nuevo arranca mientras el viejo aún lo tiene) otro lo reemplaza.
+"""
+import asyncio
+import hashlib
+import importlib
+import json
+import logging
+import random
+import tempfile
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, asdict
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Deque, Dict, List, Optional, Protocol, Set, Tuple
+
+try:
+    import fcntl
+except ImportError:  # Windows: sin candado entre procesos (un solo worker)
+    fcntl = None
+
+from sqlalchemy.exc import SQLAlchemyError
+from app.core import metricas
+from app.core.config import settings
+from app.crud import notificacion as crud
+
+log = logging.getLogger("sigeu.notificaciones")
+
+# últimas notificaciones descartadas tras agotar los reintentos
+MAX_FALLIDAS = 50
+
+
+# ---------- MENSAJE ----------
+@dataclass
+class Mensaje:
+    id_notificacion: int
+    destinatario: str
+    nombre: str
+    asunto: str
+    cuerpo: str
+    adjunto: Optional[str]
+    revisada: datetime          # fecha de la evaluación (o de la lectura si no tiene)
+
+
+def renderizar(fila: Tuple[Any, ...]) -> Mensaje:
+    id_notificacion, tipo, justificacion, url_pdf, correo, nombre, id_evento, evento, revisada = fila
+    lineas = [
+        f"Hola {nombre},",
+        "",
+        f"El evento «{evento}» (#{id_evento}) fue {tipo} por el comité de evaluación.",
+    ]
+    if justificacion:
+        lineas += ["", f"Observaciones: {justificacion}"]
+    if url_pdf:
+        lineas += ["", f"Acta: {url_pdf}"]
+    return Mensaje(
+        id_notificacion=id_notificacion,
+        destinatario=correo,
+        nombre=nombre,
+        asunto=f"Evento «{evento}» {tipo}",
+        cuerpo="\n".join(lineas),
+        adjunto=url_pdf,
+        revisada=revisada or datetime.now(),
+    )
+
+
+# ---------- EMISORES ----------
+class Emisor(Protocol):
+    async def enviar(self, mensaje: Mensaje) -> None:
+        """Entrega el mensaje o lanza una excepción (cuenta como intento fallido)."""
+
+
+def _json(mensaje: Mensaje) -> str:
+    return json.dumps(asdict(mensaje), ensure_ascii=False, default=str)
+
+
+class EmisorArchivo:
+    """Sustituto local del correo: una línea JSON por mensaje."""
+
+    def __init__(self, ruta: str) -> None:
+        self.ruta = Path(ruta)
+        self._candado = threading.Lock()
+
+    async def enviar(self, mensaje: Mensaje) -> None:
+        await asyncio.to_thread(self._escribir, _json(mensaje) + "\n")
+
+    def _escribir(self, linea: str) -> None:
+        with self._candado, self.ruta.open("a", encoding="utf-8") as f:
+            f.write(linea)
+
+
+class EmisorConsola:
+    async def enviar(self, mensaje: Mensaje) -> None:
+        print(_json(mensaje), flush=True)
+
+
+def emisor_desde(nombre: str, salida: str) -> Emisor:
+    if nombre == "archivo":
+        return EmisorArchivo(salida)
+    if nombre == "stdout":
+        return EmisorConsola()
+    modulo, _, clase = nombre.partition(":")
+    return getattr(importlib.import_module(modulo), clase)()
+
+
+# ---------- DESPACHADOR ----------
+class Despachador:
+    def __init__(self) -> None:
+        self._tarea: Optional[asyncio.Task] = None
+        self._entregas: Set[asyncio.Task] = set()
+        self._despertar: Optional[asyncio.Event] = None
+        self._candado_archivo = None
+        self._despacha = False
+        self._detenido = False
+        # id -> mensaje leído y aún sin confirmar (en envío, esperando reintento o sin marcar)
+        self._en_curso: Dict[int, Mensaje] = {}
+        self._entregadas: List[int] = []
+        self._descartadas: List[int] = []
+        # agotaron los reintentos: siguen con fechaEnvio NULL y no se vuelven a leer hasta reiniciar
+        self._descartadas_ids: Set[int] = set()
+        self._fallidas: Deque[Dict[str, Any]] = deque(maxlen=MAX_FALLIDAS)
+        self._enviadas_total = 0
+        self._inicio = 0.0
+
+    @property
+    def activo(self) -> bool:
+        """Este proceso tiene el candado y su bucle está despachando."""
+        return self._despacha and self._tarea is not None and not self._tarea.done()
+
+    # ---------- ciclo de vida ----------
+    async def iniciar(self, sesiones, emisor: Optional[Emisor] = None) -> bool:
+        """
+        Arranca el bucle. Devuelve si este proceso tomó el candado de despacho;
+        si no, el bucle lo sigue intentando y despacha cuando lo consigue.
+        """
+        if self._tarea is not None and not self._tarea.done():
+            return self._despacha
+        self._sesiones = sesiones
+        self._emisor = emisor or emisor_desde(settings.notificaciones_emisor, settings.notificaciones_salida)
+        self._semaforo = asyncio.Semaphore(settings.notificaciones_trabajadores)
+        self._despertar = asyncio.Event()
+        self._detenido = False
+        if not self._intentar_candado():
+            log.info("Otro proceso despacha las notificaciones (%s); se reintenta", self._ruta_candado())
+        self._tarea = asyncio.create_task(self._bucle(), name="notificaciones")
+        return self._despacha
+
+    async def detener(self, espera_s: float = 5) -> None:
+        """Deja terminar los envíos en curso (hasta `espera_s`) y marca las entregadas."""
+        if self._tarea is None:
+            return
+        # además de cancelar: wait_for (Python 3.11) puede tragarse la cancelación si el aviso
+        # llega en el mismo instante, y el bucle seguiría vivo con detener() esperándolo
+        self._detenido = True
+        self._tarea.cancel()
+        await asyncio.gather(self._tarea, return_exceptions=True)
+        if self._entregas:
+            _, sin_terminar = await asyncio.wait(self._entregas, timeout=espera_s)
+            for t in sin_terminar:
+                t.cancel()
+            await asyncio.gather(*sin_terminar, return_exceptions=True)
+        try:
+            await self._confirmar()
+        except SQLAlchemyError as e:
+            log.warning("No se pudieron marcar %d notificaciones enviadas: %s", len(self._entregadas), e)
+        self._tarea = self._despertar = None
+        self._en_curso.clear()
+        self._soltar_candado()
+        self._despacha = False
+
+    def avisar(self) -> None:
+        """Hay pendientes nuevas: adelanta la próxima ronda (no bloquea)."""
+        if self._despertar is not None:
+            self._despertar.set()
+
+    # ---------- bucle ----------
+    async def _bucle(self) -> None:
+        while not self._detenido:
+            self._despertar.clear()
+            if self._despacha or self._intentar_candado():
+                try:
+                    await self._ronda()
+                except SQLAlchemyError as e:
+                    log.warning("Despacho de notificaciones: %s", e)
+            try:
+                await asyncio.wait_for(self._despertar.wait(), settings.notificaciones_intervalo_s)
+            except asyncio.TimeoutError:
+                pass
+
+    async def _ronda(self) -> None:
+        await self._confirmar()
+        cupo = settings.notificaciones_lote - len(self._en_curso)
+        if cupo > 0:
+            async with self._sesiones() as session:
+                filas = await crud.pendientes(session, self._en_curso.keys() | self._descartadas_ids, cupo)
+            for fila in filas:
+                mensaje = renderizar(fila)
+                self._en_curso[mensaje.id_notificacion] = mensaje
+                tarea = asyncio.create_task(self._entregar(mensaje))
+                self._entregas.add(tarea)
+                tarea.add_done_callback(self._entregas.discard)
+        self._medir()
+
+    async def _entregar(self, mensaje: Mensaje) -> None:
+        intento = 0
+        while True:
+            async with self._semaforo:
+                try:
+                    await self._emisor.enviar(mensaje)
+                    error = None
+                except Exception as e:  # emisor externo: cualquier falla cuenta como intento
+                    error = e
+            if error is None:
+                metricas.notificaciones_intentos.inc("enviada")
+                metricas.notificaciones_entrega.observar(
+                    max(0.0, (datetime.now() - mensaje.revisada).total_seconds())
+                )
+                self._entregadas.append(mensaje.id_notificacion)
+                break
+            intento += 1
+            if intento > settings.notificaciones_reintentos:
+                metricas.notificaciones_intentos.inc("descartada")
+                log.error("Notificación %d descartada tras %d intentos: %s", mensaje.id_notificacion, intento, error)
+                self._fallidas.append({
+                    "idNotificacion": mensaje.id_notificacion,
+                    "destinatario": mensaje.destinatario,
+                    "intentos": intento,
+                    "error": str(error)[:500],
+                    "fecha": datetime.now().isoformat(timespec="seconds"),
+                })
+                self._descartadas.append(mensaje.id_notificacion)
+                break
+            metricas.notificaciones_intentos.inc("reintento")
+            espera = min(settings.notificaciones_espera_s * 2 ** (intento - 1), settings.notificaciones_espera_max_s)
+            # jitter: los reintentos de un mismo corte no llegan juntos al servidor
+            await asyncio.sleep(espera * random.uniform(0.5, 1.0))
+        self.avisar()
+
+    async def _confirmar(self) -> None:
+        """Marca fechaEnvio de lo entregado y lo saca de en curso."""
+        if self._entregadas:
+            ids, self._entregadas = self._entregadas, []
+            try:
+                async with self._sesiones() as session:
+                    await crud.marcar_enviadas(session, ids, datetime.now())
+            except BaseException:
+                self._entregadas = ids + self._entregadas
+                raise
+            self._enviadas_total += len(ids)
+            for i in ids:
+                self._en_curso.pop(i, None)
+        for i in self._descartadas:
+            self._en_curso.pop(i, None)
+            self._descartadas_ids.add(i)
+        self._descartadas.clear()
+
+    def _medir(self) -> None:
+        metricas.notificaciones_pendientes.fijar(v=len(self._en_curso))
+        mas_vieja = min((m.revisada for m in self._en_curso.values()), default=None)
+        retraso = (datetime.now() - mas_vieja).total_seconds() if mas_vieja else 0.0
+        metricas.notificaciones_retraso.fijar(v=max(0.0, retraso))
+
+    # ---------- candado entre procesos ----------
+    @staticmethod
+    def _ruta_candado() -> Path:
+        if settings.notificaciones_candado:
+            return Path(settings.notificaciones_candado)
+        base = hashlib.sha1(settings.database_url.encode()).hexdigest()[:12]
+        return Path(tempfile.gettempdir()) / f"sigeu-notificaciones-{base}.lock"
+
+    def _intentar_candado(self) -> bool:
+        if self._tomar_candado(self._ruta_candado()):
+            if self._tarea is not None:
+                log.info("Este proceso toma el despacho de notificaciones")
+            self._despacha = True
+            self._inicio = time.monotonic()
+        return self._despacha
+
+    def _tomar_candado(self, ruta: Path) -> bool:
+        if fcntl is None:
+            return True
+        f = open(ruta, "w")
+        try:
+            fcntl.flock(f, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            f.close()
+            return False
+        self._candado_archivo = f
+        return True
+
+    def _soltar_candado(self) -> None:
+        if self._candado_archivo is not None:
+            self._candado_archivo.close()
+            self._candado_archivo = None
+
+    # ---------- estado ----------
+    def estado(self) -> Dict[str, Any]:
+        segundos = time.monotonic() - self._inicio if self.activo else 0.0
+        self._medir()
+        return {
+            "activo": self.activo,
+            "emisor": settings.notificaciones_emisor,
+            "en_curso": len(self._en_curso),
+            "descartadas": len(self._descartadas_ids),
+            "retraso_s": metricas.notificaciones_retraso.valores.get((), 0.0),
+            "enviadas": self._enviadas_total,
+            "enviadas_por_s": round(self._enviadas_total / segundos, 2) if segundos else None,
+            "fallidas": list(self._fallidas),
+        }
+
+
+despachador = Despachador()
@@ -0,0 +1,118 @@
+# app/services/ocupacion.py
+"""
+Calendario de ocupación por (instalación, día).
+
+Por cada día con reservas se guardan los minutos reservados, cuántos eventos
+tocan el día y un mapa de bits de franjas de 30 minutos (bit 0 = 00:00-00:30,
+bit 47 = 23:30-24:00) que se marca si algún evento pisa la franja. Lo mantiene
+la agenda (`agenda.registrar` / `agenda.quitar`), así que la vista de un mes
+para todas las salas es una lectura de diccionarios, no el agregado de la
+Consulta 02 / `fn_horas_instalacion_30d` sobre `evento` + `eventoInstalacion`.
+
+Los minutos son la suma de la duración de cada evento dentro del día (si dos
+eventos se solapan cuentan los dos, como en la Consulta 02, pero sin truncar a
+horas enteras). Un evento que cruza la medianoche se reparte entre los días.
+"""
+from datetime import date, datetime, time, timedelta
+from typing import Callable, Dict, Iterable, Iterator, List, NamedTuple, Tuple
+
+MINUTOS_FRANJA = 30
+FRANJAS_DIA = 24 * 60 // MINUTOS_FRANJA
+_SEG_FRANJA = MINUTOS_FRANJA * 60
+_UN_DIA = timedelta(days=1)
+
+# reservas (inicio, idEvento, fin) de la sala que se solapan con [desde, hasta); ver agenda._Sala.solapadas
+Solapadas = Callable[[datetime, datetime], Iterable[Tuple[datetime, int, datetime]]]
+
+
+class DiaOcupacion(NamedTuple):
+    dia: date
+    minutos: int
+    eventos: int
+    franjas: int        # mapa de bits, FRANJAS_DIA bits
+
+
+class _Dia:
+    __slots__ = ("minutos", "eventos", "franjas")
+
+    def __init__(self) -> None:
+        self.minutos = 0
+        self.eventos = 0
+        self.franjas = 0
+
+
+def _segundos(inicio: datetime, fin: datetime) -> Tuple[int, int]:
+    # [inicio, fin) dentro del día en segundos desde las 00:00 (fin puede ser las 00:00 del siguiente)
+    desde = inicio.hour * 3600 + inicio.minute * 60 + inicio.second
+    return desde, desde + int((fin - inicio).total_seconds())
+
+
+def _mascara(desde: int, hasta: int) -> int:
+    # la franja donde termina cuenta solo si el evento entra en ella
+    primera, ultima = desde // _SEG_FRANJA, min(-(-hasta // _SEG_FRANJA), FRANJAS_DIA)
+    return ((1 << (ultima - primera)) - 1) << primera if ultima > primera else 0
+
+
+def _tramos(inicio: datetime, fin: datetime) -> Iterator[Tuple[date, datetime, datetime]]:
+    # [inicio, fin) partido en días
+    while inicio < fin:
+        dia = inicio.date()
+        medianoche = datetime.combine(dia + _UN_DIA, time())
+        corte = fin if fin <= medianoche else medianoche
+        yield dia, inicio, corte
+        inicio = corte
+
+
+class CalendarioOcupacion:
+    def __init__(self) -> None:
+        self._salas: Dict[int, Dict[date, _Dia]] = {}
+
+    def agregar(self, id_instalacion: int, inicio: datetime, fin: datetime) -> None:
+        dias = self._salas.setdefault(id_instalacion, {})
+        for dia, desde, hasta in _tramos(inicio, fin):
+            d = dias.get(dia)
+            if d is None:
+                d = dias[dia] = _Dia()
+            s0, s1 = _segundos(desde, hasta)
+            d.minutos += (s1 - s0) // 60
+            d.eventos += 1
+            d.franjas |= _mascara(s0, s1)
+
+    def quitar(self, id_instalacion: int, inicio: datetime, fin: datetime, restantes: Solapadas) -> None:
+        """
+        Descuenta una reserva ya quitada de la sala. Los bits de un día se
+        rehacen con `restantes` (las reservas que siguen en la sala): otra
+        reserva puede ocupar las mismas franjas.
+        """
+        dias = self._salas.get(id_instalacion)
+        if dias is None:
+            return
+        for dia, desde, hasta in _tramos(inicio, fin):
+            d = dias.get(dia)
+            if d is None:
+                continue
+            s0, s1 = _segundos(desde, hasta)
+            d.minutos -= (s1 - s0) // 60
+            d.eventos -= 1
+            if d.eventos <= 0:
+                del dias[dia]
+                continue
+            cero = datetime.combine(dia, time())
+            franjas = 0
+            for r_inicio, _, r_fin in restantes(cero, cero + _UN_DIA):
+                franjas |= _mascara(*_segundos(max(r_inicio, cero), min(r_fin, cero + _UN_DIA)))
+            d.franjas = franjas
+
+    def mes(self, id_instalacion: int, anio: int, mes: int) -> List[DiaOcupacion]:
+        """Días del mes con reservas en la instalación, en orden."""
+        dias = self._salas.get(id_instalacion)
+        if not dias:
+            return []
+        salida = []
+        dia = date(anio, mes, 1)
+        while dia.month == mes:
+            d = dias.get(dia)
+            if d is not None:
+                salida.append(DiaOcupacion(dia, d.minutos, d.eventos, d.franjas))
+            dia += _UN_DIA
+        return salida
@@ -0,0 +1,143 @@
+# app/services/reporte.py
+import csv
+import io
+from datetime import date, datetime, time, timedelta
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Hashable, List, Optional
+from pydantic import BaseModel, TypeAdapter
+from pydantic_core import to_json
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.config import settings
+from app.crud import reporte as crud
+from app.db.replica import sesion_lectura
+from app.schemas.kpi import (
+    AprobacionCategoria, AprobacionGlobal, AprobacionOrganizador, BacklogPorTramos, FiltrosBacklog,
+    FiltrosOrganizadores, FiltrosReporte, TiempoDecision,
+)
+from app.services.cache import CacheCoalescida
+from app.services.kpi import EVALUADOS, PENDIENTES, tasa_aprobacion
+
+# registros por bloque enviado al cliente (y por fetch al cursor de la BD)
+FILAS_POR_BLOQUE = 500
+
+
+# La sesión se abre dentro del generador: la de la dependencia `get_read_session`
+# se cierra antes de que StreamingResponse termine de enviar el cuerpo.
+# `primaria`: el cliente acaba de escribir (ver app/db/replica.py); si no, se lee de la réplica.
+async def exportar_eventos_csv(filtros: Dict[str, Any], primaria: bool = False) -> AsyncIterator[bytes]:
+    async with sesion_lectura(primaria) as session:
+        result = await crud.stream_eventos_base(session, FILAS_POR_BLOQUE, **filtros)
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerow(crud.COLUMNAS_EVENTOS_BASE)
+        async for bloque in result.partitions():
+            writer.writerows(bloque)
+            yield buffer.getvalue().encode("utf-8")
+            buffer.seek(0)
+            buffer.truncate()
+        if buffer.tell():
+            yield buffer.getvalue().encode("utf-8")
+
+
+async def exportar_eventos_ndjson(filtros: Dict[str, Any], primaria: bool = False) -> AsyncIterator[bytes]:
+    async with sesion_lectura(primaria) as session:
+        result = await crud.stream_eventos_base(session, FILAS_POR_BLOQUE, **filtros)
+        async for bloque in result.partitions():
+            yield b"".join(to_json(dict(fila._mapping)) + b"\n" for fila in bloque)
+
+
+# ---------- Agregados de las Consultas 03-07 ----------
+# Un tablero que se refresca a la vez en muchos navegadores pide lo mismo: la primera
+# petición consulta y las que llegan mientras tanto (o dentro del TTL) reciben esos bytes.
+cache_reportes: CacheCoalescida[bytes] = CacheCoalescida(settings.reportes_cache_max, settings.reportes_cache_ttl_s)
+
+_aprobacion = TypeAdapter(AprobacionGlobal)
+_organizadores = TypeAdapter(List[AprobacionOrganizador])
+_categorias = TypeAdapter(List[AprobacionCategoria])
+_tiempos = TypeAdapter(List[TiempoDecision])
+_backlog = TypeAdapter(BacklogPorTramos)
+
+
+async def _agregado(clave: Hashable, calcular: Callable[[AsyncSession], Awaitable[bytes]]) -> bytes:
+    # la sesión es del cálculo, no de la petición: puede seguir si quien lo inició se desconecta
+    async def consultar() -> bytes:
+        async with sesion_lectura() as session:
+            return await calcular(session)
+    return await cache_reportes.obtener(clave, consultar)
+
+
+def _json(adaptador: TypeAdapter, datos: Any) -> bytes:
+    return adaptador.dump_json(adaptador.validate_python(datos), by_alias=True)
+
+
+def _clave(nombre: str, filtros: BaseModel, *extra: Any) -> Hashable:
+    return (nombre, filtros.model_dump_json(), *extra)
+
+
+def _con_tasa(fila: Any) -> Dict[str, Any]:
+    datos = dict(fila._mapping)
+    datos["tasa_aprobacion_pct"] = tasa_aprobacion(datos["aprobados"], datos["evaluados"])
+    return datos
+
+
+async def aprobacion(filtros: FiltrosReporte) -> bytes:
+    async def calcular(session: AsyncSession) -> bytes:
+        por_estado = await crud.eventos_por_estado(session, **filtros.model_dump())
+        aprobados = por_estado.get("aprobado", 0)
+        evaluados = sum(por_estado.get(e, 0) for e in EVALUADOS)
+        return _json(_aprobacion, {
+            "aprobados": aprobados,
+            "evaluados": evaluados,
+            "tasa_aprobacion_pct": tasa_aprobacion(aprobados, evaluados),
+            "pendientes": sum(por_estado.get(e, 0) for e in PENDIENTES),
+        })
+    return await _agregado(_clave("aprobacion", filtros), calcular)
+
+
+async def aprobacion_por_organizador(filtros: FiltrosOrganizadores) -> bytes:
+    async def calcular(session: AsyncSession) -> bytes:
+        filas = await crud.aprobacion_por_organizador(session, **filtros.model_dump())
+        return _json(_organizadores, [_con_tasa(f) for f in filas])
+    return await _agregado(_clave("organizadores", filtros), calcular)
+
+
+async def aprobacion_por_categoria(filtros: FiltrosReporte) -> bytes:
+    async def calcular(session: AsyncSession) -> bytes:
+        filas = await crud.aprobacion_por_categoria(session, **filtros.model_dump())
+        return _json(_categorias, [_con_tasa(f) for f in filas])
+    return await _agregado(_clave("categorias", filtros), calcular)
+
+
+async def tiempo_a_decision(filtros: FiltrosReporte) -> bytes:
+    async def calcular(session: AsyncSession) -> bytes:
+        filas = await crud.tiempo_a_decision(session, **filtros.model_dump())
+        return _json(_tiempos, [
+            {
+                "estado": f.estado,
+                "evaluaciones": f.evaluaciones,
+                # AVG de MySQL llega como Decimal
+                "horas_promedio": round(float(f.horas_promedio), 2) if f.horas_promedio is not None else None,
+            }
+            for f in filas
+        ])
+    return await _agregado(_clave("tiempo_decision", filtros), calcular)
+
+
+async def backlog(filtros: FiltrosBacklog, hoy: Optional[date] = None) -> bytes:
+    hoy = hoy or date.today()
+    cortes = filtros.cortes
+
+    async def calcular(session: AsyncSession) -> bytes:
+        # días = hoy - date(fechaRegistro) <= c  <=>  fechaRegistro >= (hoy - c) a las 00:00
+        inicios = [datetime.combine(hoy - timedelta(days=c), time()) for c in cortes]
+        por_tramo = await crud.pendientes_por_tramo(
+            session, PENDIENTES, inicios, datetime.combine(hoy + timedelta(days=1), time()),
+            **filtros.model_dump(exclude={"cortes"}),
+        )
+        minimos = [0] + [c + 1 for c in cortes]
+        tramos = [
+            {"dias_min": minimo, "dias_max": cortes[i] if i < len(cortes) else None, "pendientes": por_tramo.get(i, 0)}
+            for i, minimo in enumerate(minimos)
+        ]
+        return _json(_backlog, {"hoy": hoy, "total": sum(t["pendientes"] for t in tramos), "tramos": tramos})
+    # la fecha va en la clave: los tramos se corren al cambiar el día
+    return await _agregado(_clave("backlog", filtros, hoy), calcular)
@@ -0,0 +1,3 @@
+# bench/__init__.py
+# Benchmarks del backend. Se ejecutan desde backend/, p. ej.:
+#   python -m bench.conflictos --eventos 100000
@@ -0,0 +1,304 @@
+# bench/api.py
+"""
+Prueba de carga de las rutas de api/v1/routes/eventos.py.
+
+Siembra una base (por defecto un archivo SQLite temporal con aiosqlite; con
+DATABASE_URL apunta a un MySQL local) y corre cada escenario con N clientes
+asíncronos concurrentes. La app se ejecuta en el mismo proceso vía httpx +
+ASGITransport (sin red), o contra un servidor ya levantado con --url.
+
+Por escenario reporta p50/p95/p99, peticiones por segundo, códigos HTTP y el
+pico de memoria del proceso; todo se guarda en JSON para comparar corridas.
+
+Uso (desde backend/, con requirements-bench.txt instalado):
+    python -m bench.api --eventos 10000 --concurrencia 32 --peticiones 2000 --salida antes.json
+    python -m bench.api --comparar antes.json despues.json
+"""
+import argparse
+import asyncio
+import itertools
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import tempfile
+import time
+from collections import Counter
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+import httpx
+
+from bench.medicion import percentiles, rss_max_mb
+
+API = "/api/v1"
+
+# las altas del bench van en horas distintas desde esta fecha: nunca chocan entre sí
+# ni con los eventos sembrados (2025)
+INICIO_ALTAS = datetime(2032, 1, 1, 0, 0)
+
+
+class Estado:
+    """Datos compartidos entre escenarios: ids creados, ETags y cursores vistos."""
+
+    def __init__(self, vol: Dict[str, int], semilla: int) -> None:
+        self.vol = vol
+        self.rnd = random.Random(semilla)
+        self.franjas = itertools.count()
+        self.creados: List[int] = []
+        self.etags: Dict[int, str] = {}
+        self.cursores: List[str] = []
+
+    def id_sembrado(self) -> int:
+        return self.rnd.randint(1, self.vol["eventos"])
+
+    def evento_nuevo(self) -> Dict[str, Any]:
+        k = next(self.franjas)
+        inicio = INICIO_ALTAS + timedelta(hours=k)
+        return {
+            "nombre": f"Evento bench {k}",
+            "descripcion": "Alta desde bench.api",
+            "categoria": "academico" if k % 2 else "ludico",
+            "idOrganizador": 1 + k % self.vol["usuarios"],
+            "idInstalacion": 1 + k % self.vol["instalaciones"],
+            "fechaInicio": inicio.isoformat(),
+            "fechaFin": (inicio + timedelta(minutes=45)).isoformat(),
+            "rutaAvalPDF": f"avales/bench-{k}.pdf",
+        }
+
+
+Operacion = Callable[[httpx.AsyncClient, Estado], Awaitable[httpx.Response]]
+
+
+# ---------- escenarios (uno por ruta) ----------
+async def crear(c: httpx.AsyncClient, e: Estado) -> httpx.Response:
+    r = await c.post(f"{API}/", json=e.evento_nuevo())
+    if r.status_code == 201:
+        e.creados.append(r.json()["idEvento"])
+    return r
+
+
+async def carga_masiva(c: httpx.AsyncClient, e: Estado) -> httpx.Response:
+    cuerpo = "\n".join(json.dumps(e.evento_nuevo()) for _ in range(200))
+    return await c.post(f"{API}/bulk", content=cuerpo, headers={"Content-Type": "application/x-ndjson"})
+
+
+async def listar(c: httpx.AsyncClient, e: Estado) -> httpx.Response:
+    params: Dict[str, Any] = {"limit": 50, "orden": e.rnd.choice(("id", "fecha"))}
+    filtro = e.rnd.randrange(4)
+    if filtro == 1:
+        params["categoria"] = e.rnd.choice(("academico", "ludico"))
+    elif filtro == 2:
+        params["estado"] = e.rnd.choice(("registrado", "enRevision", "aprobado", "rechazado"))
+    elif filtro == 3:
+        params["q"] = "Taller"
+    r = await c.get(f"{API}/", params=params)
+    if r.status_code == 200 and r.json().get("next_cursor") and params["orden"] == "fecha":
+        e.cursores.append(r.json()["next_cursor"])
+    return r
+
+
+async def listar_siguiente(c: httpx.AsyncClient, e: Estado) -> httpx.Response:
+    params: Dict[str, Any] = {"limit": 50, "orden": "fecha"}
+    if e.cursores:
+        params["cursor"] = e.rnd.choice(e.cursores)
+    return await c.get(f"{API}/", params=params)
+
+
+async def obtener(c: httpx.AsyncClient, e: Estado) -> httpx.Response:
+    id_evento = e.id_sembrado()
+    r = await c.get(f"{API}/{id_evento}")
+    if "etag" in r.headers:
+        e.etags[id_evento] = r.headers["etag"]
+    return r
+
+
+async def obtener_304(c: httpx.AsyncClient, e: Estado) -> httpx.Response:
+    id_evento, etag = e.rnd.choice(list(e.etags.items()))
+    return await c.get(f"{API}/{id_evento}", headers={"If-None-Match": etag})
+
+
+async def estadisticas_cache(c: httpx.AsyncClient, e: Estado) -> httpx.Response:
+    return await c.get(f"{API}/cache/estadisticas")
+
+
+async def actualizar(c: httpx.AsyncClient, e: Estado) -> httpx.Response:
+    # solo campos que no tocan la agenda: mide el camino de escritura, no los 409
+    return await c.put(f"{API}/{e.id_sembrado()}", json={"descripcion": f"Editado {next(e.franjas)}"})
+
+
+async def eliminar(c: httpx.AsyncClient, e: Estado) -> httpx.Response:
+    return await c.delete(f"{API}/{e.creados.pop()}")
+
+
+# (nombre, operación, fracción de --peticiones); el orden importa: unos alimentan a otros
+ESCENARIOS: List[tuple] = [
+    ("crear", crear, 1.0),
+    ("carga_masiva", carga_masiva, 0.02),
+    ("listar", listar, 1.0),
+    ("listar_siguiente", listar_siguiente, 1.0),
+    ("obtener", obtener, 1.0),
+    ("obtener_304", obtener_304, 1.0),
+    ("estadisticas_cache", estadisticas_cache, 0.25),
+    ("actualizar", actualizar, 1.0),
+    ("eliminar", eliminar, 1.0),
+]
+
+
+async def correr_escenario(
+    cliente: httpx.AsyncClient, estado: Estado, op: Operacion, peticiones: int, concurrencia: int,
+) -> Dict[str, Any]:
+    latencias: List[float] = []
+    codigos: Counter = Counter()
+    turnos = itertools.count()
+
+    async def cliente_virtual() -> None:
+        while next(turnos) < peticiones:
+            t = time.perf_counter()
+            try:
+                r = await op(cliente, estado)
+                codigos[str(r.status_code)] += 1
+            except (httpx.HTTPError, IndexError) as exc:
+                # IndexError: el escenario se quedó sin ids/ETags de los anteriores
+                codigos[type(exc).__name__] += 1
+            latencias.append(time.perf_counter() - t)
+
+    t0 = time.perf_counter()
+    await asyncio.gather(*(cliente_virtual() for _ in range(concurrencia)))
+    duracion = time.perf_counter() - t0
+
+    errores = sum(n for cod, n in codigos.items() if not cod.isdigit() or int(cod) >= 400)
+    return {
+        "peticiones": len(latencias),
+        "errores": errores,
+        "codigos": dict(codigos),
+        "duracion_s": round(duracion, 3),
+        "rps": round(len(latencias) / duracion, 1) if duracion else None,
+        **percentiles(latencias),
+        "max_ms": round(max(latencias) * 1000, 4) if latencias else 0.0,
+        "rss_max_mb": rss_max_mb(),
+    }
+
+
+def _commit_actual() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+async def ejecutar(args: argparse.Namespace) -> Dict[str, Any]:
+    # la app lee DATABASE_URL al importarse
+    from app.db import engine
+    from bench.siembra import Volumen, activar_sqlite_rapido, sembrar
+
+    activar_sqlite_rapido(engine)
+    resultados: Dict[str, Any] = {
+        "meta": {
+            "fecha": datetime.now().isoformat(timespec="seconds"),
+            "commit": _commit_actual(),
+            "python": platform.python_version(),
+            "plataforma": platform.platform(),
+            "bd": "sqlite temporal" if args.bd_temporal else engine.url.render_as_string(hide_password=True),
+            "destino": args.url or "asgi (mismo proceso)",
+            "concurrencia": args.concurrencia,
+            "peticiones": args.peticiones,
+            "semilla": args.semilla,
+        },
+    }
+    if args.sin_siembra:
+        resultados["siembra"] = {"volumen": Volumen.para(args.eventos).__dict__}
+    else:
+        resultados["siembra"] = await sembrar(engine, args.eventos, args.semilla, recrear=args.recrear)
+    estado = Estado(resultados["siembra"]["volumen"], args.semilla)
+
+    if args.url:
+        cliente = httpx.AsyncClient(base_url=args.url, timeout=60)
+    else:
+        from app.main import app
+        cliente = httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://bench", timeout=60)
+
+    seleccion = set(args.escenarios.split(",")) if args.escenarios else None
+    resultados["escenarios"] = {}
+    async with cliente:
+        # primera petición: incluye la carga de agenda/índices en memoria
+        t = time.perf_counter()
+        await crear(cliente, estado)
+        resultados["primera_peticion_s"] = round(time.perf_counter() - t, 3)
+
+        for nombre, op, fraccion in ESCENARIOS:
+            if seleccion and nombre not in seleccion:
+                continue
+            n = max(1, int(args.peticiones * fraccion))
+            if nombre == "eliminar":
+                n = min(n, len(estado.creados))
+            print(f"  {nombre:<20} {n} peticiones…", file=sys.stderr)
+            resultados["escenarios"][nombre] = await correr_escenario(cliente, estado, op, n, args.concurrencia)
+
+    await engine.dispose()
+    return resultados
+
+
+# ---------- comparación entre corridas ----------
+def comparar(antes: Dict[str, Any], despues: Dict[str, Any], umbral_pct: float) -> int:
+    for clave in ("concurrencia", "peticiones", "bd"):
+        if antes["meta"].get(clave) != despues["meta"].get(clave):
+            print(f"aviso: {clave} distinto ({antes['meta'].get(clave)} vs {despues['meta'].get(clave)})")
+    if antes["siembra"]["volumen"] != despues["siembra"]["volumen"]:
+        print("aviso: volumen de datos distinto")
+    print(f"{'escenario':<20} {'p95 antes':>10} {'p95 ahora':>10} {'Δ%':>7} {'rps antes':>10} {'rps ahora':>10} {'Δ%':>7}")
+    regresiones = 0
+    for nombre, b in despues["escenarios"].items():
+        a = antes["escenarios"].get(nombre)
+        if not a:
+            continue
+        d_p95 = (b["p95_ms"] - a["p95_ms"]) / a["p95_ms"] * 100 if a["p95_ms"] else 0.0
+        d_rps = (b["rps"] - a["rps"]) / a["rps"] * 100 if a["rps"] else 0.0
+        marca = ""
+        if d_p95 > umbral_pct or d_rps < -umbral_pct:
+            marca = "  ← regresión"
+            regresiones += 1
+        print(
+            f"{nombre:<20} {a['p95_ms']:>10.2f} {b['p95_ms']:>10.2f} {d_p95:>+7.1f}"
+            f" {a['rps']:>10.1f} {b['rps']:>10.1f} {d_rps:>+7.1f}{marca}"
+        )
+    return regresiones
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--eventos", type=int, default=10_000, help="tamaño de la siembra (10k–1M)")
+    ap.add_argument("--concurrencia", type=int, default=32, help="clientes simultáneos")
+    ap.add_argument("--peticiones", type=int, default=2_000, help="peticiones por escenario")
+    ap.add_argument("--escenarios", help="lista separada por comas (por defecto todos)")
+    ap.add_argument("--semilla", type=int, default=7)
+    ap.add_argument("--url", help="servidor ya levantado (si no, la app corre en el proceso)")
+    ap.add_argument("--sin-siembra", action="store_true", help="usar los datos que ya tiene la base")
+    ap.add_argument("--recrear", action="store_true", help="borrar las tablas antes de sembrar")
+    ap.add_argument("--salida", type=Path, help="guardar resultados en JSON")
+    ap.add_argument("--comparar", nargs=2, type=Path, metavar=("ANTES", "DESPUES"))
+    ap.add_argument("--umbral", type=float, default=10.0, help="%% de empeoramiento que cuenta como regresión")
+    args = ap.parse_args()
+
+    if args.comparar:
+        antes, despues = (json.loads(p.read_text()) for p in args.comparar)
+        sys.exit(1 if comparar(antes, despues, args.umbral) else 0)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        args.bd_temporal = "DATABASE_URL" not in os.environ
+        if args.bd_temporal:
+            os.environ["DATABASE_URL"] = f"sqlite+aiosqlite:///{Path(tmp) / 'bench.db'}"
+        resultados = asyncio.run(ejecutar(args))
+
+    print(json.dumps(resultados, indent=2))
+    if args.salida:
+        args.salida.write_text(json.dumps(resultados, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+# bench/arranque.py
+"""
+Tiempo hasta la primera respuesta de un worker nuevo.
+
+Levanta `uvicorn app.main:app` como proceso aparte varias veces y mide, desde
+que se lanza el proceso, cuánto tarda en responder 200 a `--ruta` (lo que ve
+el balanceador cuando se agrega un worker bajo carga). También mide por
+separado el `import app.main` en un intérprete limpio.
+
+Sin DATABASE_URL siembra una base SQLite temporal con bench.siembra. Con
+`--entorno CLAVE=valor` (repetible) se fija la configuración de todas las
+corridas; con `--comparar CLAVE=valor` se mide además esa variante, intercalada
+con la base en cada repetición para que el ruido de la máquina afecte a ambas.
+
+Uso (desde backend/):
+    python -m bench.arranque --repeticiones 15
+    python -m bench.arranque --repeticiones 30 --comparar ARRANQUE_PEREZOSO=true
+"""
+import argparse
+import http.client
+import json
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+
+def _puerto_libre() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def _responde(puerto: int, ruta: str) -> Optional[int]:
+    cx = http.client.HTTPConnection("127.0.0.1", puerto, timeout=5)
+    try:
+        cx.request("GET", ruta)
+        return cx.getresponse().status
+    except OSError:
+        return None
+    finally:
+        cx.close()
+
+
+def primera_respuesta(entorno: Dict[str, str], ruta: str, limite_s: float = 60) -> float:
+    puerto = _puerto_libre()
+    t = time.perf_counter()
+    proc = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "app.main:app", "--port", str(puerto), "--log-level", "warning"],
+        env=entorno,
+    )
+    try:
+        while time.perf_counter() - t < limite_s:
+            codigo = _responde(puerto, ruta)
+            if codigo == 200:
+                return time.perf_counter() - t
+            if codigo is not None:
+                raise RuntimeError(f"{ruta} respondió {codigo}")
+            if proc.poll() is not None:
+                raise RuntimeError(f"uvicorn terminó con código {proc.returncode}")
+            time.sleep(0.005)
+        raise RuntimeError(f"sin respuesta en {limite_s} s")
+    finally:
+        proc.terminate()
+        proc.wait()
+
+
+def importar(entorno: Dict[str, str]) -> float:
+    codigo = "import time; t = time.perf_counter(); import app.main; print(time.perf_counter() - t)"
+    salida = subprocess.run([sys.executable, "-c", codigo], env=entorno, capture_output=True, text=True, check=True)
+    return float(salida.stdout.strip().splitlines()[-1])
+
+
+def _resumen(muestras: List[float]) -> Dict[str, float]:
+    ms = [m * 1000 for m in muestras]
+    return {"mediana_ms": round(statistics.median(ms), 1), "min_ms": round(min(ms), 1), "max_ms": round(max(ms), 1)}
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--repeticiones", type=int, default=10)
+    ap.add_argument("--ruta", default="/api/v1/?limit=20", help="primera petición (debe responder 200)")
+    ap.add_argument("--eventos", type=int, default=10_000, help="siembra de la base temporal")
+    ap.add_argument("--entorno", action="append", default=[], metavar="CLAVE=valor")
+    ap.add_argument("--comparar", action="append", default=[], metavar="CLAVE=valor",
+                    help="variante a medir junto a la base (repetible: una variante con todas)")
+    ap.add_argument("--salida", type=Path, help="guardar resultados en JSON")
+    args = ap.parse_args()
+
+    entorno = dict(os.environ)
+    entorno.update(kv.split("=", 1) for kv in args.entorno)
+    with tempfile.TemporaryDirectory() as tmp:
+        if "DATABASE_URL" not in entorno:
+            entorno["DATABASE_URL"] = f"sqlite+aiosqlite:///{Path(tmp) / 'arranque.db'}"
+            subprocess.run(
+                [sys.executable, "-m", "bench.siembra", "--eventos", str(args.eventos)],
+                env=entorno, check=True, stdout=subprocess.DEVNULL,
+            )
+        variantes = {"base": entorno}
+        if args.comparar:
+            variantes["variante"] = {**entorno, **dict(kv.split("=", 1) for kv in args.comparar)}
+        # el primer lanzamiento compila los .pyc y calienta la cache de disco: no se cuenta
+        for env in variantes.values():
+            primera_respuesta(env, args.ruta)
+        importacion: Dict[str, List[float]] = {v: [] for v in variantes}
+        respuesta: Dict[str, List[float]] = {v: [] for v in variantes}
+        for _ in range(args.repeticiones):
+            for nombre, env in variantes.items():
+                importacion[nombre].append(importar(env))
+                respuesta[nombre].append(primera_respuesta(env, args.ruta))
+
+    resultados: Dict[str, object] = {"entorno": args.entorno, "comparar": args.comparar, "ruta": args.ruta}
+    for nombre in variantes:
+        resultados[nombre] = {
+            "import_app_main": _resumen(importacion[nombre]),
+            "primera_respuesta": _resumen(respuesta[nombre]),
+        }
+    if args.comparar:
+        resultados["diferencia_mediana_ms"] = round(
+            (statistics.median(respuesta["variante"]) - statistics.median(respuesta["base"])) * 1000, 1
+        )
+    print(json.dumps(resultados, indent=2))
+    if args.salida:
+        args.salida.write_text(json.dumps(resultados, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,158 @@
+# bench/busqueda.py
+"""
+Búsqueda de texto: índice invertido de app/services/busqueda.py frente a LIKE.
+
+Genera un corpus sintético con vocabulario de cola larga (distribución Zipf,
+palabras con tildes), arma el índice y mide por tipo de consulta:
+  frecuente    un término muy común (listas largas)
+  rara         un término de la cola
+  dos          dos términos completos
+  prefijo2/4   lo que llega mientras se escribe (2 y 4 letras del último término)
+Con --sql repite algunas consultas como `LIKE '%q%'` sobre SQLite en disco.
+
+Uso (desde backend/):
+    python -m bench.busqueda --eventos 500000 --consultas 300 --sql
+"""
+import argparse
+import itertools
+import json
+import os
+import random
+import sqlite3
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+from bench.medicion import percentiles, rss_max_mb
+
+TIPOS = ("Taller", "Seminario", "Charla", "Torneo", "Congreso", "Curso", "Foro", "Feria", "Concierto", "Jornada")
+TEMAS = (
+    "robótica", "música", "educación", "matemáticas", "química", "física", "biología", "programación",
+    "inteligencia", "artificial", "diseño", "gráfico", "economía", "administración", "comunicación",
+    "periodismo", "ingeniería", "mecánica", "eléctrica", "ambiental", "energía", "solar", "agua",
+    "ciudad", "arquitectura", "teatro", "danza", "pintura", "fotografía", "cine", "literatura", "poesía",
+    "historia", "filosofía", "ética", "derecho", "salud", "nutrición", "deporte", "fútbol", "ajedrez",
+    "emprendimiento", "innovación", "datos", "seguridad", "redes", "nube", "móviles", "videojuegos", "año",
+)
+SILABAS = ("ca", "lo", "ma", "ri", "te", "sa", "no", "pe", "ción", "tú", "dí", "bra", "gen", "vol", "mén", "ña")
+
+
+def _vocabulario(rnd: random.Random, n: int) -> List[str]:
+    palabras = list(TEMAS)
+    vistas = set(palabras)
+    while len(palabras) < n:
+        p = "".join(rnd.choice(SILABAS) for _ in range(rnd.randint(2, 4)))
+        if p not in vistas:
+            vistas.add(p)
+            palabras.append(p)
+    return palabras
+
+
+def corpus(eventos: int, semilla: int) -> Tuple[List[Tuple[int, str, str, str, str]], List[str]]:
+    rnd = random.Random(semilla)
+    vocab = _vocabulario(rnd, 20_000)
+    # Zipf s=1; pesos acumulados para no recalcularlos en cada choices()
+    acumulados = list(itertools.accumulate(1 / (i + 1) for i in range(len(vocab))))
+    temas, temas_acumulados = vocab[:200], acumulados[:200]
+    filas = []
+    for i in range(1, eventos + 1):
+        t1, t2 = rnd.choices(temas, cum_weights=temas_acumulados, k=2)
+        nombre = f"{rnd.choice(TIPOS)} de {t1.capitalize()} y {t2}"
+        desc = " ".join(rnd.choices(vocab, cum_weights=acumulados, k=rnd.randint(6, 20))) if rnd.random() < 0.85 else None
+        filas.append((i, nombre, desc, rnd.choice(("academico", "ludico")), "registrado"))
+    return filas, vocab
+
+
+def consultas(vocab: List[str], n: int, semilla: int) -> Dict[str, List[str]]:
+    rnd = random.Random(semilla + 1)
+    comunes, cola = vocab[:20], vocab[2_000:]
+    return {
+        "frecuente": [rnd.choice(comunes) for _ in range(n)],
+        "rara": [rnd.choice(cola) for _ in range(n)],
+        "dos": [f"{rnd.choice(vocab[:200])} {rnd.choice(vocab[:500])}" for _ in range(n)],
+        "prefijo2": [rnd.choice(vocab[:500])[:2] for _ in range(n)],
+        "prefijo4": [f"{rnd.choice(TIPOS)} {rnd.choice(vocab[:500])[:4]}" for _ in range(n)],
+    }
+
+
+def _sqlite_like(filas, preguntas: Dict[str, List[str]], n: int) -> Dict[str, Any]:
+    with tempfile.TemporaryDirectory() as tmp:
+        cx = sqlite3.connect(Path(tmp) / "like.db")
+        cx.execute("CREATE TABLE evento (idEvento INTEGER PRIMARY KEY, nombre TEXT, descripcion TEXT)")
+        cx.executemany("INSERT INTO evento VALUES (?, ?, ?)", ((f[0], f[1], f[2]) for f in filas))
+        cx.commit()
+        r = {}
+        for tipo in ("frecuente", "rara"):
+            lat = []
+            for q in preguntas[tipo][:n]:
+                t = time.perf_counter()
+                cx.execute(
+                    "SELECT idEvento FROM evento WHERE nombre LIKE ? OR descripcion LIKE ? "
+                    "ORDER BY idEvento DESC LIMIT 21", (f"%{q}%", f"%{q}%"),
+                ).fetchall()
+                lat.append(time.perf_counter() - t)
+            r[tipo] = percentiles(lat)
+        cx.close()
+    return r
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--eventos", type=int, default=500_000)
+    ap.add_argument("--consultas", type=int, default=300, help="consultas por tipo")
+    ap.add_argument("--semilla", type=int, default=7)
+    ap.add_argument("--sql", action="store_true", help="comparar con LIKE sobre SQLite")
+    ap.add_argument("--salida", type=Path, help="guardar resultados en JSON")
+    args = ap.parse_args()
+
+    os.environ.setdefault("DATABASE_URL", "sqlite+aiosqlite://")
+    from app.services.busqueda import IndiceTexto
+
+    t = time.perf_counter()
+    filas, vocab = corpus(args.eventos, args.semilla)
+    generar_s = time.perf_counter() - t
+    rss_antes = rss_max_mb()
+
+    indice = IndiceTexto()
+    t = time.perf_counter()
+    indice.cargar_desde(filas)
+    resultados: Dict[str, Any] = {
+        "eventos": args.eventos,
+        "corpus_s": round(generar_s, 2),
+        "construccion_s": round(time.perf_counter() - t, 2),
+        "terminos": len(indice._listas),
+        "rss_indice_mb": round(rss_max_mb() - rss_antes, 1),
+        "consultas": {},
+    }
+
+    preguntas = consultas(vocab, args.consultas, args.semilla)
+    for tipo, qs in preguntas.items():
+        lat, totales = [], []
+        for q in qs:
+            t = time.perf_counter()
+            pagina, total = indice.buscar(q, 21)
+            lat.append(time.perf_counter() - t)
+            totales.append(total)
+        resultados["consultas"][tipo] = {"coincidencias_media": round(sum(totales) / len(totales)), **percentiles(lat)}
+
+    # escrituras: reindexar un evento existente (lo que hace cada PUT/POST)
+    rnd = random.Random(args.semilla + 2)
+    lat = []
+    for _ in range(2_000):
+        i, nombre, desc, cat, est = filas[rnd.randrange(len(filas))]
+        t = time.perf_counter()
+        indice.indexar(i, nombre + " actualizado", desc, cat, est)
+        lat.append(time.perf_counter() - t)
+    resultados["reindexar"] = percentiles(lat)
+
+    if args.sql:
+        resultados["sqlite_like"] = _sqlite_like(filas, preguntas, min(args.consultas, 20))
+
+    print(json.dumps(resultados, indent=2))
+    if args.salida:
+        args.salida.write_text(json.dumps(resultados, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,229 @@
+# bench/conflictos.py
+"""
+Agenda en memoria vs. self-join SQL (Consulta 08) para detectar solapamientos.
+
+Genera N eventos sintéticos repartidos en S instalaciones sobre una base SQLite
+temporal (sqlite3 de la librería estándar) y mide:
+  1. Consulta 08 completa (conflictos por instalación) vs. barrido de la agenda.
+  2. Verificación puntual de un horario nuevo: EXISTS indexado vs. agenda.conflictos.
+  3. Instalaciones disponibles en un horario (capacidad y tipo): NOT EXISTS por sala
+     vs. agenda.disponibles, y huecos libres de una sala en una semana.
+
+Uso (desde backend/):
+    python -m bench.conflictos --eventos 100000 --salas 200
+"""
+import argparse
+import json
+import random
+import sqlite3
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from app.services.agenda import AgendaInstalaciones
+from bench.medicion import percentiles
+
+DDL = """
+CREATE TABLE instalacion (idInstalacion INTEGER PRIMARY KEY, nombre TEXT NOT NULL,
+  tipo TEXT NOT NULL, capacidad INTEGER NOT NULL, ubicacion TEXT NOT NULL);
+CREATE TABLE evento (
+  idEvento INTEGER PRIMARY KEY, fechaInicio TEXT NOT NULL, fechaFin TEXT NOT NULL,
+  estado TEXT NOT NULL, idInstalacion INTEGER NOT NULL
+);
+CREATE TABLE eventoInstalacion (idEvento INTEGER NOT NULL, idInstalacion INTEGER NOT NULL,
+  PRIMARY KEY (idEvento, idInstalacion));
+CREATE INDEX ix_evento_inst_inicio ON evento (idInstalacion, fechaInicio);
+CREATE INDEX ix_ei_inst ON eventoInstalacion (idInstalacion, idEvento);
+"""
+
+# Consulta 08 de 4_consultas_avanzadas.sql (misma forma, sintaxis SQLite)
+CONSULTA_08 = """
+WITH ev_inst AS (
+  SELECT idEvento, idInstalacion FROM evento WHERE estado <> 'rechazado'
+  UNION
+  SELECT ei.idEvento, ei.idInstalacion FROM eventoInstalacion ei
+  JOIN evento e ON e.idEvento = ei.idEvento WHERE e.estado <> 'rechazado'
+)
+SELECT i.idInstalacion, COUNT(*) AS conflictos
+FROM ev_inst a
+JOIN evento e1 ON e1.idEvento = a.idEvento
+JOIN ev_inst b ON a.idInstalacion = b.idInstalacion AND a.idEvento < b.idEvento
+JOIN evento e2 ON e2.idEvento = b.idEvento
+JOIN instalacion i ON i.idInstalacion = a.idInstalacion
+WHERE e1.fechaInicio < e2.fechaFin AND e2.fechaInicio < e1.fechaFin
+GROUP BY i.idInstalacion
+"""
+
+# Verificación puntual con la mejor consulta posible en SQL (instalación por defecto)
+EXISTE_CHOQUE = """
+SELECT EXISTS (
+  SELECT 1 FROM evento
+  WHERE idInstalacion = ? AND estado <> 'rechazado'
+    AND fechaInicio < ? AND fechaFin > ?
+)
+"""
+
+# Disponibilidad en SQL: una subconsulta por sala candidata (por defecto + adicionales)
+DISPONIBLES = """
+SELECT i.idInstalacion FROM instalacion i
+WHERE i.capacidad >= ? AND i.tipo = COALESCE(?, i.tipo)
+  AND NOT EXISTS (
+    SELECT 1 FROM evento e
+    WHERE e.idInstalacion = i.idInstalacion AND e.estado <> 'rechazado'
+      AND e.fechaInicio < ? AND e.fechaFin > ?)
+  AND NOT EXISTS (
+    SELECT 1 FROM eventoInstalacion ei JOIN evento e ON e.idEvento = ei.idEvento
+    WHERE ei.idInstalacion = i.idInstalacion AND e.estado <> 'rechazado'
+      AND e.fechaInicio < ? AND e.fechaFin > ?)
+ORDER BY i.capacidad, i.idInstalacion
+"""
+
+# Reservas de una sala en la ventana: la base de cualquier cálculo de huecos en SQL
+RESERVAS_SALA = """
+SELECT fechaInicio, fechaFin FROM evento
+WHERE idInstalacion = ? AND estado <> 'rechazado' AND fechaInicio < ? AND fechaFin > ?
+UNION ALL
+SELECT e.fechaInicio, e.fechaFin FROM eventoInstalacion ei JOIN evento e ON e.idEvento = ei.idEvento
+WHERE ei.idInstalacion = ? AND e.estado <> 'rechazado' AND e.fechaInicio < ? AND e.fechaFin > ?
+ORDER BY 1
+"""
+
+TIPOS_SALA = ("salon", "laboratorio", "auditorio", "otro")
+INICIO = datetime(2025, 1, 1, 7, 0)
+
+
+def catalogo(n_salas: int, semilla: int):
+    rnd = random.Random(semilla + 3)
+    return [
+        (i, f"Sala {i}", rnd.choice(TIPOS_SALA), rnd.choice((20, 30, 40, 60, 120, 300)), f"Bloque {i % 10}")
+        for i in range(1, n_salas + 1)
+    ]
+
+
+def generar(n_eventos: int, n_salas: int, semilla: int):
+    rnd = random.Random(semilla)
+    dias = max(30, n_eventos // (n_salas * 2))  # ~2 eventos por sala y día
+    eventos, adicionales = [], []
+    for id_evento in range(1, n_eventos + 1):
+        inicio = INICIO + timedelta(days=rnd.randrange(dias), minutes=30 * rnd.randrange(26))
+        fin = inicio + timedelta(minutes=30 * rnd.randint(1, 8))
+        estado = "rechazado" if rnd.random() < 0.1 else "aprobado"
+        eventos.append((id_evento, inicio, fin, estado, rnd.randint(1, n_salas)))
+        if rnd.random() < 0.05:
+            adicionales.append((id_evento, rnd.randint(1, n_salas)))
+    return eventos, adicionales, dias
+
+
+def crear_bd(ruta: Path, eventos, adicionales, salas) -> sqlite3.Connection:
+    cx = sqlite3.connect(ruta)
+    cx.executescript(DDL)
+    cx.executemany("INSERT INTO instalacion VALUES (?, ?, ?, ?, ?)", salas)
+    cx.executemany(
+        "INSERT INTO evento VALUES (?, ?, ?, ?, ?)",
+        [(i, ini.isoformat(" "), fin.isoformat(" "), est, inst) for i, ini, fin, est, inst in eventos],
+    )
+    cx.executemany("INSERT OR IGNORE INTO eventoInstalacion VALUES (?, ?)", adicionales)
+    cx.commit()
+    return cx
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--eventos", type=int, default=100_000)
+    ap.add_argument("--salas", type=int, default=200)
+    ap.add_argument("--consultas", type=int, default=2_000, help="verificaciones puntuales a medir")
+    ap.add_argument("--semilla", type=int, default=7)
+    ap.add_argument("--salida", type=Path, help="guardar resultados en JSON")
+    args = ap.parse_args()
+
+    eventos, adicionales, dias = generar(args.eventos, args.salas, args.semilla)
+    salas = catalogo(args.salas, args.semilla)
+    resultados = {"eventos": args.eventos, "salas": args.salas}
+
+    with tempfile.TemporaryDirectory() as tmp:
+        cx = crear_bd(Path(tmp) / "bench.db", eventos, adicionales, salas)
+
+        # --- construcción de la agenda (equivale a la primera carga del proceso)
+        t = time.perf_counter()
+        agenda = AgendaInstalaciones()
+        agenda.cargar_desde(
+            ((i, inst, ini, fin) for i, ini, fin, est, inst in eventos if est != "rechazado"),
+            adicionales,
+            salas,
+        )
+        resultados["agenda_construccion_s"] = round(time.perf_counter() - t, 4)
+
+        # --- conflictos de todas las instalaciones
+        t = time.perf_counter()
+        sql = dict(cx.execute(CONSULTA_08).fetchall())
+        resultados["sql_consulta08_s"] = round(time.perf_counter() - t, 4)
+
+        t = time.perf_counter()
+        memoria = {}
+        for inst in range(1, args.salas + 1):
+            n = len(agenda.conflictos_instalacion(inst))
+            if n:
+                memoria[inst] = n
+        resultados["agenda_conflictos_s"] = round(time.perf_counter() - t, 4)
+        resultados["conflictos_totales"] = sum(memoria.values())
+        resultados["resultados_iguales"] = sql == memoria
+
+        # --- verificación de un horario nuevo (lo que hace crear/actualizar)
+        rnd = random.Random(args.semilla + 1)
+        sondas = []
+        for _ in range(args.consultas):
+            ini = INICIO + timedelta(days=rnd.randrange(dias), minutes=30 * rnd.randrange(26))
+            sondas.append((rnd.randint(1, args.salas), ini, ini + timedelta(hours=2)))
+
+        tiempos_sql, tiempos_mem = [], []
+        for inst, ini, fin in sondas:
+            t = time.perf_counter()
+            cx.execute(EXISTE_CHOQUE, (inst, fin.isoformat(" "), ini.isoformat(" "))).fetchone()
+            tiempos_sql.append(time.perf_counter() - t)
+            t = time.perf_counter()
+            agenda.conflictos((inst,), ini, fin)
+            tiempos_mem.append(time.perf_counter() - t)
+        resultados["sql_verificacion"] = percentiles(tiempos_sql)
+        resultados["agenda_verificacion"] = percentiles(tiempos_mem)
+
+        # --- instalaciones disponibles (capacidad mínima y a veces tipo) y huecos de una semana
+        pedidos = []
+        for _, ini, fin in sondas:
+            tipo = rnd.choice(TIPOS_SALA) if rnd.random() < 0.3 else None
+            pedidos.append((ini, fin, rnd.choice((1, 30, 60)), tipo))
+        tiempos_sql, tiempos_mem, iguales = [], [], True
+        for ini, fin, cap, tipo in pedidos:
+            a, b = fin.isoformat(" "), ini.isoformat(" ")
+            t = time.perf_counter()
+            sql_ids = [r[0] for r in cx.execute(DISPONIBLES, (cap, tipo, a, b, a, b))]
+            tiempos_sql.append(time.perf_counter() - t)
+            t = time.perf_counter()
+            mem_ids = [i.id_instalacion for i in agenda.disponibles(ini, fin, cap, tipo)]
+            tiempos_mem.append(time.perf_counter() - t)
+            iguales = iguales and sql_ids == mem_ids
+        resultados["sql_disponibles"] = percentiles(tiempos_sql)
+        resultados["agenda_disponibles"] = percentiles(tiempos_mem)
+        resultados["disponibles_iguales"] = iguales
+
+        tiempos_sql, tiempos_mem = [], []
+        for inst, ini, _ in sondas:
+            desde, hasta = ini.replace(hour=0, minute=0), ini.replace(hour=0, minute=0) + timedelta(days=7)
+            a, b = hasta.isoformat(" "), desde.isoformat(" ")
+            t = time.perf_counter()
+            cx.execute(RESERVAS_SALA, (inst, a, b, inst, a, b)).fetchall()
+            tiempos_sql.append(time.perf_counter() - t)
+            t = time.perf_counter()
+            agenda.huecos(inst, desde, hasta)
+            tiempos_mem.append(time.perf_counter() - t)
+        resultados["sql_reservas_semana"] = percentiles(tiempos_sql)
+        resultados["agenda_huecos_semana"] = percentiles(tiempos_mem)
+        cx.close()
+
+    print(json.dumps(resultados, indent=2))
+    if args.salida:
+        args.salida.write_text(json.dumps(resultados, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,128 @@
+# bench/detalle.py
+"""
+Detalle de eventos con sus relaciones: sentencias SQL y latencia por petición.
+
+La app corre en el mismo proceso (httpx + ASGITransport) sobre una base SQLite
+temporal sembrada con bench.siembra. Para cada tamaño de `--tamanos` se piden
+`GET /api/v1/detalle?ids=...` (y `GET /api/v1/{id}/detalle` para un id) y se
+cuentan las sentencias de cada petición; el número debe ser el mismo para
+cualquier tamaño (si no, el script termina con error). Como referencia se mide
+lo que hacía un cliente sin esta ruta: una consulta por tabla y por evento.
+
+Uso (desde backend/, con requirements-bench.txt instalado):
+    python -m bench.detalle --eventos 5000 --tamanos 1,10,50,200 --repeticiones 20
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+
+import httpx
+from sqlalchemy import event, select
+
+from bench.medicion import percentiles
+
+API = "/api/v1"
+
+
+async def _por_tabla(session, ids: List[int]) -> int:
+    # lo que armaba el cliente: el evento y luego cada tabla relacionada por separado
+    from app.models import (
+        Evaluacion, Evento, EventoInstalacion, EventoOrganizacion, Instalacion, Organizacion,
+        Usuario, UsuarioEvento,
+    )
+    for i in ids:
+        ev = (await session.execute(select(Evento.__table__).where(Evento.idEvento == i))).one()
+        await session.execute(select(Usuario.__table__).where(Usuario.idUsuario == ev.idOrganizador))
+        await session.execute(select(Instalacion.__table__).where(Instalacion.idInstalacion == ev.idInstalacion))
+        await session.execute(
+            select(Instalacion.__table__).join(EventoInstalacion).where(EventoInstalacion.idEvento == i)
+        )
+        await session.execute(
+            select(EventoOrganizacion.__table__, Organizacion.__table__).join(Organizacion)
+            .where(EventoOrganizacion.idEvento == i)
+        )
+        await session.execute(
+            select(UsuarioEvento.__table__, Usuario.__table__).join(Usuario).where(UsuarioEvento.idEvento == i)
+        )
+        await session.execute(select(Evaluacion.__table__).where(Evaluacion.idEvento == i))
+    return len(ids)
+
+
+async def ejecutar(args: argparse.Namespace) -> Dict[str, Any]:
+    from app.db import SessionLocal, engine
+    from app.main import app
+    from bench.siembra import activar_sqlite_rapido, sembrar
+
+    activar_sqlite_rapido(engine)
+    await sembrar(engine, args.eventos, args.semilla, recrear=True)
+
+    sentencias = [0]
+
+    @event.listens_for(engine.sync_engine, "before_cursor_execute")
+    def _contar(*_):
+        sentencias[0] += 1
+
+    rnd = random.Random(args.semilla)
+    resultados: Dict[str, Any] = {"eventos": args.eventos, "repeticiones": args.repeticiones}
+    por_peticion = set()
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://bench") as c:
+        await c.get(f"{API}/1/detalle")  # primera petición: conexiones del pool
+
+        antes = sentencias[0]
+        r = await c.get(f"{API}/{rnd.randint(1, args.eventos)}/detalle")
+        r.raise_for_status()
+        resultados["un_evento"] = {"sentencias_sql": sentencias[0] - antes}
+        por_peticion.add(sentencias[0] - antes)
+
+        for tamano in args.tamanos:
+            latencias, ref, sql = [], [], set()
+            for _ in range(args.repeticiones):
+                ids = rnd.sample(range(1, args.eventos + 1), tamano)
+                antes = sentencias[0]
+                t = time.perf_counter()
+                r = await c.get(f"{API}/detalle", params={"ids": ",".join(map(str, ids))})
+                latencias.append(time.perf_counter() - t)
+                r.raise_for_status()
+                assert len(r.json()["items"]) == tamano
+                sql.add(sentencias[0] - antes)
+
+                async with SessionLocal() as session:
+                    t = time.perf_counter()
+                    await _por_tabla(session, ids)
+                    ref.append(time.perf_counter() - t)
+            por_peticion |= sql
+            resultados[f"ids_{tamano}"] = {
+                "detalle": {"sentencias_sql": sorted(sql), **percentiles(latencias)},
+                "por_tabla": {"sentencias_sql": 7 * tamano, **percentiles(ref)},
+            }
+    await engine.dispose()
+
+    if len(por_peticion) != 1:
+        raise SystemExit(f"el número de sentencias por petición varía con el tamaño: {sorted(por_peticion)}")
+    resultados["sentencias_por_peticion"] = por_peticion.pop()
+    return resultados
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--eventos", type=int, default=5_000, help="tamaño de la siembra")
+    ap.add_argument("--tamanos", type=lambda v: [int(x) for x in v.split(",")], default=[1, 10, 50, 200],
+                    help="ids por petición (máximo 200)")
+    ap.add_argument("--repeticiones", type=int, default=20)
+    ap.add_argument("--semilla", type=int, default=7)
+    args = ap.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        os.environ.setdefault("DATABASE_URL", f"sqlite+aiosqlite:///{Path(tmp) / 'detalle.db'}")
+        resultados = asyncio.run(ejecutar(args))
+    print(json.dumps(resultados, indent=2))
+
+
+if __name__ == "__main__":
+    main()
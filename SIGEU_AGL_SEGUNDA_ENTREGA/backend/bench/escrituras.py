@@ -0,0 +1,185 @@
+# bench/escrituras.py
+"""
+Viajes a la BD y latencia por escritura en crud.evento (crear / actualizar / eliminar).
+
+Compara tres variantes sobre la misma base sembrada:
+  antes          add+commit+refresh / get+setattr+commit+refresh / get+delete+commit
+  returning      crud actual con INSERT/UPDATE ... RETURNING (SQLite, MariaDB, PostgreSQL)
+  sin_returning  crud actual por el camino de MySQL (se desactiva RETURNING en el dialecto)
+
+En las dos últimas mide además la edición con If-Match (UPDATE condicional por
+`version`) y una ronda de contención: varios clientes editan a la vez el mismo
+evento con la misma versión; solo uno debe aplicarse y el resto recibe 412.
+
+Un viaje = una sentencia enviada al cursor o un COMMIT.
+
+Uso (desde backend/):
+    python -m bench.escrituras --operaciones 2000
+"""
+import argparse
+import asyncio
+import json
+import os
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, List
+
+from sqlalchemy import event
+
+from bench.medicion import percentiles
+
+
+# ---------- implementación anterior (referencia) ----------
+async def crear_antes(session, data):
+    from app.models.evento import Evento
+    obj = Evento(**data)
+    session.add(obj)
+    await session.commit()
+    await session.refresh(obj)
+    return obj
+
+
+async def actualizar_antes(session, id_evento, cambios):
+    from app.models.evento import Evento
+    obj = await session.get(Evento, id_evento)
+    if not obj:
+        return None
+    for k, v in cambios.items():
+        if hasattr(obj, k):
+            setattr(obj, k, v)
+    await session.commit()
+    await session.refresh(obj)
+    return obj
+
+
+async def eliminar_antes(session, id_evento):
+    from app.models.evento import Evento
+    obj = await session.get(Evento, id_evento)
+    if not obj:
+        return False
+    await session.delete(obj)
+    await session.commit()
+    return True
+
+
+def _evento(k: int, vol: Dict[str, int]) -> Dict[str, Any]:
+    inicio = datetime(2033, 1, 1) + timedelta(hours=k)
+    return {
+        "nombre": f"Escritura {k}", "descripcion": None, "categoria": "academico",
+        "idOrganizador": 1 + k % vol["usuarios"], "idInstalacion": 1 + k % vol["instalaciones"],
+        "fechaInicio": inicio, "fechaFin": inicio + timedelta(hours=1),
+        "rutaAvalPDF": "avales/x.pdf", "estado": "registrado",
+    }
+
+
+async def _medir(SessionLocal, contador: List[int], fn, argumentos) -> Dict[str, Any]:
+    latencias, viajes = [], []
+    for args in argumentos:
+        async with SessionLocal() as session:
+            antes = contador[0]
+            t = time.perf_counter()
+            await fn(session, *args)
+            latencias.append(time.perf_counter() - t)
+            viajes.append(contador[0] - antes)
+    return {"viajes_por_op": round(sum(viajes) / len(viajes), 2), **percentiles(latencias)}
+
+
+async def _contencion(SessionLocal, contador: List[int], ids: List[int], clientes: int) -> Dict[str, Any]:
+    """`clientes` ediciones simultáneas de cada evento con el mismo If-Match (versión 3)."""
+    from app.crud import evento as crud
+
+    async def editar(id_evento: int, k: int) -> bool:
+        async with SessionLocal() as session:
+            return await crud.actualizar(session, id_evento, {"descripcion": f"c{k}"}, [3]) is not None
+
+    antes = contador[0]
+    t = time.perf_counter()
+    aplicadas = 0
+    for id_evento in ids:
+        aplicadas += sum(await asyncio.gather(*(editar(id_evento, k) for k in range(clientes))))
+    duracion = time.perf_counter() - t
+    intentos = len(ids) * clientes
+    return {
+        "eventos": len(ids), "clientes_por_evento": clientes, "aplicadas": aplicadas,
+        "rechazadas_412": intentos - aplicadas,
+        "viajes_por_intento": round((contador[0] - antes) / intentos, 2),
+        "ms_por_intento": round(duracion / intentos * 1000, 3),
+    }
+
+
+async def ejecutar(args: argparse.Namespace) -> Dict[str, Any]:
+    from app.crud import evento as crud
+    from app.db import SessionLocal, engine
+    from bench.siembra import activar_sqlite_rapido, sembrar
+
+    activar_sqlite_rapido(engine)
+    siembra = await sembrar(engine, args.eventos, recrear=True)
+    vol = siembra["volumen"]
+
+    contador = [0]
+
+    @event.listens_for(engine.sync_engine, "before_cursor_execute")
+    def _sentencia(*_):
+        contador[0] += 1
+
+    @event.listens_for(engine.sync_engine, "commit")
+    def _commit(*_):
+        contador[0] += 1
+
+    dialecto = engine.sync_engine.dialect
+    variantes = {
+        "antes": (crear_antes, actualizar_antes, eliminar_antes, True),
+        "returning": (crud.crear, crud.actualizar, crud.eliminar, True),
+        "sin_returning": (crud.crear, crud.actualizar, crud.eliminar, False),
+    }
+    n = args.operaciones
+    resultados: Dict[str, Any] = {"eventos": args.eventos, "operaciones": n, "variantes": {}}
+    base = 0
+    for nombre, (crear, actualizar, eliminar, returning) in variantes.items():
+        dialecto.insert_returning = dialecto.update_returning = returning and dialecto.name != "mysql"
+        creados: List[int] = []
+
+        async def crear_y_anotar(session, data):
+            creados.append((await crear(session, data)).idEvento)
+
+        r = {
+            "crear": await _medir(SessionLocal, contador, crear_y_anotar,
+                                  [(_evento(base + k, vol),) for k in range(n)]),
+        }
+        r["actualizar"] = await _medir(SessionLocal, contador, actualizar,
+                                       [(i, {"descripcion": f"v{i}", "categoria": "ludico"}) for i in creados])
+        if nombre != "antes":
+            # If-Match: mismo UPDATE con "AND version IN (...)" (tras la edición anterior van en la 2)
+            r["actualizar_if_match"] = await _medir(SessionLocal, contador, crud.actualizar,
+                                                    [(i, {"descripcion": f"w{i}"}, [2]) for i in creados])
+            r["contencion"] = await _contencion(SessionLocal, contador, creados[: args.contendidos], args.clientes)
+        r["eliminar"] = await _medir(SessionLocal, contador, eliminar, [(i,) for i in creados])
+        resultados["variantes"][nombre] = r
+        base += n
+
+    await engine.dispose()
+    return resultados
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--eventos", type=int, default=10_000, help="tamaño de la siembra")
+    ap.add_argument("--operaciones", type=int, default=2_000, help="escrituras por tipo y variante")
+    ap.add_argument("--contendidos", type=int, default=50, help="eventos editados a la vez por varios clientes")
+    ap.add_argument("--clientes", type=int, default=8, help="ediciones simultáneas por evento (mismo If-Match)")
+    ap.add_argument("--salida", type=Path, help="guardar resultados en JSON")
+    args = ap.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        os.environ.setdefault("DATABASE_URL", f"sqlite+aiosqlite:///{Path(tmp) / 'bench.db'}")
+        resultados = asyncio.run(ejecutar(args))
+
+    print(json.dumps(resultados, indent=2))
+    if args.salida:
+        args.salida.write_text(json.dumps(resultados, indent=2))
+
+
+if __name__ == "__main__":
+    main()
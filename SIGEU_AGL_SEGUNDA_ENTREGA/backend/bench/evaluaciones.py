@@ -0,0 +1,122 @@
+# bench/evaluaciones.py
+"""
+POST /api/v1/evaluaciones/batch: veredictos por lote frente al trigger por fila.
+
+Variantes, sobre la misma base sembrada y con el mismo servicio:
+  trigger   trg_eval_after_insert instalado (versión SQLite del de
+            5_objetos_crud_evento.sql): cada evaluación dispara su UPDATE
+            de evento y su INSERT en notificacion
+  lote      sin trigger (7_evaluaciones_en_aplicacion.sql): UPDATE ... IN por veredicto
+            y un INSERT multi-fila de notificaciones por lote
+
+`sentencias` cuenta lo que el backend envía al cursor; las que ejecuta el
+trigger quedan dentro del motor y solo se ven en la latencia.
+
+Uso (desde backend/):
+    python -m bench.evaluaciones --lotes 10,100,1000 --repeticiones 20
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+
+from sqlalchemy import event, text
+
+from bench.medicion import percentiles
+
+TRIGGER_SQLITE = """
+CREATE TRIGGER trg_eval_after_insert
+AFTER INSERT ON evaluacion
+FOR EACH ROW
+BEGIN
+  UPDATE evento SET estado = NEW.estado WHERE idEvento = NEW.idEvento;
+  INSERT INTO notificacion (idEvaluacion, tipoNotificacion, fechaEnvio, justificacion, urlPDF, usuarioReceptor)
+  SELECT NEW.idEvaluacion, NEW.estado, CURRENT_TIMESTAMP, NEW.comentarios, NEW.actaPDF, e.idOrganizador
+  FROM evento e
+  WHERE e.idEvento = NEW.idEvento;
+END
+"""
+
+
+def _lote(rnd: random.Random, eventos: int, n: int):
+    from app.schemas.evaluacion import LoteVeredictos
+    return LoteVeredictos(veredictos=[
+        {"idEvento": rnd.randint(1, eventos), "estado": rnd.choice(("aprobado", "rechazado")),
+         "comentarios": "Revisión de comité", "actaPDF": "actas/bench.pdf"}
+        for _ in range(n)
+    ])
+
+
+async def ejecutar(args: argparse.Namespace) -> Dict[str, Any]:
+    from app.db import SessionLocal, engine
+    from app.services import evaluacion as svc
+    from bench.siembra import activar_sqlite_rapido, sembrar
+
+    activar_sqlite_rapido(engine)
+    siembra = await sembrar(engine, args.eventos, recrear=True)
+
+    contador = [0]
+
+    @event.listens_for(engine.sync_engine, "before_cursor_execute")
+    def _sentencia(*_):
+        contador[0] += 1
+
+    lotes = [int(x) for x in args.lotes.split(",")]
+    resultados: Dict[str, Any] = {"eventos": args.eventos, "repeticiones": args.repeticiones, "variantes": {}}
+    for variante in ("trigger", "lote"):
+        async with engine.begin() as cx:
+            await cx.execute(text("DROP TRIGGER IF EXISTS trg_eval_after_insert"))
+            if variante == "trigger":
+                await cx.execute(text(TRIGGER_SQLITE))
+        svc._trigger_activo = None
+        rnd = random.Random(args.semilla)  # mismos veredictos en ambas variantes
+
+        por_lote: Dict[str, Any] = {}
+        for n in lotes:
+            latencias: List[float] = []
+            sentencias: List[int] = []
+            for _ in range(args.repeticiones):
+                lote = _lote(rnd, siembra["filas"]["evento"], n)
+                async with SessionLocal() as session:
+                    antes = contador[0]
+                    t = time.perf_counter()
+                    await svc.aplicar_lote(session, lote)
+                    latencias.append(time.perf_counter() - t)
+                    sentencias.append(contador[0] - antes)
+            p = percentiles(latencias)
+            por_lote[str(n)] = {
+                "sentencias_por_lote": round(sum(sentencias) / len(sentencias), 1),
+                "veredictos_por_s": round(n * len(latencias) / sum(latencias)),
+                **p,
+            }
+        resultados["variantes"][variante] = por_lote
+
+    await engine.dispose()
+    return resultados
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--eventos", type=int, default=20_000, help="tamaño de la siembra")
+    ap.add_argument("--lotes", default="10,100,1000", help="tamaños de lote separados por coma")
+    ap.add_argument("--repeticiones", type=int, default=20, help="lotes por tamaño y variante")
+    ap.add_argument("--semilla", type=int, default=7)
+    ap.add_argument("--salida", type=Path, help="guardar resultados en JSON")
+    args = ap.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        os.environ.setdefault("DATABASE_URL", f"sqlite+aiosqlite:///{Path(tmp) / 'bench.db'}")
+        resultados = asyncio.run(ejecutar(args))
+
+    print(json.dumps(resultados, indent=2))
+    if args.salida:
+        args.salida.write_text(json.dumps(resultados, indent=2))
+
+
+if __name__ == "__main__":
+    main()
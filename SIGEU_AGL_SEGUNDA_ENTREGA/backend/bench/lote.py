@@ -0,0 +1,113 @@
+# bench/lote.py
+"""
+Tablero que necesita K eventos puntuales: K × `GET /api/v1/{id}` vs. un
+`GET /api/v1/batch?ids=...`.
+
+La app corre en el mismo proceso (httpx + ASGITransport) sobre una base SQLite
+temporal sembrada con bench.siembra. Cada variante se mide con la cache de
+detalle vacía (fría: todo sale de la BD) y llena (caliente). Se cuentan las
+peticiones HTTP y las sentencias SQL por carga del tablero; con red de por
+medio cada petición suma además un viaje de ida y vuelta, que aquí no aparece.
+
+Uso (desde backend/, con requirements-bench.txt instalado):
+    python -m bench.lote --eventos 10000 --ids 100 --repeticiones 50
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List
+
+import httpx
+from sqlalchemy import event
+
+from bench.medicion import percentiles
+
+API = "/api/v1"
+
+
+async def ejecutar(args: argparse.Namespace) -> Dict[str, Any]:
+    from app.db import engine
+    from app.main import app
+    from app.services.cache import cache_eventos
+    from bench.siembra import activar_sqlite_rapido, sembrar
+
+    activar_sqlite_rapido(engine)
+    await sembrar(engine, args.eventos, args.semilla, recrear=True)
+
+    sentencias = [0]
+
+    @event.listens_for(engine.sync_engine, "before_cursor_execute")
+    def _contar(*_):
+        sentencias[0] += 1
+
+    rnd = random.Random(args.semilla)
+    tableros = [rnd.sample(range(1, args.eventos + 1), args.ids) for _ in range(args.repeticiones)]
+
+    async def uno_por_uno(c: httpx.AsyncClient, ids: List[int]) -> int:
+        for i in ids:
+            r = await c.get(f"{API}/{i}")
+            r.raise_for_status()
+        return len(ids)
+
+    async def por_lote(c: httpx.AsyncClient, ids: List[int]) -> int:
+        r = await c.get(f"{API}/batch", params={"ids": ",".join(map(str, ids))})
+        r.raise_for_status()
+        assert len(r.json()["items"]) == len(ids)
+        return 1
+
+    async def medir(c: httpx.AsyncClient, fn: Callable[[httpx.AsyncClient, List[int]], Awaitable[int]],
+                    caliente: bool) -> Dict[str, Any]:
+        latencias, peticiones, sql = [], 0, 0
+        for ids in tableros:
+            cache_eventos.local.limpiar()
+            if caliente:
+                await fn(c, ids)
+            antes = sentencias[0]
+            t = time.perf_counter()
+            peticiones += await fn(c, ids)
+            latencias.append(time.perf_counter() - t)
+            sql += sentencias[0] - antes
+        n = len(tableros)
+        return {
+            "peticiones_http": peticiones // n,
+            "sentencias_sql": round(sql / n, 1),
+            **percentiles(latencias),
+        }
+
+    resultados: Dict[str, Any] = {"eventos": args.eventos, "ids_por_tablero": args.ids, "repeticiones": args.repeticiones}
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://bench") as c:
+        await c.get(f"{API}/1")  # primera petición: conexiones del pool
+        for nombre, fn in (("uno_por_uno", uno_por_uno), ("lote", por_lote)):
+            resultados[nombre] = {
+                "cache_fria": await medir(c, fn, caliente=False),
+                "cache_caliente": await medir(c, fn, caliente=True),
+            }
+    for estado in ("cache_fria", "cache_caliente"):
+        resultados[f"aceleracion_p50_{estado}"] = round(
+            resultados["uno_por_uno"][estado]["p50_ms"] / resultados["lote"][estado]["p50_ms"], 1,
+        )
+    await engine.dispose()
+    return resultados
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--eventos", type=int, default=10_000, help="tamaño de la siembra")
+    ap.add_argument("--ids", type=int, default=100, help="eventos por tablero (máximo 200 en GET)")
+    ap.add_argument("--repeticiones", type=int, default=50)
+    ap.add_argument("--semilla", type=int, default=7)
+    args = ap.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        os.environ.setdefault("DATABASE_URL", f"sqlite+aiosqlite:///{Path(tmp) / 'lote.db'}")
+        resultados = asyncio.run(ejecutar(args))
+    print(json.dumps(resultados, indent=2))
+
+
+if __name__ == "__main__":
+    main()
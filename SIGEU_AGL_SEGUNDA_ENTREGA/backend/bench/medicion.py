@@ -0,0 +1,27 @@
+# bench/medicion.py
+import statistics
+import sys
+from typing import Dict, Iterable, Optional
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+
+def percentiles(muestras_s: Iterable[float]) -> Dict[str, float]:
+    ms = sorted(m * 1000 for m in muestras_s)
+    if len(ms) < 2:
+        valor = round(ms[0], 4) if ms else 0.0
+        return {"p50_ms": valor, "p95_ms": valor, "p99_ms": valor}
+    q = statistics.quantiles(ms, n=100, method="inclusive")
+    return {"p50_ms": round(q[49], 4), "p95_ms": round(q[94], 4), "p99_ms": round(q[98], 4)}
+
+
+def rss_max_mb() -> Optional[float]:
+    """Pico de memoria residente del proceso (None donde no hay `resource`)."""
+    if resource is None:
+        return None
+    kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux lo reporta en KiB y macOS en bytes
+    return round(kb / (1024 * 1024 if sys.platform == "darwin" else 1024), 1)
@@ -0,0 +1,103 @@
+# bench/metricas.py
+"""
+Costo de la instrumentación de app/core/metricas.py.
+
+  1. Histograma.observar aislado.
+  2. Petición ASGI a una ruta vacía, con y sin MetricasHTTP.
+  3. `SELECT 1` sobre SQLite en memoria, con y sin los eventos del engine.
+
+Uso (desde backend/):
+    python -m bench.metricas --peticiones 20000
+"""
+import argparse
+import asyncio
+import json
+import time
+from pathlib import Path
+
+import httpx
+from fastapi import FastAPI
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.core.metricas import CUBETAS_HTTP, Histograma, MetricasHTTP, instrumentar_engine
+
+
+def _app(con_metricas: bool) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/ping/{n}")
+    async def ping(n: int):
+        return {"n": n}
+
+    if con_metricas:
+        app.add_middleware(MetricasHTTP)
+    return app
+
+
+async def _asgi(con_metricas: bool, n: int) -> float:
+    transporte = httpx.ASGITransport(app=_app(con_metricas))
+    async with httpx.AsyncClient(transport=transporte, base_url="http://bench") as c:
+        for i in range(200):  # calentamiento
+            await c.get(f"/ping/{i}")
+        t = time.perf_counter()
+        for i in range(n):
+            await c.get(f"/ping/{i}")
+        return (time.perf_counter() - t) / n
+
+
+async def _sql(con_metricas: bool, n: int) -> float:
+    engine = create_async_engine("sqlite+aiosqlite://")
+    if con_metricas:
+        instrumentar_engine(engine)
+    async with engine.connect() as cx:
+        for _ in range(200):
+            await cx.exec_driver_sql("SELECT 1")
+        t = time.perf_counter()
+        for _ in range(n):
+            await cx.exec_driver_sql("SELECT 1")
+        duracion = (time.perf_counter() - t) / n
+    await engine.dispose()
+    return duracion
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--peticiones", type=int, default=20_000)
+    ap.add_argument("--rondas", type=int, default=4)
+    ap.add_argument("--salida", type=Path, help="guardar resultados en JSON")
+    args = ap.parse_args()
+    n = args.peticiones
+
+    h = Histograma("bench", "bench", ("metodo", "ruta", "codigo"), CUBETAS_HTTP)
+    t = time.perf_counter()
+    for i in range(n * 10):
+        h.observar(0.001 * (i % 300), "GET", "/api/v1/{id_evento}", "200")
+    observar_us = (time.perf_counter() - t) / (n * 10) * 1e6
+
+    # rondas alternando el orden (sin/con, con/sin); se toma la mejor de cada variante
+    tiempos = {("asgi", False): [], ("asgi", True): [], ("sql", False): [], ("sql", True): []}
+    for ronda in range(args.rondas):
+        for con in ((False, True) if ronda % 2 == 0 else (True, False)):
+            tiempos[("asgi", con)].append(asyncio.run(_asgi(con, n)))
+            tiempos[("sql", con)].append(asyncio.run(_sql(con, n)))
+    sin_asgi, con_asgi = min(tiempos[("asgi", False)]), min(tiempos[("asgi", True)])
+    sin_sql, con_sql = min(tiempos[("sql", False)]), min(tiempos[("sql", True)])
+
+    resultados = {
+        "peticiones": n,
+        "rondas": args.rondas,
+        "histograma_observar_us": round(observar_us, 3),
+        "asgi_sin_us": round(sin_asgi * 1e6, 1),
+        "asgi_con_us": round(con_asgi * 1e6, 1),
+        "asgi_costo_us": round((con_asgi - sin_asgi) * 1e6, 1),
+        "sql_sin_us": round(sin_sql * 1e6, 1),
+        "sql_con_us": round(con_sql * 1e6, 1),
+        "sql_costo_us": round((con_sql - sin_sql) * 1e6, 1),
+    }
+    print(json.dumps(resultados, indent=2))
+    if args.salida:
+        args.salida.write_text(json.dumps(resultados, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+# bench/ocupacion.py
+"""
+Vista de un mes para todas las instalaciones: calendario en memoria vs. agregado SQL.
+
+Sobre una base SQLite temporal sembrada con bench.siembra compara:
+  1. `GET /api/v1/instalaciones/ocupacion?mes=` (app en el mismo proceso, httpx
+     + ASGITransport): lectura del calendario que mantiene la agenda, justo
+     después de una escritura (se arma la respuesta) y repetida (sale guardada).
+  2. el agregado de la Consulta 02 llevado a (instalación, día) para el mes:
+     UNION ALL de evento + eventoInstalacion, JOIN evento y GROUP BY. Solo la
+     consulta (sin franjas ni serialización), así que favorece al SQL.
+Reporta además lo que cuesta construir la agenda con el calendario (una vez
+por proceso, o tras `invalidar()`).
+
+Uso (desde backend/, con requirements-bench.txt instalado):
+    python -m bench.ocupacion --eventos 100000 --mes 2025-03 --repeticiones 30
+"""
+import argparse
+import asyncio
+import json
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict
+
+import httpx
+from sqlalchemy import func, select, union_all
+
+from bench.medicion import percentiles
+
+API = "/api/v1/instalaciones"
+
+
+def _agregado_mes(anio: int, mes: int):
+    from app.models import Evento, EventoInstalacion
+
+    desde = f"{anio:04d}-{mes:02d}-01"
+    hasta = f"{anio + mes // 12:04d}-{mes % 12 + 1:02d}-01"
+    ev_inst = union_all(
+        select(Evento.idEvento, Evento.idInstalacion),
+        select(EventoInstalacion.idEvento, EventoInstalacion.idInstalacion),
+    ).subquery("ei")
+    dia = func.date(Evento.fechaInicio)
+    # SQLite (la base del bench); en MySQL sería TIMESTAMPDIFF(MINUTE, ...)
+    minutos = (func.julianday(Evento.fechaFin) - func.julianday(Evento.fechaInicio)) * 1440
+    return (
+        select(ev_inst.c.idInstalacion, dia, func.sum(minutos), func.count())
+        .join(Evento, Evento.idEvento == ev_inst.c.idEvento)
+        .where(Evento.estado != "rechazado", Evento.fechaInicio >= desde, Evento.fechaInicio < hasta)
+        .group_by(ev_inst.c.idInstalacion, dia)
+    )
+
+
+async def ejecutar(args: argparse.Namespace) -> Dict[str, Any]:
+    from app.db import SessionLocal, engine
+    from app.main import app
+    from app.services.agenda import agenda
+    from bench.siembra import activar_sqlite_rapido, sembrar
+
+    activar_sqlite_rapido(engine)
+    conteos = await sembrar(engine, args.eventos, args.semilla, recrear=True)
+    anio, mes = (int(p) for p in args.mes.split("-"))
+    resultados: Dict[str, Any] = {
+        "eventos": args.eventos, "instalaciones": conteos["filas"]["instalacion"], "mes": args.mes,
+        "repeticiones": args.repeticiones,
+    }
+
+    cargas = []
+    async with SessionLocal() as session:
+        for _ in range(5):
+            agenda.invalidar()
+            t = time.perf_counter()
+            await agenda.asegurar_cargado(session)
+            cargas.append(time.perf_counter() - t)
+    resultados["construir_agenda"] = percentiles(cargas)
+
+    vigentes = [i for i in range(1, args.eventos + 1) if agenda.reserva(i)][:args.repeticiones + 1]
+
+    async def pedir(c: httpx.AsyncClient, tras_escritura: bool) -> Dict[str, Any]:
+        latencias = []
+        for id_evento in vigentes:
+            if tras_escritura:
+                # otra escritura cualquiera: cambia la versión de la agenda y descarta la respuesta guardada
+                r = agenda.reserva(id_evento)
+                agenda.registrar(id_evento, r.id_instalacion, r.inicio, r.fin)
+            t = time.perf_counter()
+            resp = await c.get(f"{API}/ocupacion", params={"mes": args.mes})
+            latencias.append(time.perf_counter() - t)
+            resp.raise_for_status()
+        dias = sum(len(i["dias"]) for i in resp.json()["instalaciones"])
+        return {**percentiles(latencias[1:]), "dias_ocupados": dias, "respuesta_kb": round(len(resp.content) / 1024, 1)}
+
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://bench") as c:
+        resultados["calendario_tras_escritura"] = await pedir(c, tras_escritura=True)
+        resultados["calendario_repetido"] = await pedir(c, tras_escritura=False)
+
+    stmt = _agregado_mes(anio, mes)
+    async with SessionLocal() as session:
+        latencias = []
+        for _ in range(args.repeticiones + 1):
+            t = time.perf_counter()
+            filas = (await session.execute(stmt)).all()
+            latencias.append(time.perf_counter() - t)
+        resultados["agregado_sql"] = {**percentiles(latencias[1:]), "dias_ocupados": len(filas)}
+    await engine.dispose()
+
+    for variante in ("calendario_tras_escritura", "calendario_repetido"):
+        resultados[f"aceleracion_p50_{variante}"] = round(
+            resultados["agregado_sql"]["p50_ms"] / resultados[variante]["p50_ms"], 1,
+        )
+    return resultados
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--eventos", type=int, default=100_000, help="tamaño de la siembra")
+    ap.add_argument("--mes", default="2025-03")
+    ap.add_argument("--repeticiones", type=int, default=30)
+    ap.add_argument("--semilla", type=int, default=7)
+    args = ap.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        os.environ.setdefault("DATABASE_URL", f"sqlite+aiosqlite:///{Path(tmp) / 'ocupacion.db'}")
+        resultados = asyncio.run(ejecutar(args))
+    print(json.dumps(resultados, indent=2))
+
+
+if __name__ == "__main__":
+    main()
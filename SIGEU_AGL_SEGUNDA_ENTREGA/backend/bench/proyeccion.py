@@ -0,0 +1,104 @@
+# bench/proyeccion.py
+"""
+Listados grandes con y sin proyección de columnas (`fields=` de GET /api/v1/).
+
+Sobre una base SQLite temporal (aiosqlite) con descripciones de varios cientos
+de caracteres, lee `--filas` eventos de una vez y arma la respuesta de tres formas:
+  1. orm_completo: `select(Evento)` y `response_model=EventoPagina` (como antes).
+  2. tuplas_completo: columnas de EventoOut como tuplas y `serializar_pagina`.
+  3. tuplas_resumen: solo `--campos` (por defecto idEvento,nombre,fechaInicio,estado).
+
+Por variante reporta p50/p95, el pico de memoria asignada durante una llamada
+(tracemalloc, en una corrida aparte para no inflar la latencia) y el tamaño del JSON.
+
+Uso (desde backend/, con requirements-bench.txt instalado):
+    python -m bench.proyeccion --filas 10000 --repeticiones 30
+"""
+import argparse
+import asyncio
+import json
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from app.crud import evento as crud
+from app.models import cargar_todos
+from app.models.base import Base
+from app.models.evento import Evento
+from app.services.evento import proyeccion, serializar_pagina
+from bench.medicion import percentiles
+from bench.serializacion import _filas, _response_model
+
+_TEXTO = "Actividad abierta a la comunidad universitaria con inscripción previa en la facultad. "
+
+
+async def _medir(fn: Callable[[], Awaitable[bytes]], repeticiones: int) -> Dict[str, Any]:
+    await fn()
+    muestras = []
+    for _ in range(repeticiones):
+        t = time.perf_counter()
+        await fn()
+        muestras.append(time.perf_counter() - t)
+
+    tracemalloc.start()
+    cuerpo = await fn()
+    _, pico = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {**percentiles(muestras), "pico_memoria_mb": round(pico / 2**20, 2), "respuesta_kb": round(len(cuerpo) / 1024, 1)}
+
+
+async def ejecutar(args: argparse.Namespace, ruta_bd: Path) -> Dict[str, Any]:
+    engine = create_async_engine(f"sqlite+aiosqlite:///{ruta_bd}")
+    async with engine.begin() as cx:
+        await cx.run_sync(Base.metadata.create_all, tables=[Evento.__table__])
+        datos = _filas(args.filas, args.semilla)
+        for i, d in enumerate(datos):
+            if d["descripcion"]:
+                d["descripcion"] = _TEXTO * (2 + i % 8)
+        await cx.execute(Evento.__table__.insert(), datos)
+
+    completo = proyeccion()
+    resumen = proyeccion(frozenset(args.campos.split(",")))
+    cursor = None
+    resultados: Dict[str, Any] = {"filas": args.filas, "campos_resumen": args.campos}
+    async with AsyncSession(engine, expire_on_commit=False) as session:
+
+        async def orm_completo() -> bytes:
+            session.expunge_all()  # como en una petición nueva: sin identity map previo
+            objetos = (await session.scalars(
+                select(Evento).order_by(Evento.idEvento.desc()).limit(args.filas)
+            )).all()
+            return await _response_model(objetos, cursor)
+
+        async def tuplas(proy) -> bytes:
+            filas = await crud.listar_filas(session, proy.columnas, limit=args.filas)
+            return serializar_pagina(filas, cursor, proy)
+
+        resultados["orm_completo"] = await _medir(orm_completo, args.repeticiones)
+        resultados["tuplas_completo"] = await _medir(lambda: tuplas(completo), args.repeticiones)
+        resultados["tuplas_resumen"] = await _medir(lambda: tuplas(resumen), args.repeticiones)
+    await engine.dispose()
+    return resultados
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--filas", type=int, default=10_000)
+    ap.add_argument("--repeticiones", type=int, default=30)
+    ap.add_argument("--campos", default="idEvento,nombre,fechaInicio,estado")
+    ap.add_argument("--semilla", type=int, default=7)
+    args = ap.parse_args()
+
+    cargar_todos()
+    with tempfile.TemporaryDirectory() as tmp:
+        resultados = asyncio.run(ejecutar(args, Path(tmp) / "proyeccion.db"))
+    print(json.dumps(resultados, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,152 @@
+# bench/replica.py
+"""
+Lecturas en la réplica con dos archivos SQLite: la primaria sembrada con
+bench.siembra y una copia que hace de réplica congelada (nunca recibe las
+escrituras, como una réplica con retraso infinito).
+
+La app corre en el mismo proceso (httpx + ASGITransport). Se comprueba (y el
+script termina con error si no se cumple):
+  1. un cliente que escribe lee lo suyo desde la primaria (cookie
+     `sigeu_primaria`), mientras otro sin la cookie lee la réplica;
+  2. lo que el otro cliente leyó viejo de la réplica no queda en la cache;
+  3. pasada la ventana, el que escribió vuelve a leer de la réplica;
+  4. con la réplica caída (su carpeta renombrada) las lecturas van a la
+     primaria sin errores.
+Además mide el listado con lectores concurrentes mientras un cliente escribe,
+y cuántas lecturas atendió cada base.
+
+Uso (desde backend/, con requirements-bench.txt instalado):
+    python -m bench.replica --eventos 20000 --lectores 8 --peticiones 400
+"""
+import argparse
+import asyncio
+import json
+import os
+import shutil
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+
+import httpx
+
+from bench.medicion import percentiles
+
+API = "/api/v1"
+
+
+def _verificar(condicion: bool, mensaje: str) -> None:
+    if not condicion:
+        raise SystemExit(f"réplica: {mensaje}")
+
+
+async def ejecutar(args: argparse.Namespace, primaria: Path, dir_replica: Path) -> Dict[str, Any]:
+    from app.core.config import settings
+    from app.db import engine
+    from app.db.replica import COOKIE_PRIMARIA, replica
+    from app.main import app
+    from bench.siembra import activar_sqlite_rapido, sembrar
+
+    activar_sqlite_rapido(engine)
+    await sembrar(engine, args.eventos, args.semilla, recrear=True)
+    await engine.dispose()  # cierra la última conexión: el WAL queda volcado en el archivo
+    dir_replica.mkdir()
+    shutil.copy(primaria, dir_replica / primaria.name)
+
+    resultados: Dict[str, Any] = {"eventos": args.eventos, "retraso_max_s": settings.db_replica_retraso_max_s}
+    transporte = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transporte, base_url="http://bench") as escritor, \
+            httpx.AsyncClient(transport=transporte, base_url="http://bench") as otro:
+        # 1. leer lo propio
+        r = await escritor.post(f"{API}/", json={
+            "nombre": "Evento de la réplica", "categoria": "academico", "idOrganizador": 1, "idInstalacion": 1,
+            "fechaInicio": "2031-01-01T08:00:00", "fechaFin": "2031-01-01T09:00:00", "rutaAvalPDF": "a.pdf",
+        })
+        r.raise_for_status()
+        _verificar(COOKIE_PRIMARIA in escritor.cookies, "crear no devolvió la cookie")
+        nuevo = r.json()["idEvento"]
+        _verificar((await otro.get(f"{API}/{nuevo}")).status_code == 404, "la réplica ya tenía el evento nuevo")
+        _verificar((await escritor.get(f"{API}/{nuevo}")).status_code == 200, "el que escribió no ve su evento")
+
+        # 2. la lectura vieja de la réplica no entra a la cache
+        r = await escritor.put(f"{API}/1", json={"nombre": "Renombrado en la primaria"})
+        r.raise_for_status()
+        viejo = (await otro.get(f"{API}/1")).json()["nombre"]
+        propio = (await escritor.get(f"{API}/1")).json()["nombre"]
+        _verificar(viejo != propio == "Renombrado en la primaria", f"lecturas tras el PUT: {viejo!r} / {propio!r}")
+        resultados["leer_lo_escrito"] = {"otro_cliente": viejo, "escritor": propio}
+
+        # 3. fin de la ventana
+        await asyncio.sleep(settings.db_replica_retraso_max_s + 0.1)
+        antes = replica.lecturas
+        (await escritor.get(f"{API}/", params={"limit": 10})).raise_for_status()
+        _verificar(replica.lecturas == antes + 1, "pasada la ventana el escritor no volvió a la réplica")
+
+        # carga: lectores en la réplica y un escritor en la primaria a la vez
+        antes = {"replica": replica.lecturas, "primaria": replica.lecturas_primaria}
+        latencias: List[float] = []
+
+        async def lector(c: httpx.AsyncClient, n: int) -> None:
+            for _ in range(n):
+                t = time.perf_counter()
+                r = await c.get(f"{API}/", params={"limit": 50, "estado": "aprobado"})
+                latencias.append(time.perf_counter() - t)
+                r.raise_for_status()
+
+        async def escribir(n: int) -> int:
+            for i in range(n):
+                (await escritor.put(f"{API}/{2 + i}", json={"descripcion": f"cambio {i}"})).raise_for_status()
+                (await escritor.get(f"{API}/", params={"limit": 50})).raise_for_status()
+            return n
+
+        lectores = [httpx.AsyncClient(transport=transporte, base_url="http://bench") for _ in range(args.lectores)]
+        por_lector = args.peticiones // args.lectores
+        t = time.perf_counter()
+        _, escrituras = await asyncio.gather(
+            asyncio.gather(*(lector(c, por_lector) for c in lectores)), escribir(args.escrituras),
+        )
+        duracion = time.perf_counter() - t
+        for c in lectores:
+            await c.aclose()
+        resultados["carga"] = {
+            "lectores": args.lectores,
+            "lecturas_lectores": len(latencias),
+            "escrituras": escrituras,
+            "rps_lectores": round(len(latencias) / duracion, 1),
+            **percentiles(latencias),
+            "atendidas_replica": replica.lecturas - antes["replica"],
+            "atendidas_primaria": replica.lecturas_primaria - antes["primaria"],
+        }
+
+        # 4. réplica caída
+        dir_replica.rename(dir_replica.with_name("replica_caida"))
+        r = await otro.get(f"{API}/", params={"limit": 10})
+        _verificar(r.status_code == 200, f"con la réplica caída el listado respondió {r.status_code}")
+        _verificar(not replica.disponible() and replica.fallos == 1, "no se marcó la réplica como caída")
+        salud = (await otro.get("/health/db")).json()
+        resultados["replica_caida"] = {k: salud["replica"][k] for k in ("disponible", "fallos", "ultimo_error")}
+    await engine.dispose()
+    return resultados
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--eventos", type=int, default=20_000, help="tamaño de la siembra")
+    ap.add_argument("--lectores", type=int, default=8, help="clientes leyendo a la vez")
+    ap.add_argument("--peticiones", type=int, default=400, help="listados entre todos los lectores")
+    ap.add_argument("--escrituras", type=int, default=50, help="PUT + listado del cliente que escribe")
+    ap.add_argument("--semilla", type=int, default=7)
+    args = ap.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        primaria, dir_replica = Path(tmp) / "sigeu.db", Path(tmp) / "replica"
+        os.environ["DATABASE_URL"] = f"sqlite+aiosqlite:///{primaria}"
+        os.environ["READ_DATABASE_URL"] = f"sqlite+aiosqlite:///{dir_replica / primaria.name}"
+        os.environ.setdefault("DB_REPLICA_RETRASO_MAX_S", "1")
+        os.environ.setdefault("NOTIFICACIONES_ACTIVAS", "false")
+        resultados = asyncio.run(ejecutar(args, primaria, dir_replica))
+    print(json.dumps(resultados, indent=2, ensure_ascii=False))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,136 @@
+# bench/serializacion.py
+"""
+Costo de armar la respuesta de `GET /api/v1/` por cada 1000 eventos.
+
+Compara el camino anterior (objetos ORM pasados por `response_model=EventoPagina`
+de FastAPI y `json.dumps`) con `services.evento.serializar_pagina` (tuplas
+validadas con un TypeAdapter y volcadas a bytes por pydantic-core), y verifica
+que los bytes sean idénticos. Con una base SQLite en memoria mide además la
+lectura: `select(Evento)` (instancias ORM) vs. las columnas de EventoOut (tuplas).
+
+Uso (desde backend/):
+    python -m bench.serializacion --eventos 1000 --repeticiones 200
+"""
+import argparse
+import asyncio
+import json
+import random
+import time
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, List
+
+from fastapi.routing import serialize_response
+from fastapi.utils import create_model_field
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import Session
+
+from app.models import cargar_todos
+from app.models.base import Base
+from app.models.evento import Evento
+from app.schemas.evento import EventoPagina
+from app.services.evento import proyeccion, serializar_pagina
+from bench.medicion import percentiles
+
+_campo_pagina = create_model_field(name="respuesta", type_=EventoPagina, mode="serialization")
+
+
+def _filas(n: int, semilla: int) -> List[Dict[str, Any]]:
+    rnd = random.Random(semilla)
+    inicio = datetime(2025, 1, 6, 8, 0)
+    filas = []
+    for i in range(1, n + 1):
+        f = inicio + timedelta(hours=rnd.randrange(24 * 300))
+        filas.append({
+            "idEvento": i,
+            "nombre": f"Taller de robótica {i}",
+            "descripcion": None if i % 5 == 0 else "Sesión práctica con “kits” y guía de la facultad",
+            "fechaInicio": f,
+            "fechaFin": f + timedelta(hours=rnd.choice((1, 2, 3))),
+            "estado": rnd.choice(("registrado", "enRevision", "aprobado", "rechazado")),
+            "categoria": rnd.choice(("academico", "ludico")),
+            "idOrganizador": rnd.randint(1, 50),
+            "idInstalacion": rnd.randint(1, 20),
+            "rutaAvalPDF": f"/avales/{i}.pdf",
+            "version": 1 + i % 3,
+        })
+    return filas
+
+
+async def _response_model(objetos: List[Evento], next_cursor: str) -> bytes:
+    # lo que hacía FastAPI con response_model=EventoPagina y una JSONResponse
+    contenido = await serialize_response(
+        field=_campo_pagina, response_content={"items": objetos, "next_cursor": next_cursor},
+        by_alias=True, is_coroutine=True,
+    )
+    return json.dumps(contenido, ensure_ascii=False, allow_nan=False, indent=None, separators=(",", ":")).encode()
+
+
+def _medir(fn: Callable[[], Any], repeticiones: int) -> Dict[str, float]:
+    fn()
+    muestras = []
+    for _ in range(repeticiones):
+        t = time.perf_counter()
+        fn()
+        muestras.append(time.perf_counter() - t)
+    return percentiles(muestras)
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--eventos", type=int, default=1000, help="eventos por respuesta")
+    ap.add_argument("--repeticiones", type=int, default=200)
+    ap.add_argument("--semilla", type=int, default=7)
+    args = ap.parse_args()
+
+    cargar_todos()
+    datos = _filas(args.eventos, args.semilla)
+    cursor = "eyJvIjoiaWQiLCJpZCI6MSwiZiI6IjIwMjUtMDEtMDZUMDg6MDA6MDAifQ"
+    objetos = [Evento(**d) for d in datos]
+    columnas_out = proyeccion().columnas
+    tuplas = [tuple(d[c] for c in columnas_out) for d in datos]
+
+    loop = asyncio.new_event_loop()
+    antes = loop.run_until_complete(_response_model(objetos, cursor))
+    ahora = serializar_pagina(tuplas, cursor)
+    if antes != ahora:
+        raise SystemExit("las respuestas no son idénticas byte a byte")
+
+    resultados: Dict[str, Any] = {"eventos": args.eventos, "bytes": len(ahora), "identicos": True}
+    resultados["serializar"] = {
+        "response_model": _medir(lambda: loop.run_until_complete(_response_model(objetos, cursor)), args.repeticiones),
+        "type_adapter": _medir(lambda: serializar_pagina(tuplas, cursor), args.repeticiones),
+    }
+
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine, tables=[Evento.__table__])
+    with Session(engine) as session:
+        session.execute(Evento.__table__.insert(), datos)
+        session.commit()
+        columnas = [Evento.__table__.c[c] for c in columnas_out]
+
+        def orm() -> List[Evento]:
+            session.expunge_all()  # como en una petición nueva: sin identity map previo
+            return session.scalars(select(Evento).order_by(Evento.idEvento.desc())).all()
+
+        resultados["leer_y_serializar"] = {
+            "orm_response_model": _medir(
+                lambda: loop.run_until_complete(_response_model(orm(), cursor)), args.repeticiones,
+            ),
+            "tuplas_type_adapter": _medir(
+                lambda: serializar_pagina(
+                    session.execute(select(*columnas).order_by(Evento.idEvento.desc())).all(), cursor,
+                ),
+                args.repeticiones,
+            ),
+        }
+    engine.dispose()
+    loop.close()
+
+    for seccion in ("serializar", "leer_y_serializar"):
+        antes_ms, ahora_ms = (v["p50_ms"] for v in resultados[seccion].values())
+        resultados[seccion]["aceleracion_p50"] = round(antes_ms / ahora_ms, 2)
+    print(json.dumps(resultados, indent=2))
+
+
+if __name__ == "__main__":
+    main()
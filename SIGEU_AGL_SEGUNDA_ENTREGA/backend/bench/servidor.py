@@ -0,0 +1,166 @@
+# bench/servidor.py
+"""
+Rendimiento de `python -m app.serve` con 1 worker vs. varios.
+
+Levanta el servidor de producción con cada cantidad de workers y, con varios
+procesos generadores de carga (conexiones keep-alive de httpx), pega durante
+`--duracion` segundos a las rutas de lectura de eventos (listado y detalle,
+las de bench.api). Reporta peticiones por segundo y p50/p95/p99 por corrida.
+
+Los generadores de carga comparten la máquina con el servidor: en una máquina
+de pocos núcleos compiten con los workers y el resultado subestima la ganancia.
+La cantidad de núcleos visibles se guarda en el resultado.
+
+Sin DATABASE_URL siembra una base SQLite temporal con bench.siembra.
+
+Uso (desde backend/, con requirements-bench.txt instalado):
+    python -m bench.servidor --workers 1,4 --duracion 20 --procesos 4
+"""
+import argparse
+import asyncio
+import http.client
+import json
+import multiprocessing
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from collections import Counter
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+import httpx
+
+from app.serve import nucleos
+from bench.api import Estado, listar, obtener
+from bench.arranque import _puerto_libre
+from bench.medicion import percentiles
+from bench.siembra import Volumen
+
+OPERACIONES = {"listar": listar, "obtener": obtener}
+
+
+# ---------- generador de carga (un proceso) ----------
+async def _cargar(url: str, eventos: int, semilla: int, concurrencia: int, hasta: float) -> Tuple[List[float], Counter]:
+    estado = Estado(Volumen.para(eventos).__dict__, semilla)
+    ops = list(OPERACIONES.values())
+    latencias: List[float] = []
+    codigos: Counter = Counter()
+    limites = httpx.Limits(max_connections=concurrencia, max_keepalive_connections=concurrencia)
+
+    async with httpx.AsyncClient(base_url=url, timeout=30, limits=limites) as cliente:
+        async def cliente_virtual() -> None:
+            while time.time() < hasta:
+                op = estado.rnd.choice(ops)
+                t = time.perf_counter()
+                try:
+                    r = await op(cliente, estado)
+                    codigos[str(r.status_code)] += 1
+                except httpx.HTTPError as exc:
+                    codigos[type(exc).__name__] += 1
+                latencias.append(time.perf_counter() - t)
+
+        await asyncio.gather(*(cliente_virtual() for _ in range(concurrencia)))
+    return latencias, codigos
+
+
+def _generador(url: str, eventos: int, semilla: int, concurrencia: int, hasta: float) -> Tuple[List[float], Counter]:
+    return asyncio.run(_cargar(url, eventos, semilla, concurrencia, hasta))
+
+
+# ---------- servidor ----------
+def _esperar(puerto: int, proc: subprocess.Popen, limite_s: float = 60) -> None:
+    t = time.perf_counter()
+    while time.perf_counter() - t < limite_s:
+        if proc.poll() is not None:
+            raise RuntimeError(f"app.serve terminó con código {proc.returncode}")
+        cx = http.client.HTTPConnection("127.0.0.1", puerto, timeout=5)
+        try:
+            cx.request("GET", "/api/v1/?limit=1")
+            if cx.getresponse().status == 200:
+                return
+        except OSError:
+            pass
+        finally:
+            cx.close()
+        time.sleep(0.05)
+    raise RuntimeError(f"app.serve no respondió en {limite_s} s")
+
+
+def correr(workers: int, entorno: Dict[str, str], args: argparse.Namespace) -> Dict[str, Any]:
+    puerto = _puerto_libre()
+    proc = subprocess.Popen(
+        [sys.executable, "-m", "app.serve", "--workers", str(workers), "--puerto", str(puerto),
+         "--host", "127.0.0.1", "--log-level", "warning"],
+        env=entorno,
+    )
+    try:
+        _esperar(puerto, proc)
+        url = f"http://127.0.0.1:{puerto}"
+        # calentamiento: cada worker carga la cache y los índices en memoria en su primera petición
+        hasta = time.time() + args.calentamiento
+        with multiprocessing.get_context("spawn").Pool(args.procesos) as pool:
+            pool.starmap(_generador, [(url, args.eventos, i, args.concurrencia, hasta) for i in range(args.procesos)])
+            t0 = time.time()
+            hasta = t0 + args.duracion
+            partes = pool.starmap(
+                _generador, [(url, args.eventos, 100 + i, args.concurrencia, hasta) for i in range(args.procesos)],
+            )
+            duracion = time.time() - t0
+    finally:
+        proc.terminate()
+        proc.wait()
+
+    latencias = [l for lat, _ in partes for l in lat]
+    codigos: Counter = sum((c for _, c in partes), Counter())
+    return {
+        "workers": workers,
+        "peticiones": len(latencias),
+        "codigos": dict(codigos),
+        "duracion_s": round(duracion, 2),
+        "rps": round(len(latencias) / duracion, 1),
+        **percentiles(latencias),
+    }
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--workers", default=f"1,{max(2, nucleos())}", help="cantidades a comparar, separadas por coma")
+    ap.add_argument("--duracion", type=float, default=15, help="segundos de carga por corrida")
+    ap.add_argument("--calentamiento", type=float, default=3)
+    ap.add_argument("--procesos", type=int, default=2, help="procesos generadores de carga")
+    ap.add_argument("--concurrencia", type=int, default=16, help="clientes por proceso generador")
+    ap.add_argument("--eventos", type=int, default=10_000, help="siembra de la base temporal")
+    ap.add_argument("--salida", type=Path, help="guardar resultados en JSON")
+    args = ap.parse_args()
+
+    entorno = dict(os.environ)
+    resultados: Dict[str, Any] = {
+        "nucleos": nucleos(),
+        "procesos": args.procesos,
+        "concurrencia": args.concurrencia,
+        "rutas": list(OPERACIONES),
+        "corridas": [],
+    }
+    with tempfile.TemporaryDirectory() as tmp:
+        if "DATABASE_URL" not in entorno:
+            entorno["DATABASE_URL"] = f"sqlite+aiosqlite:///{Path(tmp) / 'servidor.db'}"
+            subprocess.run(
+                [sys.executable, "-m", "bench.siembra", "--eventos", str(args.eventos)],
+                env=entorno, check=True, stdout=subprocess.DEVNULL,
+            )
+        for n in (int(w) for w in args.workers.split(",")):
+            print(f"  {n} worker(s)…", file=sys.stderr)
+            resultados["corridas"].append(correr(n, entorno, args))
+
+    base = resultados["corridas"][0]["rps"]
+    for c in resultados["corridas"]:
+        c["rps_vs_primera"] = round(c["rps"] / base, 2) if base else None
+    print(json.dumps(resultados, indent=2))
+    if args.salida:
+        args.salida.write_text(json.dumps(resultados, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,189 @@
+# bench/siembra.py
+"""
+Datos sintéticos con el esquema de 1_CREAR_BASE_D.sql (vía los modelos del backend).
+
+El volumen escala con --eventos: usuarios, instalaciones, organizaciones,
+evaluaciones (~60 % de los eventos), instalaciones adicionales (~5 %) y
+organizaciones externas (~10 %) salen de proporciones fijas. Con la misma
+semilla se obtienen siempre los mismos datos.
+
+Uso (desde backend/; crea el esquema si no existe, sobre una base vacía):
+    DATABASE_URL=sqlite+aiosqlite:///bench.db python -m bench.siembra --eventos 100000
+"""
+import argparse
+import asyncio
+import random
+import time
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterator, List
+
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.db.sqlite import configurar as configurar_sqlite
+from app.models import (
+    cargar_todos, Base, Usuario, Instalacion, Organizacion, Evento, UsuarioEvento,
+    EventoInstalacion, EventoOrganizacion, Evaluacion,
+)
+
+INICIO = datetime(2025, 1, 1, 7, 0)
+FILAS_POR_INSERT = 5_000
+
+ROLES = ("docente", "estudiante", "secretariaAcademica")
+TIPOS_INSTALACION = ("salon", "laboratorio", "auditorio", "otro")
+ESTADOS = ("registrado", "enRevision", "aprobado", "rechazado")
+PESOS_ESTADO = (0.2, 0.2, 0.45, 0.15)
+
+
+@dataclass
+class Volumen:
+    eventos: int
+    usuarios: int
+    instalaciones: int
+    organizaciones: int
+    dias: int  # rango de fechas en el que se reparten los eventos
+
+    @classmethod
+    def para(cls, eventos: int) -> "Volumen":
+        instalaciones = max(20, eventos // 500)
+        return cls(
+            eventos=eventos,
+            usuarios=max(50, eventos // 100),
+            instalaciones=instalaciones,
+            organizaciones=max(10, eventos // 1_000),
+            dias=max(30, eventos // (instalaciones * 2)),
+        )
+
+
+def activar_sqlite_rapido(engine: AsyncEngine) -> None:
+    """WAL y FK activas en cada conexión SQLite (el engine de la app ya lo hace; ver app/db/sqlite.py)."""
+    configurar_sqlite(engine)
+
+
+def _eventos(vol: Volumen, rnd: random.Random) -> Iterator[Dict[str, Any]]:
+    for id_evento in range(1, vol.eventos + 1):
+        inicio = INICIO + timedelta(days=rnd.randrange(vol.dias), minutes=30 * rnd.randrange(26))
+        yield {
+            "idEvento": id_evento,
+            "nombre": f"Evento sintético {id_evento}",
+            "descripcion": rnd.choice(("Charla", "Taller", "Torneo", "Seminario", None)),
+            "fechaInicio": inicio,
+            "fechaFin": inicio + timedelta(minutes=30 * rnd.randint(1, 8)),
+            "estado": rnd.choices(ESTADOS, PESOS_ESTADO)[0],
+            "categoria": rnd.choice(("academico", "ludico")),
+            "idOrganizador": rnd.randint(1, vol.usuarios),
+            "idInstalacion": rnd.randint(1, vol.instalaciones),
+            "rutaAvalPDF": f"avales/{id_evento}.pdf",
+            "fechaRegistro": inicio - timedelta(days=rnd.randint(1, 60)),
+        }
+
+
+def _organizador(rnd: random.Random, vol: Volumen) -> int:
+    # trg_ue_check_rol: en usuarioEvento solo docentes y estudiantes (ROLES[id % 3])
+    id_usuario = rnd.randint(1, vol.usuarios)
+    return id_usuario - 1 if ROLES[id_usuario % 3] == "secretariaAcademica" else id_usuario
+
+
+async def _insertar(engine: AsyncEngine, modelo, filas: Iterator[Dict[str, Any]]) -> int:
+    total = 0
+    lote: List[Dict[str, Any]] = []
+    async with engine.begin() as cx:
+        for fila in filas:
+            lote.append(fila)
+            if len(lote) >= FILAS_POR_INSERT:
+                await cx.execute(insert(modelo), lote)
+                total += len(lote)
+                lote = []
+        if lote:
+            await cx.execute(insert(modelo), lote)
+            total += len(lote)
+    return total
+
+
+async def sembrar(engine: AsyncEngine, eventos: int, semilla: int = 7, recrear: bool = False) -> Dict[str, Any]:
+    """
+    Crea las tablas que falten y las llena. Con `recrear` borra antes las tablas
+    de los modelos (solo para bases desechables). Devuelve conteos y tiempo.
+    """
+    vol = Volumen.para(eventos)
+    rnd = random.Random(semilla)
+    t = time.perf_counter()
+
+    cargar_todos()  # notificacion y demás tablas que no se siembran también van al esquema
+    async with engine.begin() as cx:
+        if recrear:
+            await cx.run_sync(Base.metadata.drop_all)
+        await cx.run_sync(Base.metadata.create_all)
+
+    conteos: Dict[str, int] = {}
+    conteos["usuario"] = await _insertar(engine, Usuario, (
+        {"idUsuario": i, "nombre": f"Usuario {i}", "correo": f"u{i}@uao.edu.co", "rol": ROLES[i % 3]}
+        for i in range(1, vol.usuarios + 1)
+    ))
+    conteos["instalacion"] = await _insertar(engine, Instalacion, (
+        {
+            "idInstalacion": i, "nombre": f"Sala {i}", "tipo": TIPOS_INSTALACION[i % 4],
+            "capacidad": rnd.choice((20, 30, 40, 80, 200)), "ubicacion": f"Bloque {1 + i % 6}",
+        }
+        for i in range(1, vol.instalaciones + 1)
+    ))
+    conteos["organizacion"] = await _insertar(engine, Organizacion, (
+        {
+            "idOrganizacion": i, "nombre": f"Organización {i}", "representanteLegal": f"Rep {i}",
+            "actividadPrincipal": "Servicios", "telefono": f"602{i:07d}",
+            "ubicacion": "Cali", "sectorEconomico": "Educación",
+        }
+        for i in range(1, vol.organizaciones + 1)
+    ))
+    conteos["evento"] = await _insertar(engine, Evento, _eventos(vol, rnd))
+
+    # tablas hijas: se recorren los ids con proporciones fijas
+    conteos["usuarioEvento"] = await _insertar(engine, UsuarioEvento, (
+        {"idUsuario": _organizador(rnd, vol), "idEvento": i, "principal": "S",
+         "tipoAval": rnd.choice(("director_programa", "director_docencia")), "avalPDF": f"avales/{i}.pdf"}
+        for i in range(1, vol.eventos + 1)
+    ))
+    conteos["eventoInstalacion"] = await _insertar(engine, EventoInstalacion, (
+        {"idEvento": i, "idInstalacion": rnd.randint(1, vol.instalaciones)}
+        for i in range(1, vol.eventos + 1) if rnd.random() < 0.05
+    ))
+    conteos["eventoOrganizacion"] = await _insertar(engine, EventoOrganizacion, (
+        {"idEvento": i, "idOrganizacion": rnd.randint(1, vol.organizaciones),
+         "participante": f"Participante {i}", "esRepresentanteLegal": rnd.random() < 0.5}
+        for i in range(1, vol.eventos + 1) if rnd.random() < 0.1
+    ))
+    conteos["evaluacion"] = await _insertar(engine, Evaluacion, (
+        {"idEvento": i, "estado": rnd.choice(("aprobado", "rechazado")),
+         "comentarios": "Revisión sintética", "fechaRevision": INICIO + timedelta(days=rnd.randrange(vol.dias))}
+        for i in range(1, vol.eventos + 1) if rnd.random() < 0.6
+    ))
+
+    return {
+        "volumen": vol.__dict__,
+        "filas": conteos,
+        "siembra_s": round(time.perf_counter() - t, 2),
+    }
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--eventos", type=int, default=10_000)
+    ap.add_argument("--semilla", type=int, default=7)
+    ap.add_argument("--recrear", action="store_true", help="borrar y crear de nuevo las tablas")
+    args = ap.parse_args()
+
+    from app.db import engine
+
+    async def _correr():
+        activar_sqlite_rapido(engine)
+        try:
+            return await sembrar(engine, args.eventos, args.semilla, args.recrear)
+        finally:
+            await engine.dispose()
+
+    print(asyncio.run(_correr()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,9 @@
+# tests/conftest.py
+import os
+
+# antes de importar la app: Settings se lee una vez y el engine sale de esa URL.
+# SQLite en memoria: la app crea el esquema al arrancar (app/db/sqlite.py).
+os.environ["DATABASE_URL"] = "sqlite+aiosqlite://"
+os.environ["READ_DATABASE_URL"] = ""
+os.environ["NOTIFICACIONES_ACTIVAS"] = "false"
+os.environ["ARRANQUE_PEREZOSO"] = "false"
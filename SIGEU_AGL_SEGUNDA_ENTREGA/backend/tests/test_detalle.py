@@ -0,0 +1,110 @@
+# tests/test_detalle.py
+"""
+GET /api/v1/{id}/detalle y GET /api/v1/detalle?ids=... resuelven las relaciones
+con un número fijo de sentencias (ver crud.evento.obtener_detalles): evento +
+organizador + instalación en un JOIN y un SELECT ... IN por cada colección.
+"""
+from datetime import datetime, timedelta
+from typing import Iterator, List
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import event, insert
+
+from app.db import obtener_engine
+from app.main import app
+from app.models import (
+    Evaluacion, Evento, EventoInstalacion, EventoOrganizacion, Instalacion, Organizacion,
+    Usuario, UsuarioEvento,
+)
+
+API = "/api/v1"
+SENTENCIAS_DETALLE = 5
+EVENTOS = 30
+
+
+async def _sembrar() -> None:
+    inicio = datetime(2030, 1, 1, 8)
+    async with obtener_engine().begin() as cx:
+        await cx.execute(insert(Usuario), [
+            {"idUsuario": i, "nombre": f"Usuario {i}", "correo": f"u{i}@uao.edu.co", "rol": "docente"}
+            for i in range(1, 6)
+        ])
+        await cx.execute(insert(Instalacion), [
+            {"idInstalacion": i, "nombre": f"Sala {i}", "tipo": "salon", "capacidad": 30, "ubicacion": "Bloque 1"}
+            for i in range(1, 5)
+        ])
+        await cx.execute(insert(Organizacion), [
+            {"idOrganizacion": i, "nombre": f"Organización {i}", "representanteLegal": f"Rep {i}",
+             "actividadPrincipal": "Servicios", "telefono": "6020000000", "ubicacion": "Cali",
+             "sectorEconomico": "Educación"}
+            for i in range(1, 4)
+        ])
+        await cx.execute(insert(Evento), [
+            {"idEvento": i, "nombre": f"Evento {i}", "categoria": "academico", "estado": "registrado",
+             "idOrganizador": 1 + i % 5, "idInstalacion": 1 + i % 4, "rutaAvalPDF": f"avales/{i}.pdf",
+             "fechaInicio": inicio + timedelta(days=i), "fechaFin": inicio + timedelta(days=i, hours=2)}
+            for i in range(1, EVENTOS + 1)
+        ])
+        # cada colección con 0, 1 o 2 filas según el evento
+        await cx.execute(insert(EventoInstalacion), [
+            {"idEvento": i, "idInstalacion": 1 + (i + k) % 4}
+            for i in range(1, EVENTOS + 1) for k in range(1, 1 + i % 3)
+        ])
+        await cx.execute(insert(EventoOrganizacion), [
+            {"idEvento": i, "idOrganizacion": 1 + (i + k) % 3, "participante": f"Participante {i}.{k}"}
+            for i in range(1, EVENTOS + 1) for k in range(i % 3)
+        ])
+        await cx.execute(insert(UsuarioEvento), [
+            {"idUsuario": 1 + (i + k) % 5, "idEvento": i, "principal": "S" if k == 0 else "N"}
+            for i in range(1, EVENTOS + 1) for k in range(1 + i % 2)
+        ])
+        await cx.execute(insert(Evaluacion), [
+            {"idEvento": i, "estado": "aprobado" if k else "rechazado", "fechaRevision": inicio}
+            for i in range(1, EVENTOS + 1) for k in range(i % 3)
+        ])
+
+
+@pytest.fixture(scope="module")
+def cliente() -> Iterator[TestClient]:
+    with TestClient(app) as c:
+        c.portal.call(_sembrar)
+        yield c
+
+
+@pytest.fixture
+def sentencias() -> Iterator[List[str]]:
+    ejecutadas: List[str] = []
+
+    def _contar(conn, cursor, sql, *_) -> None:
+        ejecutadas.append(sql)
+
+    engine = obtener_engine().sync_engine
+    event.listen(engine, "before_cursor_execute", _contar)
+    yield ejecutadas
+    event.remove(engine, "before_cursor_execute", _contar)
+
+
+@pytest.mark.parametrize("id_evento", [1, 2, 3])
+def test_detalle_de_un_evento(cliente: TestClient, sentencias: List[str], id_evento: int) -> None:
+    r = cliente.get(f"{API}/{id_evento}/detalle")
+    assert r.status_code == 200, r.text
+    assert r.json()["idEvento"] == id_evento
+    assert len(sentencias) == SENTENCIAS_DETALLE, sentencias
+
+
+@pytest.mark.parametrize("cuantos", [1, 2, 10, EVENTOS])
+def test_detalle_de_varios_eventos(cliente: TestClient, sentencias: List[str], cuantos: int) -> None:
+    ids = list(range(EVENTOS, EVENTOS - cuantos, -1))
+    r = cliente.get(f"{API}/detalle", params={"ids": ",".join(map(str, ids))})
+    assert r.status_code == 200, r.text
+    assert [d["idEvento"] for d in r.json()["items"]] == ids
+    assert len(sentencias) == SENTENCIAS_DETALLE, sentencias
+
+
+def test_detalle_con_ids_faltantes(cliente: TestClient, sentencias: List[str]) -> None:
+    r = cliente.get(f"{API}/detalle", params={"ids": "2,999,1"})
+    assert r.status_code == 200, r.text
+    assert [d["idEvento"] for d in r.json()["items"]] == [2, 1]
+    assert r.json()["faltantes"] == [999]
+    assert len(sentencias) == SENTENCIAS_DETALLE, sentencias
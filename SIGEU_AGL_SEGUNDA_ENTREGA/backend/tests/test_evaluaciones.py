@@ -0,0 +1,117 @@
+# tests/test_evaluaciones.py
+"""
+POST /api/v1/evaluaciones/batch: aprobar un evento rechazado vuelve a ocupar su
+instalación y sus instalaciones adicionales, así que se verifica el horario como
+en PUT /api/v1/{id}. Si ya está tomado, esa fila sale con 409 y no se aplica.
+"""
+from typing import Any, Dict, Iterator, List
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import func, insert, select
+
+from app.db import obtener_engine
+from app.main import app
+from app.models import Evaluacion, EventoInstalacion, Instalacion, Usuario
+from app.services.agenda import agenda
+from app.services.busqueda import buscador
+from app.services.kpi import kpis
+
+API = "/api/v1"
+
+
+async def _sembrar() -> None:
+    async with obtener_engine().begin() as cx:
+        await cx.execute(insert(Usuario), [
+            {"idUsuario": 1, "nombre": "Usuario 1", "correo": "u1@uao.edu.co", "rol": "docente"},
+        ])
+        await cx.execute(insert(Instalacion), [
+            {"idInstalacion": i, "nombre": f"Sala {i}", "tipo": "salon", "capacidad": 30, "ubicacion": "Bloque 1"}
+            for i in range(1, 4)
+        ])
+
+
+@pytest.fixture(scope="module")
+def cliente() -> Iterator[TestClient]:
+    # base en memoria nueva por módulo: los índices del proceso no pueden venir de otra
+    for indice in (agenda, kpis, buscador):
+        indice.invalidar()
+    with TestClient(app) as c:
+        c.portal.call(_sembrar)
+        yield c
+
+
+def _evento(c: TestClient, dia: int, inicio: int, fin: int, sala: int, estado: str = "registrado") -> int:
+    r = c.post(f"{API}/", json={
+        "nombre": f"Evento {dia}-{inicio}-{sala}", "categoria": "academico", "idOrganizador": 1,
+        "idInstalacion": sala, "fechaInicio": f"2030-01-{dia:02d}T{inicio:02d}:00:00",
+        "fechaFin": f"2030-01-{dia:02d}T{fin:02d}:00:00", "rutaAvalPDF": "avales/a.pdf", "estado": estado,
+    })
+    assert r.status_code == 201, r.text
+    return r.json()["idEvento"]
+
+
+def _adicional(c: TestClient, id_evento: int, sala: int) -> None:
+    async def agregar() -> None:
+        async with obtener_engine().begin() as cx:
+            await cx.execute(insert(EventoInstalacion), [{"idEvento": id_evento, "idInstalacion": sala}])
+    c.portal.call(agregar)
+
+
+def _evaluaciones(c: TestClient, id_evento: int) -> int:
+    async def contar() -> int:
+        async with obtener_engine().connect() as cx:
+            return (await cx.execute(
+                select(func.count()).select_from(Evaluacion).where(Evaluacion.idEvento == id_evento)
+            )).scalar_one()
+    return c.portal.call(contar)
+
+
+def _lote(c: TestClient, veredictos: List[Dict[str, Any]]) -> Dict[str, Any]:
+    r = c.post(f"{API}/evaluaciones/batch", json={"veredictos": veredictos})
+    assert r.status_code == 200, r.text
+    return r.json()
+
+
+def test_aprobar_rechazado_en_horario_ocupado(cliente: TestClient) -> None:
+    rechazado = _evento(cliente, 1, 8, 10, sala=1, estado="rechazado")
+    ocupante = _evento(cliente, 1, 9, 11, sala=1)
+
+    r = _lote(cliente, [{"idEvento": rechazado, "estado": "aprobado"}])
+    assert r["aplicadas"] == 0 and r["eventos_actualizados"] == 0
+    assert [(e["fila"], e["codigo"]) for e in r["errores"]] == [(1, 409)]
+    assert str(ocupante) in r["errores"][0]["detalle"]
+    assert cliente.get(f"{API}/{rechazado}").json()["estado"] == "rechazado"
+    assert _evaluaciones(cliente, rechazado) == 0
+
+
+def test_aprobar_rechazado_ocupado_por_sala_adicional(cliente: TestClient) -> None:
+    rechazado = _evento(cliente, 2, 8, 10, sala=1, estado="rechazado")
+    _adicional(cliente, rechazado, 2)
+    _evento(cliente, 2, 9, 11, sala=2)
+    libre = _evento(cliente, 3, 8, 10, sala=3, estado="rechazado")
+
+    # solo la fila que choca se rechaza; el resto del lote se aplica
+    r = _lote(cliente, [
+        {"idEvento": rechazado, "estado": "aprobado"},
+        {"idEvento": libre, "estado": "aprobado"},
+    ])
+    assert r["aplicadas"] == 1 and r["eventos_actualizados"] == 1
+    assert [(e["fila"], e["codigo"]) for e in r["errores"]] == [(1, 409)]
+    assert cliente.get(f"{API}/{rechazado}").json()["estado"] == "rechazado"
+    assert cliente.get(f"{API}/{libre}").json()["estado"] == "aprobado"
+
+
+def test_aprobar_rechazado_libre_vuelve_a_ocupar_sus_salas(cliente: TestClient) -> None:
+    rechazado = _evento(cliente, 4, 8, 10, sala=1, estado="rechazado")
+    _adicional(cliente, rechazado, 3)
+
+    r = _lote(cliente, [{"idEvento": rechazado, "estado": "aprobado"}])
+    assert r["aplicadas"] == 1 and r["errores"] == []
+
+    # la reserva quedó en la agenda con la sala adicional
+    r = cliente.post(f"{API}/", json={
+        "nombre": "Choque en adicional", "categoria": "academico", "idOrganizador": 1, "idInstalacion": 3,
+        "fechaInicio": "2030-01-04T09:00:00", "fechaFin": "2030-01-04T09:30:00", "rutaAvalPDF": "avales/a.pdf",
+    })
+    assert r.status_code == 409, r.text
@@ -0,0 +1,112 @@
+# tests/test_indices.py
+"""
+Marca de cambios de los índices en memoria (services/indice.py): con
+INDICES_VERIFICAR_S > 0 un worker reconstruye agenda, KPIs y búsqueda cuando
+otro proceso escribe, pero no por sus propias escrituras, que ya aplicó.
+"""
+from typing import Iterator, List
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import insert
+
+from app.core.config import settings
+from app.db import obtener_engine
+from app.main import app
+from app.models import EventoInstalacion, Instalacion, Usuario
+from app.services import indice as indice_mod
+from app.services.agenda import agenda
+from app.services.busqueda import buscador
+from app.services.kpi import kpis
+
+API = "/api/v1"
+
+
+async def _sembrar() -> None:
+    async with obtener_engine().begin() as cx:
+        await cx.execute(insert(Usuario), [
+            {"idUsuario": 1, "nombre": "Usuario 1", "correo": "u1@uao.edu.co", "rol": "docente"},
+        ])
+        await cx.execute(insert(Instalacion), [
+            {"idInstalacion": i, "nombre": f"Sala {i}", "tipo": "salon", "capacidad": 30, "ubicacion": "Bloque 1"}
+            for i in range(1, 4)
+        ])
+
+
+@pytest.fixture
+def cliente(monkeypatch: pytest.MonkeyPatch) -> Iterator[TestClient]:
+    # cada consulta relee la marca de la BD; base nueva: el contador vuelve a empezar,
+    # así que tampoco sirven los valores propios que el proceso recordaba
+    monkeypatch.setattr(settings, "indices_verificar_s", 1e-9)
+    monkeypatch.setattr(indice_mod, "_marca", indice_mod._MarcaBD())
+    for indice in (agenda, kpis, buscador):
+        indice.invalidar()
+    with TestClient(app) as c:
+        c.portal.call(_sembrar)
+        yield c
+
+
+@pytest.fixture
+def cargas(monkeypatch: pytest.MonkeyPatch) -> List[str]:
+    cargadas: List[str] = []
+    for nombre, indice in (("kpis", kpis), ("buscador", buscador)):
+        original = indice._cargar
+
+        async def contar(session, _nombre=nombre, _original=original):
+            cargadas.append(_nombre)
+            await _original(session)
+        monkeypatch.setattr(indice, "_cargar", contar)
+    return cargadas
+
+
+def _evento(c: TestClient, dia: int, sala: int = 1) -> int:
+    r = c.post(f"{API}/", json={
+        "nombre": f"Evento {dia}", "categoria": "academico", "idOrganizador": 1, "idInstalacion": sala,
+        "fechaInicio": f"2030-01-{dia:02d}T08:00:00", "fechaFin": f"2030-01-{dia:02d}T10:00:00",
+        "rutaAvalPDF": "avales/a.pdf",
+    })
+    assert r.status_code == 201, r.text
+    return r.json()["idEvento"]
+
+
+def _consultar(c: TestClient) -> None:
+    assert c.get(f"{API}/kpis/aprobacion").status_code == 200
+    assert c.get(f"{API}/busqueda/eventos", params={"q": "evento"}).status_code == 200
+
+
+def test_escrituras_propias_no_reconstruyen(cliente: TestClient, cargas: List[str]) -> None:
+    _consultar(cliente)
+    assert sorted(cargas) == ["buscador", "kpis"]
+
+    ids = [_evento(cliente, dia) for dia in (1, 2, 3)]
+    _consultar(cliente)
+    assert cliente.put(f"{API}/{ids[0]}", json={"nombre": "Evento renombrado"}).status_code == 200
+    _consultar(cliente)
+    r = cliente.post(f"{API}/evaluaciones/batch", json={"veredictos": [{"idEvento": ids[1], "estado": "aprobado"}]})
+    assert r.status_code == 200 and r.json()["aplicadas"] == 1, r.text
+    assert cliente.delete(f"{API}/{ids[2]}").status_code == 204
+    # un choque se revierte: su marca no cuenta como propia
+    r = cliente.post(f"{API}/", json={
+        "nombre": "Choca", "categoria": "academico", "idOrganizador": 1, "idInstalacion": 1,
+        "fechaInicio": "2030-01-01T09:00:00", "fechaFin": "2030-01-01T11:00:00", "rutaAvalPDF": "avales/a.pdf",
+    })
+    assert r.status_code == 409, r.text
+    _consultar(cliente)
+
+    assert sorted(cargas) == ["buscador", "kpis"]
+    assert cliente.get(f"{API}/kpis/aprobacion").json()["aprobados"] == 1
+
+
+def test_sala_adicional_directa_reconstruye(cliente: TestClient, cargas: List[str]) -> None:
+    id_evento = _evento(cliente, 4)
+    _consultar(cliente)
+    antes = len(cargas)
+
+    # el backend no escribe eventoInstalacion: la marca la sube el trigger
+    async def agregar() -> None:
+        async with obtener_engine().begin() as cx:
+            await cx.execute(insert(EventoInstalacion), [{"idEvento": id_evento, "idInstalacion": 2}])
+    cliente.portal.call(agregar)
+    _consultar(cliente)
+
+    assert len(cargas) == antes + 2
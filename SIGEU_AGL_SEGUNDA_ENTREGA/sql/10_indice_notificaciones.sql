@@ -0,0 +1,17 @@
+-- ======================================================================
+-- 10_indice_notificaciones.sql
+-- Esquema: uao_eventos
+-- Índice de las notificaciones pendientes (despacho en segundo plano)
+-- ======================================================================
+
+USE uao_eventos;
+
+-- Solo para bases creadas antes de este índice (1_CREAR_BASE_D.sql ya lo trae).
+--
+-- El despacho lee en cada ronda las pendientes (fechaEnvio NULL) desde la más
+-- vieja, sin un "último id leído": los ids de transacciones concurrentes se
+-- confirman en cualquier orden. Con el índice (que en InnoDB ya termina en
+-- idNotificacion) la ronda solo recorre las pendientes y no las ya enviadas.
+
+ALTER TABLE notificacion
+  ADD INDEX ix_notificacion_fechaEnvio (fechaEnvio);
@@ -0,0 +1,41 @@
+-- ======================================================================
+-- 11_marca_cambios.sql
+-- Esquema: uao_eventos
+-- Marca de cambios de los índices en memoria (agenda, KPIs, búsqueda)
+-- ======================================================================
+
+USE uao_eventos;
+
+-- Cada worker del backend guarda su propia copia de la agenda y los índices y,
+-- con INDICES_VERIFICAR_S > 0, lee cada tanto marcaCambios.contador (una fila,
+-- por clave primaria) para saber si otro proceso escribió. El backend lo sube
+-- una vez en cada transacción que crea, edita o borra eventos o registra
+-- veredictos, y no se reconstruye por sus propios cambios.
+--
+-- La tabla y su fila solo faltan en bases creadas antes de ella
+-- (1_CREAR_BASE_D.sql ya las trae); los triggers van en todas las bases.
+-- El backend no escribe eventoInstalacion: los triggers cuentan las salas
+-- adicionales que se asignan o quitan directamente en la BD. Las escrituras
+-- directas en evento o evaluacion deben subir el contador también:
+--   UPDATE marcaCambios SET contador = contador + 1 WHERE id = 1;
+
+CREATE TABLE IF NOT EXISTS marcaCambios (
+  id       SMALLINT        PRIMARY KEY,
+  contador BIGINT UNSIGNED NOT NULL DEFAULT 0
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
+
+INSERT IGNORE INTO marcaCambios (id, contador) VALUES (1, 0);
+
+-- En MySQL el borrado en cascada de un evento no dispara estos triggers (ese
+-- borrado ya lo cuenta quien lo hizo).
+DROP TRIGGER IF EXISTS trg_ei_marca_ins;
+CREATE TRIGGER trg_ei_marca_ins AFTER INSERT ON eventoInstalacion
+FOR EACH ROW UPDATE marcaCambios SET contador = contador + 1 WHERE id = 1;
+
+DROP TRIGGER IF EXISTS trg_ei_marca_upd;
+CREATE TRIGGER trg_ei_marca_upd AFTER UPDATE ON eventoInstalacion
+FOR EACH ROW UPDATE marcaCambios SET contador = contador + 1 WHERE id = 1;
+
+DROP TRIGGER IF EXISTS trg_ei_marca_del;
+CREATE TRIGGER trg_ei_marca_del AFTER DELETE ON eventoInstalacion
+FOR EACH ROW UPDATE marcaCambios SET contador = contador + 1 WHERE id = 1;
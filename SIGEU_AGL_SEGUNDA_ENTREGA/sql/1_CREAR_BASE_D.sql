@@ -7,6 +7,7 @@ USE uao_eventos;
 SET FOREIGN_KEY_CHECKS = 0;
 
 -- ====== DROPS en orden de dependencias ======
+DROP TABLE IF EXISTS marcaCambios;
 DROP TABLE IF EXISTS notificacion;
 DROP TABLE IF EXISTS evaluacion;
 DROP TABLE IF EXISTS eventoOrganizacion;
@@ -84,13 +85,21 @@ CREATE TABLE evento (
   idInstalacion   BIGINT UNSIGNED         NOT NULL,   -- FK instalacion
   rutaAvalPDF     VARCHAR(255)            NOT NULL,
   fechaRegistro   TIMESTAMP NULL DEFAULT CURRENT_TIMESTAMP,
+  version         INT UNSIGNED            NOT NULL DEFAULT 1,   -- concurrencia optimista (If-Match)
   CONSTRAINT fk_evento_organizador
     FOREIGN KEY (idOrganizador) REFERENCES usuario(idUsuario)
       ON UPDATE CASCADE ON DELETE RESTRICT,
   CONSTRAINT fk_evento_instalacion
     FOREIGN KEY (idInstalacion) REFERENCES instalacion(idInstalacion)
       ON UPDATE CASCADE ON DELETE RESTRICT,
-  CONSTRAINT chk_evento_fechas CHECK (fechaFin >= fechaInicio)
+  CONSTRAINT chk_evento_fechas CHECK (fechaFin >= fechaInicio),
+  -- Índices del listado paginado por keyset (GET /api/v1/):
+  --   orden=fecha -> ORDER BY fechaInicio DESC, idEvento DESC
+  --   orden=id con filtros estado/categoria -> ORDER BY idEvento DESC
+  INDEX ix_evento_fechaInicio_idEvento (fechaInicio, idEvento),
+  INDEX ix_evento_estado_categoria_idEvento (estado, categoria, idEvento),
+  -- Reportes de aprobación y backlog por antigüedad (/api/v1/reportes, Consultas 03 y 07)
+  INDEX ix_evento_estado_fechaRegistro (estado, fechaRegistro)
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
 
 -- =========================================================
@@ -151,6 +160,8 @@ CREATE TABLE evaluacion (
   estado         ENUM('aprobado','rechazado') NOT NULL,
   actaPDF        VARCHAR(255)            NULL,
   fechaRevision  TIMESTAMP NULL DEFAULT NULL,
+  -- JOIN evento-evaluacion de las Consultas 04-06 sin leer la fila; también sirve a la FK
+  INDEX ix_evaluacion_idEvento_estado (idEvento, estado),
   CONSTRAINT fk_eval_evento FOREIGN KEY (idEvento) REFERENCES evento(idEvento)
     ON UPDATE CASCADE ON DELETE CASCADE
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
@@ -166,12 +177,23 @@ CREATE TABLE notificacion (
   justificacion    TEXT                    NULL,
   urlPDF           VARCHAR(255)            NULL,
   usuarioReceptor  BIGINT UNSIGNED         NOT NULL,
+  INDEX ix_notificacion_fechaEnvio (fechaEnvio),
   CONSTRAINT fk_not_eval FOREIGN KEY (idEvaluacion)    REFERENCES evaluacion(idEvaluacion)
     ON UPDATE CASCADE ON DELETE CASCADE,
   CONSTRAINT fk_not_usuario FOREIGN KEY (usuarioReceptor) REFERENCES usuario(idUsuario)
     ON UPDATE CASCADE ON DELETE RESTRICT
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
 
+-- =========================================================
+-- MARCA DE CAMBIOS (una fila: la comparan los índices en memoria del backend)
+-- =========================================================
+CREATE TABLE marcaCambios (
+  id       SMALLINT        PRIMARY KEY,
+  contador BIGINT UNSIGNED NOT NULL DEFAULT 0
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
+
+INSERT INTO marcaCambios (id, contador) VALUES (1, 0);
+
 -- ====== VISTAS ÚTILES (opcionales de apoyo a 2da entrega) ======
 CREATE OR REPLACE VIEW v_eventos_detalle AS
 SELECT e.idEvento, e.nombre, e.fechaInicio, e.fechaFin, e.categoria, e.estado,
@@ -0,0 +1,22 @@
+-- ======================================================================
+-- 7_evaluaciones_en_aplicacion.sql
+-- Esquema: uao_eventos
+-- Retira los triggers de evaluación de 5_objetos_crud_evento.sql: el backend
+-- aplica los veredictos por lotes (POST /api/v1/evaluaciones/batch)
+-- ======================================================================
+
+USE uao_eventos;
+
+-- Con trg_eval_after_insert cada fila de evaluacion dispara un UPDATE de evento
+-- y un INSERT ... SELECT en notificacion: un lote de N veredictos son 2N
+-- sentencias extra dentro de la misma transacción. El backend hace lo mismo
+-- con un UPDATE ... WHERE idEvento IN (...) por veredicto y un INSERT multi-fila de
+-- notificaciones.
+--
+-- Opcional: si los triggers siguen instalados el endpoint los detecta y deja
+-- que ellos actualicen evento y notificacion (no se duplican notificaciones).
+-- Después de ejecutar este script, cualquier INSERT directo en evaluacion
+-- (fuera del backend) ya no actualiza el evento ni notifica al organizador.
+
+DROP TRIGGER IF EXISTS trg_eval_after_insert;
+DROP TRIGGER IF EXISTS trg_eval_after_update;
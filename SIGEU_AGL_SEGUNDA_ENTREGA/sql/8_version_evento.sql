@@ -0,0 +1,22 @@
+-- ======================================================================
+-- 8_version_evento.sql
+-- Esquema: uao_eventos
+-- Columna de versión para la concurrencia optimista de PUT /api/v1/{id}
+-- ======================================================================
+
+USE uao_eventos;
+
+-- El backend la incrementa en cada UPDATE de evento (edición y veredictos de
+-- evaluación) y la publica como ETag. Con If-Match la edición es un solo
+--   UPDATE evento SET ..., version = version + 1
+--    WHERE idEvento = :id AND version = :v
+-- y si no afecta filas se responde 412: nadie bloquea la fila mientras el
+-- cliente edita, y dos ediciones sobre la misma versión no se pisan.
+--
+-- Con los triggers de 5_objetos_crud_evento.sql instalados, POST
+-- /evaluaciones/batch igual la incrementa en los eventos que cambian de estado.
+-- Las escrituras directas en la BD deben incrementarla también; si no, el ETag
+-- no cambia y un cliente con una copia vieja puede sobrescribir ese cambio.
+
+ALTER TABLE evento
+  ADD COLUMN version INT UNSIGNED NOT NULL DEFAULT 1 AFTER fechaRegistro;
@@ -0,0 +1,28 @@
+-- ======================================================================
+-- 9_indices_reportes.sql
+-- Esquema: uao_eventos
+-- Índices de los reportes de /api/v1/reportes (Consultas 03-07)
+-- ======================================================================
+
+USE uao_eventos;
+
+-- Solo para bases creadas antes de estos índices (1_CREAR_BASE_D.sql ya los trae).
+--
+-- ix_evento_estado_fechaRegistro: la aprobación global (Consulta 03) agrupa por
+-- estado con un rango de fechaRegistro, y el backlog (Consulta 07) lee los
+-- pendientes (estado IN ('registrado','enRevision')) por tramos de fechaRegistro;
+-- sin filtros por categoría u organizador las dos se resuelven solo con el índice.
+--
+-- ix_evaluacion_idEvento_estado: las Consultas 05 y 06 cuentan veredictos por
+-- evento con el JOIN evento-evaluacion; con (idEvento, estado) no se lee la fila
+-- de evaluacion. InnoDB lo usa también para fk_eval_evento, así que el índice
+-- que MySQL había creado para la FK queda sobrando y se puede borrar.
+
+ALTER TABLE evento
+  ADD INDEX ix_evento_estado_fechaRegistro (estado, fechaRegistro);
+
+ALTER TABLE evaluacion
+  ADD INDEX ix_evaluacion_idEvento_estado (idEvento, estado);
+
+-- Opcional, después de crear el anterior:
+-- ALTER TABLE evaluacion DROP INDEX fk_eval_evento;